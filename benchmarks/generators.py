@@ -0,0 +1,179 @@
+from typing import Callable, Dict
+
+import numpy as np
+
+# (lng, lat) of the south-west corner of the region of the synthetic points, and
+# side of the region in decimal degrees
+_ORIGIN = np.array([-46.8, -23.7])
+_SIDE = 0.5
+
+
+def uniform_points(size: int, seed: int = 0) -> np.ndarray:
+    """
+    Generates points uniformly distributed in a square region.
+
+    Parameters
+    ----------
+    size
+        Number of points.
+
+    seed
+        Seed of the random generator.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (size, 2) with the (lng, lat) coordinates of the points.
+    """
+    rng = np.random.default_rng(seed)
+    return _ORIGIN + _SIDE * rng.random((size, 2))
+
+
+def clustered_points(
+    size: int, seed: int = 0, num_clusters: int = 20
+) -> np.ndarray:
+    """
+    Generates points in Gaussian clusters of random centers and spreads, so that the
+    density varies by orders of magnitude across the region.
+
+    Parameters
+    ----------
+    size
+        Number of points.
+
+    seed
+        Seed of the random generator.
+
+    num_clusters
+        Number of clusters.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (size, 2) with the (lng, lat) coordinates of the points.
+    """
+    rng = np.random.default_rng(seed)
+    centers = _SIDE * rng.random((num_clusters, 2))
+    spreads = _SIDE * rng.uniform(0.005, 0.05, num_clusters)
+    clusters = rng.integers(num_clusters, size=size)
+    return (
+        _ORIGIN
+        + centers[clusters]
+        + spreads[clusters, None] * rng.standard_normal((size, 2))
+    )
+
+
+def ring_points(size: int, seed: int = 0, num_holes: int = 5) -> np.ndarray:
+    """
+    Generates points uniformly distributed in a disk with circular holes, whose alpha
+    shape is a shell with holes.
+
+    Parameters
+    ----------
+    size
+        Number of points.
+
+    seed
+        Seed of the random generator.
+
+    num_holes
+        Number of holes, placed on a circle around the center of the disk.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (size, 2) with the (lng, lat) coordinates of the points.
+    """
+    rng = np.random.default_rng(seed)
+    angles = 2 * np.pi * np.arange(num_holes) / num_holes
+    hole_centers = 0.5 * np.column_stack((np.cos(angles), np.sin(angles)))
+    hole_radius = 0.15
+
+    # rejection sampling, in a unit disk, of the points outside the holes
+    points = np.empty((0, 2))
+    while len(points) < size:
+        candidates = rng.uniform(-1.0, 1.0, (2 * size, 2))
+        is_kept = np.hypot(candidates[:, 0], candidates[:, 1]) < 1.0
+        for hole_center in hole_centers:
+            is_kept &= np.hypot(*(candidates - hole_center).T) > hole_radius
+        points = np.concatenate((points, candidates[is_kept]))
+    return _ORIGIN + _SIDE / 2 * (points[:size] + 1.0)
+
+
+def gps_trace_points(
+    size: int, seed: int = 0, num_traces: int = 50
+) -> np.ndarray:
+    """
+    Generates GPS-like traces: random walks with a persistent heading, a step of about
+    10 meters and a positioning noise of about 5 meters.
+
+    Parameters
+    ----------
+    size
+        Number of points.
+
+    seed
+        Seed of the random generator.
+
+    num_traces
+        Number of traces.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (size, 2) with the (lng, lat) coordinates of the points.
+    """
+    rng = np.random.default_rng(seed)
+    traces = np.array_split(np.arange(size), num_traces)
+    points = np.empty((size, 2))
+    for trace in traces:
+        headings = rng.uniform(0, 2 * np.pi) + np.cumsum(
+            rng.normal(0.0, 0.1, len(trace))
+        )
+        steps = 1e-4 * np.column_stack((np.cos(headings), np.sin(headings)))
+        points[trace] = _SIDE * rng.random(2) + np.cumsum(steps, axis=0)
+    return _ORIGIN + points + 5e-5 * rng.standard_normal((size, 2))
+
+
+def degenerate_points(size: int, seed: int = 0) -> np.ndarray:
+    """
+    Generates a degenerate point set: a regular grid, whose points are collinear along
+    rows, columns and diagonals and cocircular in every cell, with repeated points and
+    points on a line through the grid.
+
+    Parameters
+    ----------
+    size
+        Number of points.
+
+    seed
+        Seed of the random generator.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (size, 2) with the (lng, lat) coordinates of the points.
+    """
+    rng = np.random.default_rng(seed)
+    num_grid = size - size // 10
+    side = int(np.ceil(np.sqrt(num_grid)))
+    grid = np.column_stack(
+        (np.arange(num_grid) % side, np.arange(num_grid) // side)
+    ) / max(side - 1, 1)
+
+    # a tenth of the points are repeated grid points or lie on the diagonal
+    num_repeated = (size - num_grid) // 2
+    repeated = grid[rng.integers(num_grid, size=num_repeated)]
+    diagonal = np.repeat(
+        rng.random(size - num_grid - num_repeated)[:, None], 2, axis=1
+    )
+    return _ORIGIN + _SIDE * np.concatenate((grid, repeated, diagonal))
+
+
+GENERATORS: Dict[str, Callable[..., np.ndarray]] = {
+    "uniform": uniform_points,
+    "clustered": clustered_points,
+    "rings": ring_points,
+    "gps": gps_trace_points,
+    "degenerate": degenerate_points,
+}
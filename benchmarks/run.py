@@ -0,0 +1,352 @@
+"""
+Benchmark of every stage of the alpha shape pipeline, on synthetic point sets of
+growing sizes, with the scaling exponent of each stage.
+
+Usage
+-----
+    python -m benchmarks.run --sizes 1000 10000 100000 --output results.json
+    python -m benchmarks.run --baseline results.json --threshold 1.5
+
+Each stage is timed on the precomputed outputs of the previous stages, so that a
+regression shows up in the stage that causes it. With a baseline, the stages that got
+slower than the threshold ratio are reported and the exit status is 1.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import scipy
+
+from benchmarks.generators import GENERATORS
+from concave_uhull.alpha_shape import (
+    _get_alpha_triangulation,
+    _get_boundary_edges,
+    _get_shortest_path_rings,
+    alpha_shape_arrays,
+)
+from concave_uhull.encoders import to_geojson, to_wkb
+from concave_uhull.geometry import (
+    area_of_polygon,
+    areas_of_rings,
+    delaunay_simplices,
+    haversine_distance,
+)
+from concave_uhull.graph import Graph, trace_boundary_rings
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def _prepare(points: np.ndarray) -> Dict:
+    """
+    Computes, once and untimed, the inputs of every stage: the alpha triangles, their
+    boundary edges with their lengths, the rings and the alpha shape arrays.
+    """
+    alpha_triangles = _get_alpha_triangulation(points)
+    edges = _get_boundary_edges(alpha_triangles, len(points))
+    rings = trace_boundary_rings(half_edges=edges, coordinates=points)
+    offsets = np.cumsum([0] + [len(ring) for ring in rings])
+    return {
+        "points": points,
+        "alpha_triangles": alpha_triangles,
+        "edges": edges,
+        "edge_weights": haversine_distance(
+            points[edges[:, 0]], points[edges[:, 1]]
+        ),
+        "ring_coordinates": points[np.concatenate(rings)],
+        "ring_offsets": offsets,
+        "rings": [points[ring] for ring in rings],
+        "alpha_shape": alpha_shape_arrays(points),
+    }
+
+
+# stages of the pipeline, each one a function of the inputs given by `_prepare`
+STAGES: Dict[str, Callable[[Dict], object]] = {
+    "delaunay_triangulation": lambda inputs: delaunay_simplices(
+        inputs["points"]
+    ),
+    "alpha_triangulation": lambda inputs: _get_alpha_triangulation(
+        inputs["points"]
+    ),
+    "alpha_shape_edges": lambda inputs: _get_boundary_edges(
+        inputs["alpha_triangles"], len(inputs["points"])
+    ),
+    "graph": lambda inputs: Graph(
+        edge_list=inputs["edges"], edge_weights=inputs["edge_weights"]
+    ),
+    "shortest_path": lambda inputs: _get_shortest_path_rings(
+        points=inputs["points"], alpha_shape_edges=inputs["edges"]
+    ),
+    "boundary_tracing": lambda inputs: trace_boundary_rings(
+        half_edges=inputs["edges"], coordinates=inputs["points"]
+    ),
+    "area_of_polygon": lambda inputs: [
+        area_of_polygon(ring, geodesic=True) for ring in inputs["rings"]
+    ],
+    "areas_of_rings": lambda inputs: areas_of_rings(
+        inputs["ring_coordinates"], inputs["ring_offsets"], geodesic=True
+    ),
+    "alpha_shape_arrays": lambda inputs: alpha_shape_arrays(inputs["points"]),
+    "json_dumps": lambda inputs: json.dumps(
+        [ring.tolist() for ring in inputs["rings"]]
+    ),
+    "geojson_encoding": lambda inputs: to_geojson(inputs["alpha_shape"]),
+    "wkb_encoding": lambda inputs: to_wkb(inputs["alpha_shape"]),
+}
+
+
+def _time_stage(stage: Callable, inputs: Dict, repeat: int) -> List[float]:
+    """Gets the wall-clock time, in seconds, of each run of a stage."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stage(inputs)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _peak_memory(stage: Callable, inputs: Dict) -> int:
+    """
+    Gets the peak number of bytes allocated by a run of a stage, as traced by
+    tracemalloc, which numpy reports its array buffers to.
+    """
+    tracemalloc.start()
+    try:
+        stage(inputs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    generators: Optional[Sequence[str]] = None,
+    stages: Optional[Sequence[str]] = None,
+    repeat: int = 3,
+    memory: bool = True,
+    seed: int = 0,
+) -> Dict:
+    """
+    Runs the benchmark of the given stages on the point sets of every generator and
+    size.
+
+    Parameters
+    ----------
+    sizes
+        Numbers of points of the point sets.
+
+    generators
+        Names of the point set generators, see `benchmarks.generators.GENERATORS`.
+        By default, all of them.
+
+    stages
+        Names of the stages, see `STAGES`. By default, all of them.
+
+    repeat
+        Number of timed runs of each stage.
+
+    memory
+        If True, each stage is run once more under tracemalloc, to get its peak memory.
+
+    seed
+        Seed of the point set generators.
+
+    Returns
+    -------
+    Dict
+        The environment of the benchmark under "meta", one record per generator, size
+        and stage under "results", with the best and median times in seconds, the
+        peak memory in bytes and the error message of the stages that failed, and the
+        scaling exponent of the best time with the size under "scaling".
+    """
+    generators = list(generators or GENERATORS)
+    stages = list(stages or STAGES)
+    results = []
+    for generator in generators:
+        for size in sizes:
+            points = GENERATORS[generator](size, seed=seed)
+            inputs = _prepare(points)
+            for stage in stages:
+                record: Dict = {
+                    "generator": generator,
+                    "size": size,
+                    "stage": stage,
+                }
+                try:
+                    times = _time_stage(STAGES[stage], inputs, repeat)
+                    record["best"] = min(times)
+                    record["median"] = float(np.median(times))
+                    if memory:
+                        record["peak_bytes"] = _peak_memory(
+                            STAGES[stage], inputs
+                        )
+                except Exception as error:
+                    record["error"] = f"{type(error).__name__}: {error}"
+                results.append(record)
+                print(_format_record(record), file=sys.stderr)
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+            "machine": platform.platform(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+        "scaling": get_scaling(results),
+    }
+
+
+def get_scaling(results: List[Dict]) -> List[Dict]:
+    """
+    Gets the scaling exponent of each stage on each generator: the slope of the least
+    squares line of the log of the best time against the log of the size, which is
+    close to 1 for linear stages and grows for superlinear ones.
+
+    Parameters
+    ----------
+    results
+        Records of the benchmark, see `run_benchmarks`.
+
+    Returns
+    -------
+    List[Dict]
+        One record per generator and stage timed on at least two sizes.
+    """
+    timings: Dict = {}
+    for record in results:
+        if "best" in record:
+            key = (record["generator"], record["stage"])
+            timings.setdefault(key, []).append(
+                (record["size"], record["best"])
+            )
+    scaling = []
+    for (generator, stage), pairs in timings.items():
+        if len(pairs) < 2:
+            continue
+        sizes, times = np.log(np.array(pairs)).T
+        scaling.append(
+            {
+                "generator": generator,
+                "stage": stage,
+                "exponent": float(np.polyfit(sizes, times, 1)[0]),
+            }
+        )
+    return scaling
+
+
+def compare_to_baseline(
+    results: List[Dict], baseline: List[Dict], threshold: float = 1.5
+) -> List[Dict]:
+    """
+    Compares the best times with those of a baseline benchmark.
+
+    Parameters
+    ----------
+    results
+        Records of the benchmark, see `run_benchmarks`.
+
+    baseline
+        Records of the baseline benchmark.
+
+    threshold
+        Ratio of the best time to the baseline best time above which a stage is
+        reported as a regression.
+
+    Returns
+    -------
+    List[Dict]
+        The records of the regressions, with their baseline best time and ratio.
+    """
+    baseline_times = {
+        (record["generator"], record["size"], record["stage"]): record["best"]
+        for record in baseline
+        if "best" in record
+    }
+    regressions = []
+    for record in results:
+        key = (record["generator"], record["size"], record["stage"])
+        if "best" not in record or key not in baseline_times:
+            continue
+        ratio = record["best"] / max(baseline_times[key], 1e-9)
+        if ratio > threshold:
+            regressions.append(
+                dict(record, baseline=baseline_times[key], ratio=ratio)
+            )
+    return regressions
+
+
+def _format_record(record: Dict) -> str:
+    """Formats a record of the benchmark as a line of text."""
+    prefix = (
+        f"{record['generator']:>10} {record['size']:>9} {record['stage']:>22}"
+    )
+    if "error" in record:
+        return f"{prefix}  {record['error']}"
+    line = f"{prefix} {1e3 * record['best']:>12.3f} ms"
+    if "peak_bytes" in record:
+        line += f" {record['peak_bytes'] / 2**20:>10.1f} MiB"
+    return line
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES)
+    )
+    parser.add_argument("--generators", nargs="+", choices=list(GENERATORS))
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip the tracemalloc run of each stage",
+    )
+    parser.add_argument("--output", help="path of the JSON report")
+    parser.add_argument("--baseline", help="path of a baseline JSON report")
+    parser.add_argument("--threshold", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        sizes=args.sizes,
+        generators=args.generators,
+        stages=args.stages,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        seed=args.seed,
+    )
+    for record in report["scaling"]:
+        print(
+            f"{record['generator']:>10} {record['stage']:>22} "
+            f"exponent {record['exponent']:.2f}"
+        )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare_to_baseline(
+            report["results"], baseline, threshold=args.threshold
+        )
+        for record in regressions:
+            print(
+                f"regression: {record['generator']} {record['size']} "
+                f"{record['stage']} {record['ratio']:.2f}x"
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
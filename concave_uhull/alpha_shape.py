@@ -1,20 +1,113 @@
-from typing import Callable, Dict, List, Set, Tuple
+from functools import cached_property
+from typing import (
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
+from scipy.spatial import Delaunay
 
+from concave_uhull.fence import (
+    QuantileEstimator,
+    get_alpha_fence,
+    get_quantile_estimator,
+)
 from concave_uhull.geometry import (
-    area_of_polygon,
-    delaunay_triangulation,
+    areas_of_rings,
+    euclidean_distance,
+    get_vectorized_distance,
     haversine_distance,
+    local_projection,
+    orient_simplices,
+    ring_parents,
+)
+from concave_uhull.graph import (
+    Graph,
+    shortest_path_algorithm,
+    trace_boundary_rings,
 )
-from concave_uhull.graph import Graph, shortest_path_algorithm
+from concave_uhull.preprocessing import thin_points
+from concave_uhull.simplify import simplify_rings
+from concave_uhull.stats import _NULL_STATS, PipelineStats
+
+
+def _get_side_lengths(
+    points: np.ndarray,
+    simplices: np.ndarray,
+    distance: Callable = haversine_distance,
+) -> np.ndarray:
+    """
+    Gets the side lengths of all triangles at once, with the array version of the
+    distance function. The column j holds the length of the side from the vertex j to
+    the vertex (j + 1) mod 3 of each triangle.
+    """
+    vectorized_distance = get_vectorized_distance(distance)
+    vertices = [points[simplices[:, j]] for j in range(3)]
+    return np.column_stack(
+        [
+            vectorized_distance(vertices[j], vertices[(j + 1) % 3])
+            for j in range(3)
+        ]
+    ).reshape(-1, 3)
+
+
+def _get_triangulation_edges(
+    simplices: np.ndarray, num_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the edges of a triangulation, each interior edge only once, and the index of
+    the edge of each side of each triangle. The column j of the triangle edges holds
+    the edge of the side from the vertex j to the vertex (j + 1) mod 3.
+    """
+    sides = simplices[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).astype(np.int64)
+    side_keys = sides.min(axis=1) * num_points + sides.max(axis=1)
+    _, first_occurrence, triangle_edges = np.unique(
+        side_keys, return_index=True, return_inverse=True
+    )
+    return sides[first_occurrence], triangle_edges.reshape(-1, 3)
+
+
+def _is_alpha_triangle(
+    lengths: np.ndarray, alpha_fence: Tuple[float, float]
+) -> np.ndarray:
+    """
+    Gets a boolean mask of the alpha triangles, whose side lengths are all inside the
+    alpha fence.
+    """
+    min_acceptable_length, max_acceptable_length = alpha_fence
+    return np.all(
+        (min_acceptable_length < lengths) & (lengths < max_acceptable_length),
+        axis=1,
+    )
+
+
+def _get_boundary_edges(triangles: np.ndarray, num_points: int) -> np.ndarray:
+    """
+    Gets the boundary edges of a set of triangles, given by vertex indices. Edges that
+    are not boundaries are shared by two triangles, so the boundary edges are those
+    that appear only once, regardless of their direction. Boundary edges keep the
+    orientation of their triangle.
+    """
+    edges = triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).astype(np.int64)
+    edge_keys = edges.min(axis=1) * num_points + edges.max(axis=1)
+    _, first_occurrence, occurrences = np.unique(
+        edge_keys, return_index=True, return_counts=True
+    )
+    return edges[np.sort(first_occurrence[occurrences == 1])]
 
 
 def _get_alpha_triangulation(
-    coordinates_points: List[Tuple],
+    coordinates_points: Union[List[Tuple], np.ndarray],
     alpha: float = 1.5,
     distance: Callable = haversine_distance,
-) -> List[Tuple]:
+    fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+) -> np.ndarray:
     """
     Provides an alpha triangulation of the coordinates points given. The triangulation has
     the following property: the lengths of the sides of each triangle are within a special
@@ -36,12 +129,23 @@ def _get_alpha_triangulation(
         distance function, as we assume that the coordinates of the vertices are of
         the form (lng, lat).
 
+    fence
+        Estimator of the quartiles of the edge lengths, see
+        `concave_uhull.fence.get_quantile_estimator`.
+
     Returns
     -------
-    List[Tuple]
-        A list of alpha triangle vertices coordinates. A triangle is considered to be
-        alpha if the length of all its sides is within the Tukey fence of 'width'
-        determined by alpha.
+    np.ndarray
+        Integer array of shape (m, 3) with the indices, in the given coordinates, of the
+        vertices of each alpha triangle. A triangle is considered to be alpha if the length
+        of all its sides is within the Tukey fence of 'width' determined by alpha.
+
+    See Also
+    --------
+    concave_uhull.geometry.get_vectorized_distance : Get the array version of a distance
+        function.
+    concave_uhull.fence.get_quantile_estimator : Get a new estimator of the quantiles of
+        the edge lengths.
 
     References
     ----------
@@ -54,69 +158,30 @@ def _get_alpha_triangulation(
     -----
     The function performs the following steps to obtain an alpha triangulation:
         1. Get Delauney triangulation;
-        2. Get triangle information, such as vertex coordinates and side lengths;
-        3. Get the Tukey's fence for the given alpha (a.k.a alpha fence);
+        2. Get the length of each edge of the triangulation, measuring the edges
+        shared by two triangles only once, with the array version of the distance
+        function;
+        3. Get the Tukey's fence for the given alpha (a.k.a alpha fence), from the
+        quartiles of the edge lengths given by the fence estimator;
         4. Return only alpha triangles.
     """
-    # Step 1: get Delauney triangulation;
-    triangulation = delaunay_triangulation(coordinates_points)
-
-    # Step 2: get triangle information, such as vertex coordinates and side
-    # lengths;
-    triangulation_info: Dict = {
-        "lengths_list": [],
-        "coordinates_and_lengths": [],
-    }
-    for coordinates in triangulation:
-        # coordinates of each vertex of the triangle
-        p1, p2, p3 = coordinates
-
-        # lengths of triangle sides
-        lengths = distance(p1, p2), distance(p2, p3), distance(p3, p1)
-
-        # save triangle information
-        triangulation_info["lengths_list"].extend(lengths)
-        triangulation_info["coordinates_and_lengths"].append(
-            (coordinates, lengths)
-        )
-
-    # Step 3: get the Tukey's fence for the given alpha (a.k.a alpha fence);
-    q25, q75 = np.quantile(triangulation_info["lengths_list"], [0.25, 0.75])
-    intr_qr = q75 - q25
-    min_acceptable_length = q25 - (alpha * intr_qr)
-    max_acceptable_length = q75 + (alpha * intr_qr)
-
-    # Step 4: return only alpha triangles, that is, triangles whose side lengths are
-    # inside the alpha fence.
-    def _is_alpha_triangule(triangle_sides_length):
-        """
-        The triangle is considered alpha, if the length of all its
-        sides are within the alpha fence.
-        """
-        return all(
-            min_acceptable_length < length < max_acceptable_length
-            for length in triangle_sides_length
-        )
-
-    return [
-        coordinates
-        for coordinates, lengths in triangulation_info[
-            "coordinates_and_lengths"
-        ]
-        if _is_alpha_triangule(lengths)
-    ]
+    # Steps 1 to 4 are the lazily computed stages of the alpha triangulation.
+    triangulation = AlphaTriangulation(
+        coordinates_points, distance=distance, fence=fence
+    )
+    return triangulation.alpha_triangles(alpha)
 
 
 def _get_alpha_shape_edges(
-    coordinates_points: List[Tuple],
+    coordinates_points: Union[List[Tuple], np.ndarray],
     alpha: float = 1.5,
     distance: Callable = haversine_distance,
-) -> List[Tuple]:
+    fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+) -> np.ndarray:
     """
-    Gets a list of the boundary edges of each alpha triangle, in an alpha triangulation of
-    the given point coordinates. Edges are represented by tuples of tuples, which represent
-    the coordinates of each extreme vertex of the edge, from the source vertice to the
-    destination (target) vertice.
+    Gets the boundary edges of each alpha triangle, in an alpha triangulation of the given
+    point coordinates. Edges are represented by pairs of vertex indices, in the given
+    coordinates, from the source vertice to the destination (target) vertice.
 
     Parameters
     ----------
@@ -132,13 +197,16 @@ def _get_alpha_shape_edges(
         distance function, as we assume that the coordinates of the vertices are of
         the form (lng, lat).
 
+    fence
+        Estimator of the quartiles of the edge lengths, see
+        `concave_uhull.fence.get_quantile_estimator`.
+
     Returns
     -------
-    List[Tuple]
-        A list of the boundary edges of each alpha triangle, in an alpha triangulation of
-        the given point coordinates. Edges are represented by tuples of tuples, which represent
-        the coordinates of each extreme vertex of the edge, from the source vertice to the
-        destination (target) vertice
+    np.ndarray
+        Integer array of shape (k, 2) with the boundary edges of each alpha triangle, in an
+        alpha triangulation of the given point coordinates. Each row holds the indices of
+        the source vertice and the destination (target) vertice of an edge.
 
     See Also
     --------
@@ -153,61 +221,551 @@ def _get_alpha_shape_edges(
     """
     # Step 1: get alpha triangulation;
     alpha_triangulation = _get_alpha_triangulation(
-        coordinates_points=coordinates_points, alpha=alpha, distance=distance
+        coordinates_points=coordinates_points,
+        alpha=alpha,
+        distance=distance,
+        fence=fence,
     )
 
     # Step 2: returns only the boundary edges of each alpha triangle from the
     # obtained alpha triangulation for the given set of point coordinates.
-    def _save_boundary_edges(edges_saved, edge_source, edge_target):
+    return _get_boundary_edges(alpha_triangulation, len(coordinates_points))
+
+
+def _get_shortest_path_rings(
+    points: np.ndarray,
+    alpha_shape_edges: np.ndarray,
+    distance: Callable = haversine_distance,
+    graph_class: Type = Graph,
+    stats: Optional[PipelineStats] = None,
+) -> List[List]:
+    """
+    Gets the rings formed by the boundary edges of an alpha triangulation, closing each
+    ring with the shortest path between the extreme vertices of one of its edges.
+
+    Parameters
+    ----------
+    points
+        Array of shape (n, 2) with the coordinates of the points.
+
+    alpha_shape_edges
+        Integer array of shape (k, 2) with the boundary edges of the alpha triangulation,
+        as pairs of vertex indices.
+
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices.
+
+    graph_class
+        Class of the graph induced by the boundary edges, either Graph or CompactGraph.
+
+    stats
+        Optional statistics where the time of the graph construction and of the
+        shortest path searches, and the heap pops of each search, are recorded.
+
+    Returns
+    -------
+    List[List]
+        A list of rings, each one a list of vertex indices where the first vertex is
+        repeated at the end of the list. Rings follow the orientation of the boundary
+        edges.
+
+    Notes
+    -----
+    The function performs the following steps to obtain the rings:
+
+        1. Defines an undirected graph, induced by the boundary alpha vertices and
+        non-negative edge weights computed with the distance function.
+
+        2. Create ring list with following substeps:
+            2.1 A random edge is selected, its extreme points memorized and the edge
+            removed from the graph.
+
+            2.2 The shortest path from one memorized extreme point to the other
+            is obtained. With this path, we form a ring by adding the first point to
+            the end of the path.
+
+            2.3 After that all waypoints are removed from the set of points to be
+            explored. And then add the obtained ring, reversed if it goes against the
+            orientation of the boundary edges, to the ring list.
+    """
+    stats = stats or _NULL_STATS
+
+    # Step 1: Defines an undirected graph, induced by the boundary alpha vertices
+    # and non-negative edge weights computed with the distance function.
+    with stats.stage("graph"):
+        edge_weights = get_vectorized_distance(distance)(
+            points[alpha_shape_edges[:, 0]], points[alpha_shape_edges[:, 1]]
+        )
+        graph = graph_class(
+            edge_list=alpha_shape_edges, edge_weights=edge_weights
+        )
+    nodes_to_explore: Set = graph.nodes.copy()
+    oriented_edges: Set = set(
+        (
+            alpha_shape_edges[:, 0] * len(points) + alpha_shape_edges[:, 1]
+        ).tolist()
+    )
+
+    # Step 2: Create ring list with following substeps:
+    rings: List = []
+    while nodes_to_explore:
+
+        # Step 2.1: A random edge is selected, its extreme points memorized and
+        # the edge removed from the graph.
+        edge_source = nodes_to_explore.pop()
+        edge_target = next(iter(graph[edge_source]), None)
+        if edge_target is None:
+            continue
+        graph.remove_edge(
+            edge_source=edge_source,
+            edge_target=edge_target,
+        )
+
+        # Step 2.2: The shortest path from one memorized extreme point to the
+        # other is obtained. With this path, we form a ring by adding the first
+        # point to the end of the path.
+        with stats.stage("shortest_paths"):
+            ring_vertices: List = shortest_path_algorithm(
+                graph=graph,
+                edge_source=edge_source,
+                edge_target=edge_target,
+                stats=stats,
+            )
+        ring_vertices.append(edge_source)
+
+        # Step 2.3:  After that all waypoints are removed from the set of points
+        # to be explored. And then add the obtained ring, reversed if it goes
+        # against the orientation of the boundary edges, to the ring list. The
+        # ring ends with the edge from the target to the source.
+        for vertice in ring_vertices:
+            if vertice in nodes_to_explore:
+                nodes_to_explore.remove(vertice)
+        if edge_target * len(points) + edge_source not in oriented_edges:
+            ring_vertices.reverse()
+        rings.append(ring_vertices)
+    return rings
+
+
+class AlphaShapeArrays(NamedTuple):
+    """
+    Alpha shape polygons in array form. The coordinates of the vertices of all rings
+    are concatenated in a single buffer, and the vertices of the ring i are those
+    between the offsets i and i + 1 of the buffer. Rings are in descending order by
+    area, and each ring repeats its first vertex at the end.
+
+    Attributes
+    ----------
+    coordinates
+        Array of shape (m, 2) with the concatenated coordinates of the ring vertices.
+    vertex_ids
+        Integer array of shape (m,) with the index, in the input points, of each vertex.
+    offsets
+        Integer array of shape (r + 1,) with the position in the buffer of the first
+        vertex of each ring, followed by the length of the buffer.
+    areas
+        Array of shape (r,) with the area of each ring.
+    is_hole
+        Boolean array of shape (r,), True for the rings that are holes in a shell.
+        Shells are in counterclockwise order and holes are in clockwise order.
+    """
+
+    coordinates: np.ndarray
+    vertex_ids: np.ndarray
+    offsets: np.ndarray
+    areas: np.ndarray
+    is_hole: np.ndarray
+
+
+def _get_sorted_alpha_shape_arrays(
+    points: np.ndarray,
+    vertex_ids: np.ndarray,
+    offsets: np.ndarray,
+    geodesic: bool = False,
+) -> AlphaShapeArrays:
+    """
+    Gets the alpha shape arrays of the given rings, whose vertex indices are
+    concatenated and delimited by offsets, sorting the rings in descending order by
+    area. Rings with negative signed area, in clockwise order, are holes.
+    """
+    signed_areas = areas_of_rings(
+        coordinates=points[vertex_ids],
+        offsets=offsets,
+        geodesic=geodesic,
+        signed=True,
+    )
+    order = np.argsort(-np.abs(signed_areas), kind="stable")
+    lengths = np.diff(offsets)[order]
+    sorted_offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+    positions = np.repeat(offsets[:-1][order] - sorted_offsets[:-1], lengths)
+    vertex_ids = vertex_ids[positions + np.arange(len(vertex_ids))]
+    return AlphaShapeArrays(
+        coordinates=points[vertex_ids],
+        vertex_ids=vertex_ids,
+        offsets=sorted_offsets,
+        areas=np.abs(signed_areas[order]),
+        is_hole=signed_areas[order] < 0,
+    )
+
+
+def _get_edges_alpha_shape_arrays(
+    points: np.ndarray,
+    alpha_shape_edges: np.ndarray,
+    distance: Callable = haversine_distance,
+    method: str = "boundary_tracing",
+    graph_class: Type = Graph,
+    stats: Optional[PipelineStats] = None,
+) -> AlphaShapeArrays:
+    """
+    Gets the alpha shape arrays of the rings formed by the boundary edges of an alpha
+    triangulation, extracted with the given method, in descending order by area.
+    """
+    stats = stats or _NULL_STATS
+    if method == "shortest_path":
+        rings = _get_shortest_path_rings(
+            points=points,
+            alpha_shape_edges=alpha_shape_edges,
+            distance=distance,
+            graph_class=graph_class,
+            stats=stats,
+        )
+    else:
+        with stats.stage("boundary_tracing"):
+            rings = trace_boundary_rings(
+                half_edges=alpha_shape_edges, coordinates=points
+            )
+    stats.count("rings", len(rings))
+    with stats.stage("areas"):
+        return _get_sorted_alpha_shape_arrays(
+            points=points,
+            vertex_ids=np.array(
+                [vertice for ring in rings for vertice in ring], dtype=np.int64
+            ),
+            offsets=np.cumsum(
+                [0] + [len(ring) for ring in rings], dtype=np.int64
+            ),
+            geodesic=distance is haversine_distance,
+        )
+
+
+class AlphaTriangulation:
+    """
+    Delaunay triangulation of a set of points, with the intermediate stages of the alpha
+    shape computed lazily and cached: the simplices, their neighbors, the edges and
+    their lengths, and the quartiles of the lengths. Queries for several alphas pay
+    for the triangulation only once.
+
+    Parameters
+    ----------
+    points
+        Array of shape (n, 2) with the point coordinates.
+
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices. By default, we use the Haversine
+        distance function, as we assume that the coordinates of the vertices are of
+        the form (lng, lat).
+
+    fence
+        Estimator of the quartiles of the edge lengths, see
+        `concave_uhull.fence.get_quantile_estimator`.
+
+    Attributes
+    ----------
+    points
+        Array of shape (n, 2) with the point coordinates.
+
+    See Also
+    --------
+    alpha_shape_arrays : Provides the polygons representing the concave hull of the
+        given array of points, in array form.
+    """
+
+    def __init__(
+        self,
+        points: Union[List[Tuple], np.ndarray],
+        distance: Callable = haversine_distance,
+        fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+    ):
+        self.points = np.asarray(points, dtype=float)
+        self.distance = distance
+        self.fence = fence
+
+    def with_distance(self, distance: Callable) -> "AlphaTriangulation":
         """
-        Saves only boundary edges.
-
-        Notes
-        -----
-        Edges that are not boundaries will be shared by two triangles, as both
-        have the same orientation it is guaranteed that we will pass through
-        these edges in both directions. To identify a non-boundary edge, it is
-        sufficient to check whether the edge or its reverse has been saved in
-        the set and, if so, remove it. Following these steps, only the border
-        edges will remain in the set.
+        Provides the alpha triangulation of the same points with another distance,
+        sharing the triangulation stages that do not depend on the distance.
+
+        Parameters
+        ----------
+        distance
+            Function that receives two tuples of coordinates of vertices and obtains a
+            measure of distance between the vertices.
+
+        Returns
+        -------
+        AlphaTriangulation
+            The alpha triangulation with the given distance.
         """
-        edge = (edge_source, edge_target)
-        edge_reversed = (edge_target, edge_source)
-        if edge in edges_saved or edge_reversed in edges_saved:
-            assert (
-                edge_reversed in edges_saved
-            ), "Can't go twice over same directed edge right?"
-            edges_saved.remove(edge_reversed)
-            return
-        edges_saved.add(edge)
-
-    alpha_shape_edges_set: Set[Tuple] = set()
-    for p1, p2, p3 in alpha_triangulation:
-        _save_boundary_edges(alpha_shape_edges_set, p1, p2)
-        _save_boundary_edges(alpha_shape_edges_set, p2, p3)
-        _save_boundary_edges(alpha_shape_edges_set, p3, p1)
-    return list(alpha_shape_edges_set)
+        triangulation = AlphaTriangulation(
+            self.points, distance=distance, fence=self.fence
+        )
+        triangulation._set_stages(
+            **{
+                stage: self.__dict__[stage]
+                for stage in ("delaunay", "simplices", "neighbors", "_edges")
+                if stage in self.__dict__
+            }
+        )
+        return triangulation
 
+    def _set_stages(self, **stages) -> None:
+        """
+        Sets already computed stages of the triangulation, such as the simplices, by
+        the name of their cached properties.
+        """
+        self.__dict__.update(stages)
 
-def get_alpha_shape_polygons(
-    coordinates_points: List[Tuple],
-    alpha: float = 1.5,
+    @cached_property
+    def delaunay(self) -> Delaunay:
+        """The scipy Delaunay triangulation of the points."""
+        return Delaunay(self.points)
+
+    @cached_property
+    def simplices(self) -> np.ndarray:
+        """
+        Integer array of shape (t, 3) with the vertex indices of each triangle, in
+        counterclockwise order.
+        """
+        return orient_simplices(self.points, self.delaunay.simplices.copy())
+
+    @cached_property
+    def neighbors(self) -> np.ndarray:
+        """
+        Integer array of shape (t, 3) with the neighbor triangle opposite to each
+        vertex of each triangle, or -1 on the convex hull.
+        """
+        neighbors = self.delaunay.neighbors.copy()
+        is_flipped = np.any(self.simplices != self.delaunay.simplices, axis=1)
+        neighbors[is_flipped] = neighbors[is_flipped][:, [0, 2, 1]]
+        return neighbors
+
+    @cached_property
+    def _edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Edges of the triangulation and the edge of each side of each triangle."""
+        return _get_triangulation_edges(self.simplices, len(self.points))
+
+    @property
+    def edges(self) -> np.ndarray:
+        """
+        Integer array of shape (e, 2) with the vertex indices of each edge, each
+        interior edge only once.
+        """
+        return self._edges[0]
+
+    @property
+    def triangle_edges(self) -> np.ndarray:
+        """
+        Integer array of shape (t, 3) with the index of the edge of each side of each
+        triangle. The column j holds the edge from the vertex j to the vertex
+        (j + 1) mod 3.
+        """
+        return self._edges[1]
+
+    @cached_property
+    def edge_lengths(self) -> np.ndarray:
+        """Array of shape (e,) with the length of each edge."""
+        return get_vectorized_distance(self.distance)(
+            self.points[self.edges[:, 0]], self.points[self.edges[:, 1]]
+        )
+
+    @cached_property
+    def quartiles(self) -> np.ndarray:
+        """Array with the first and third quartiles of the edge lengths."""
+        quantile_estimator = get_quantile_estimator(self.fence)
+        quantile_estimator.update(self.edge_lengths)
+        return quantile_estimator.quantiles([0.25, 0.75])
+
+    def alpha_fence(self, alpha: float = 1.5) -> Tuple[float, float]:
+        """
+        Provides the Tukey's fence for the given alpha (a.k.a alpha fence).
+
+        Parameters
+        ----------
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        Returns
+        -------
+        Tuple[float, float]
+            Minimum and maximum acceptable edge lengths, exclusive.
+        """
+        q25, q75 = self.quartiles
+        return get_alpha_fence(q25, q75, alpha)
+
+    def is_alpha_triangle(self, alpha: float = 1.5) -> np.ndarray:
+        """
+        Provides the mask of the alpha triangles, whose edge lengths are all inside the
+        alpha fence.
+
+        Parameters
+        ----------
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of shape (t,), True for the alpha triangles, in the order of
+            the simplices.
+        """
+        min_acceptable_length, max_acceptable_length = self.alpha_fence(alpha)
+        is_alpha_edge = (min_acceptable_length < self.edge_lengths) & (
+            self.edge_lengths < max_acceptable_length
+        )
+        return np.all(is_alpha_edge[self.triangle_edges], axis=1)
+
+    def alpha_triangles(self, alpha: float = 1.5) -> np.ndarray:
+        """
+        Provides the alpha triangles, whose edge lengths are all inside the alpha
+        fence.
+
+        Parameters
+        ----------
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array of shape (m, 3) with the vertex indices of each alpha
+            triangle, in counterclockwise order.
+        """
+        return self.simplices[self.is_alpha_triangle(alpha)]
+
+    def boundary_edges(self, alpha: float = 1.5) -> np.ndarray:
+        """
+        Provides the boundary edges of the alpha triangles.
+
+        Parameters
+        ----------
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array of shape (k, 2) with the source and target vertex indices of
+            each boundary edge, in the orientation of its triangle.
+        """
+        return _get_boundary_edges(
+            self.alpha_triangles(alpha), len(self.points)
+        )
+
+    def arrays(
+        self,
+        alpha: float = 1.5,
+        method: str = "boundary_tracing",
+        graph_class: Type = Graph,
+    ) -> AlphaShapeArrays:
+        """
+        Provides the alpha shape polygons for the given alpha, in array form.
+
+        Parameters
+        ----------
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        method
+            Method used to extract the polygons from the boundary edges, see
+            `alpha_shape_arrays`.
+
+        graph_class
+            Class of the graph used by the "shortest_path" method.
+
+        Returns
+        -------
+        AlphaShapeArrays
+            Coordinates of the ring vertices, their indices in the points, ring
+            offsets, ring areas and hole flags.
+        """
+        return _get_edges_alpha_shape_arrays(
+            points=self.points,
+            alpha_shape_edges=self.boundary_edges(alpha),
+            distance=self.distance,
+            method=method,
+            graph_class=graph_class,
+        )
+
+    def polygons(
+        self,
+        alpha: float = 1.5,
+        method: str = "boundary_tracing",
+        graph_class: Type = Graph,
+    ) -> List[List[Tuple]]:
+        """
+        Provides the list of alpha shape polygons for the given alpha.
+
+        Parameters
+        ----------
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        method
+            Method used to extract the polygons from the boundary edges, see
+            `alpha_shape_arrays`.
+
+        graph_class
+            Class of the graph used by the "shortest_path" method.
+
+        Returns
+        -------
+        List[List[Tuple]]
+            Returns list of alpha shape polygons in descending order by polygon area.
+        """
+        alpha_shape = self.arrays(
+            alpha, method=method, graph_class=graph_class
+        )
+        coordinates = list(map(tuple, alpha_shape.coordinates.tolist()))
+        offsets = alpha_shape.offsets.tolist()
+        return [
+            coordinates[start:end]
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+
+def alpha_shape_arrays(
+    points: np.ndarray,
+    alpha: Union[float, str] = 1.5,
     distance: Callable = haversine_distance,
-) -> List[List[Tuple]]:
+    method: str = "boundary_tracing",
+    graph_class: Type = Graph,
+    fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+    criterion: str = "single_shell",
+    target: Optional[float] = None,
+    deduplicate: bool = False,
+    resolution: Optional[float] = None,
+    drop_interior: bool = False,
+    projection: Optional[str] = None,
+    simplify: Optional[float] = None,
+    stats: Optional[PipelineStats] = None,
+) -> AlphaShapeArrays:
     """
-    Provides a list of polygons, sorted in descending order by their areas, representing the
-    concave hull of the given set of coordinates. The implemented algorithm uses a strategy
-    based on the alpha shape algorithm, which is obtained from a special triangulation of the
-    set of coordinates. This triangulation is strongly influenced by the value of the alpha
-    parameter and the given distance function.
+    Provides the polygons representing the concave hull of the given array of points, in
+    array form, sorted in descending order by their areas. The implemented algorithm uses
+    a strategy based on the alpha shape algorithm, which is obtained from a special
+    triangulation of the set of coordinates. This triangulation is strongly influenced by
+    the value of the alpha parameter and the given distance function.
 
     Parameters
     ----------
-    coordinates_points
-        List of point coordinates. Coordinates are represented by tuples of two numerical values.
+    points
+        Array of shape (n, 2) with the point coordinates. A C-contiguous float64 array is
+        used without copying.
 
     alpha
-        Float value responsible for determining the 'width' of Tukey's fence.
+        Float value responsible for determining the 'width' of Tukey's fence, or
+        "auto" to select the smallest alpha that meets the given criterion.
 
     distance
         Function that receives two tuples of coordinates of vertices and obtains a
@@ -215,39 +773,105 @@ def get_alpha_shape_polygons(
         distance function, as we assume that the coordinates of the vertices are of
         the form (lng, lat).
 
+    method
+        Method used to extract the polygons from the boundary edges. With
+        "boundary_tracing" (default) every polygon is traced by walking the oriented
+        boundary edges, in linear time overall. With "shortest_path" each polygon is
+        closed with the shortest path between the extreme vertices of one of its edges.
+
+    graph_class
+        Class of the graph used by the "shortest_path" method, either Graph (default)
+        or the array-backed CompactGraph, which uses much less memory on large inputs.
+
+    fence
+        Estimator of the quartiles of the edge lengths used by the Tukey's fence.
+        Either "exact" (default), for the exact quartiles, "sketch", for a streaming
+        quantile sketch in bounded memory, "reservoir", for the quartiles of a random
+        sample, or a callable that returns a new estimator, see `concave_uhull.fence`.
+
+    criterion
+        Criterion of the "auto" alpha: "single_shell" (default), "area_ratio" or
+        "max_rings", see `concave_uhull.sweep.AlphaFiltration.select_alpha`.
+
+    target
+        Target area ratio or number of rings of the criterion of the "auto" alpha.
+
+    deduplicate
+        If True, exact duplicate points are removed before the triangulation.
+
+    resolution
+        If given, the points are thinned before the triangulation with a square grid of
+        cells of this side, in units of the coordinates, that keeps a single point per
+        cell, see `concave_uhull.preprocessing.thin_points`. Exact duplicates are
+        removed as well.
+
+    drop_interior
+        If True, only the interior grid cells, whose 8 neighbor cells are all occupied,
+        keep a single point, and the other cells keep all their points. Requires a
+        resolution.
+
+    projection
+        If given, the (lng, lat) coordinates are projected once to a local metric
+        plane, either "local" or "azimuthal_equidistant", see
+        `concave_uhull.geometry.local_projection`, and the whole pipeline runs on the
+        projected points with the Euclidean distance, instead of the given distance.
+        Ring areas are then in square kilometers.
+
+    simplify
+        If given, the rings are simplified with the Douglas-Peucker algorithm, with
+        this tolerance in units of the distance function, e.g. kilometers for the
+        Haversine distance, keeping them valid, see
+        `concave_uhull.simplify.simplify_rings`.
+
+    stats
+        Optional statistics where the wall time of each stage of the computation and
+        the number of points, simplices, alpha triangles, boundary edges and rings are
+        recorded, see `concave_uhull.stats.PipelineStats`.
+
     Returns
     -------
-    List[List[Tuple]]
-        Returns list of alpha shape polygons in descending order by polygon area.
+    AlphaShapeArrays
+        Coordinates of the ring vertices, their indices in the given points, ring
+        offsets, ring areas and hole flags.
+
+    Raises
+    ------
+    AssertionError
+        If the method is not one of "boundary_tracing" or "shortest_path".
+        If the name of the quantile estimator is unknown.
+        If the alpha is "auto" and the criterion is unknown or lacks its target.
+        If drop_interior is True and no resolution is given.
+        If the projection is not one of "local" or "azimuthal_equidistant".
 
     See Also
     --------
-    _get_alpha_shape_edges : Gets a list of the boundary edges of each alpha triangle, in an
-        alpha triangulation of the given point coordinates.
+    get_alpha_shape_polygons : Provides a list of polygons representing the concave hull
+        of the given set of coordinates.
+    concave_uhull.graph.trace_boundary_rings : Traces the rings formed by oriented boundary
+        half-edges.
 
     Notes
     -----
-    The function performs the following steps to obtain the alpha shape polygon list:
-
-        1. Gets a list of the boundary edges of each alpha triangle, in an alpha
-        triangulation of the given point coordinates.
+    The function performs the following steps to obtain the alpha shape arrays,
+    after the optional thinning of the points, whose kept indices map the vertices
+    back to the given points, and the optional projection of the points, whose
+    vertex indices give the unprojected ring coordinates:
 
-        2. Defines an undirected graph, induced by the boundary alpha vertices and
-        non-negative edge weights computed with the distance function.
+        1. Gets the boundary edges of each alpha triangle, in an alpha triangulation
+        of the given point coordinates, as pairs of vertex indices.
 
-        3. Create alpha shape polygon list with following substeps:
-            3.1 A random edge is selected, its extreme points memorized and the edge
-            removed from the graph.
+        2. Gets the rings formed by the boundary edges, with the chosen method. Rings
+        follow the orientation of the boundary edges, which keep the counterclockwise
+        orientation of the triangles.
 
-            3.2 The shortest path from one memorized extreme point to the other
-            is obtained. With this path, we form a polygon of the alpha shape by adding
-            the first point to the end of the path.
+        3. Computes the signed areas of all rings at once, geodesic when the distance
+        is the Haversine distance, since coordinates are then (lng, lat). Rings with
+        negative area, in clockwise order, are holes.
 
-            3.3 After that all waypoints are removed from the set of points to be
-            explored. And then add the obtained polygon to the polygon list of the
-            alpha shape.
+        4. Returns the rings in descending order by area.
 
-        4. Returns list of alpha shape polygons in descending order by polygon area.
+    With a simplification tolerance, the rings are simplified at the end, and their
+    areas and order computed again.
 
     References
     ----------
@@ -257,49 +881,350 @@ def get_alpha_shape_polygons(
     .. [2] D. Kalinina et. al., "Concave Hull GitHub repository.",
     https://github.com/dkalinina/Concave_Hull.
     """
-    # Step 1: Gets a list of the boundary edges of each alpha triangle, in an alpha
-    # triangulation of the given point coordinates.
-    alpha_shape_edges: List = _get_alpha_shape_edges(
-        coordinates_points=coordinates_points, alpha=alpha, distance=distance
+    assert method in (
+        "boundary_tracing",
+        "shortest_path",
+    ), f"Unknown method {method}"
+    points = np.asarray(points, dtype=float)
+    stats = stats or _NULL_STATS
+    if simplify is not None:
+        alpha_shape = alpha_shape_arrays(
+            points=points,
+            alpha=alpha,
+            distance=distance,
+            method=method,
+            graph_class=graph_class,
+            fence=fence,
+            criterion=criterion,
+            target=target,
+            deduplicate=deduplicate,
+            resolution=resolution,
+            drop_interior=drop_interior,
+            projection=projection,
+            stats=stats,
+        )
+        with stats.stage("simplification"):
+            positions, offsets = simplify_rings(
+                alpha_shape.coordinates,
+                alpha_shape.offsets,
+                tolerance=simplify,
+                distance=distance,
+            )
+            return _get_sorted_alpha_shape_arrays(
+                points=points,
+                vertex_ids=alpha_shape.vertex_ids[positions],
+                offsets=offsets,
+                geodesic=distance is haversine_distance,
+            )
+    if deduplicate or resolution is not None or drop_interior:
+        with stats.stage("thinning"):
+            thinned_points, kept_indices = thin_points(
+                points, resolution=resolution, drop_interior=drop_interior
+            )
+        stats.count("thinned_points", len(points) - len(thinned_points))
+        alpha_shape = alpha_shape_arrays(
+            points=thinned_points,
+            alpha=alpha,
+            distance=distance,
+            method=method,
+            graph_class=graph_class,
+            fence=fence,
+            criterion=criterion,
+            target=target,
+            projection=projection,
+            stats=stats,
+        )
+        return alpha_shape._replace(
+            vertex_ids=kept_indices[alpha_shape.vertex_ids]
+        )
+    if projection is not None:
+        with stats.stage("projection"):
+            projected_points = local_projection(points, projection=projection)
+        alpha_shape = alpha_shape_arrays(
+            points=projected_points,
+            alpha=alpha,
+            distance=euclidean_distance,
+            method=method,
+            graph_class=graph_class,
+            fence=fence,
+            criterion=criterion,
+            target=target,
+            stats=stats,
+        )
+        return alpha_shape._replace(coordinates=points[alpha_shape.vertex_ids])
+
+    # Step 1: Gets the boundary edges of each alpha triangle, in an alpha
+    # triangulation of the given point coordinates, as pairs of vertex indices.
+    # An "auto" alpha is selected from the triangles sorted by critical alpha, with
+    # a single triangulation. The lazy stages of the alpha triangulation are
+    # computed one by one, so that each of them is timed.
+    stats.count("points", len(points))
+    if alpha == "auto":
+        from concave_uhull.sweep import AlphaFiltration
+
+        with stats.stage("alpha_selection"):
+            filtration = AlphaFiltration(
+                points=points, distance=distance, fence=fence
+            )
+            alpha_triangles = filtration.alpha_triangles(
+                filtration.select_alpha(criterion=criterion, target=target)
+            )
+        stats.count("simplices", len(filtration.simplices))
+    else:
+        triangulation = AlphaTriangulation(
+            points, distance=distance, fence=fence
+        )
+        with stats.stage("triangulation"):
+            stats.count("simplices", len(triangulation.simplices))
+        with stats.stage("edge_lengths"):
+            triangulation.edge_lengths
+        with stats.stage("fence"):
+            triangulation.quartiles
+        with stats.stage("alpha_triangles"):
+            alpha_triangles = triangulation.alpha_triangles(float(alpha))
+    stats.count("alpha_triangles", len(alpha_triangles))
+    with stats.stage("boundary_edges"):
+        alpha_shape_edges = _get_boundary_edges(alpha_triangles, len(points))
+    stats.count("boundary_edges", len(alpha_shape_edges))
+
+    # Step 2: Gets the rings formed by the boundary edges, with the chosen method.
+    # Step 3: Computes the signed areas of all rings at once, geodesic when the
+    # distance is the Haversine distance. Rings in clockwise order are holes.
+    # Step 4: Returns the rings in descending order by area.
+    return _get_edges_alpha_shape_arrays(
+        points=points,
+        alpha_shape_edges=alpha_shape_edges,
+        distance=distance,
+        method=method,
+        graph_class=graph_class,
+        stats=stats,
     )
 
-    # Step 2: Defines an undirected graph, induced by the boundary alpha vertices and
-    # non-negative edge weights computed with the distance function.
-    graph: Graph = Graph(edge_list=alpha_shape_edges, weight_function=distance)
-    nodes_to_explore: Set = graph.nodes.copy()
 
-    # Step 3: Create alpha shape polygon list with following substeps:
-    alpha_shape_polygons_list: List = []
-    while nodes_to_explore:
+def get_alpha_shape_polygons(
+    coordinates_points: List[Tuple],
+    alpha: Union[float, str] = 1.5,
+    distance: Callable = haversine_distance,
+    method: str = "boundary_tracing",
+    graph_class: Type = Graph,
+    fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+    criterion: str = "single_shell",
+    target: Optional[float] = None,
+    deduplicate: bool = False,
+    resolution: Optional[float] = None,
+    drop_interior: bool = False,
+    projection: Optional[str] = None,
+    simplify: Optional[float] = None,
+    stats: Optional[PipelineStats] = None,
+) -> List[List[Tuple]]:
+    """
+    Provides a list of polygons, sorted in descending order by their areas, representing the
+    concave hull of the given set of coordinates. The implemented algorithm uses a strategy
+    based on the alpha shape algorithm, which is obtained from a special triangulation of the
+    set of coordinates. This triangulation is strongly influenced by the value of the alpha
+    parameter and the given distance function.
 
-        # Step 3.1: A random edge is selected, its extreme points memorized and
-        # the edge removed from the graph.
-        edge_source = nodes_to_explore.pop()
-        edge_target = next(iter(graph[edge_source]), None)
-        if edge_target is None:
-            continue
-        graph.remove_edge(
-            edge_source=edge_source,
-            edge_target=edge_target,
-        )
+    Parameters
+    ----------
+    coordinates_points
+        List of point coordinates. Coordinates are represented by tuples of two numerical values.
 
-        # Step 3.2: The shortest path from one memorized extreme point to the
-        # other is obtained. With this path, we form a polygon of the alpha shape
-        # by adding the first point to the end of the path.
-        polygon_vertices = shortest_path_algorithm(
-            graph=graph, edge_source=edge_source, edge_target=edge_target
-        )
-        polygon_vertices.append(edge_source)
+    alpha
+        Float value responsible for determining the 'width' of Tukey's fence, or
+        "auto" to select the smallest alpha that meets the given criterion.
 
-        # Step 3.3:  After that all waypoints are removed from the set of points
-        # to be explored. And then add the obtained polygon to the polygon list of
-        # the alpha shape.
-        for vertice in polygon_vertices:
-            if vertice in nodes_to_explore:
-                nodes_to_explore.remove(vertice)
-        alpha_shape_polygons_list.append(polygon_vertices)
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices. By default, we use the Haversine
+        distance function, as we assume that the coordinates of the vertices are of
+        the form (lng, lat).
+
+    method
+        Method used to extract the polygons from the boundary edges. With
+        "boundary_tracing" (default) every polygon is traced by walking the oriented
+        boundary edges, in linear time overall. With "shortest_path" each polygon is
+        closed with the shortest path between the extreme vertices of one of its edges.
+
+    graph_class
+        Class of the graph used by the "shortest_path" method, either Graph (default)
+        or the array-backed CompactGraph, which uses much less memory on large inputs.
+
+    fence
+        Estimator of the quartiles of the edge lengths used by the Tukey's fence.
+        Either "exact" (default), for the exact quartiles, "sketch", for a streaming
+        quantile sketch in bounded memory, "reservoir", for the quartiles of a random
+        sample, or a callable that returns a new estimator, see `concave_uhull.fence`.
+
+    criterion
+        Criterion of the "auto" alpha: "single_shell" (default), "area_ratio" or
+        "max_rings", see `concave_uhull.sweep.AlphaFiltration.select_alpha`.
+
+    target
+        Target area ratio or number of rings of the criterion of the "auto" alpha.
+
+    deduplicate
+        If True, exact duplicate points are removed before the triangulation.
+
+    resolution
+        If given, the points are thinned before the triangulation with a square grid of
+        cells of this side, in units of the coordinates, that keeps a single point per
+        cell, see `concave_uhull.preprocessing.thin_points`. Exact duplicates are
+        removed as well.
+
+    drop_interior
+        If True, only the interior grid cells, whose 8 neighbor cells are all occupied,
+        keep a single point, and the other cells keep all their points. Requires a
+        resolution.
+
+    projection
+        If given, the (lng, lat) coordinates are projected once to a local metric
+        plane, either "local" or "azimuthal_equidistant", see
+        `concave_uhull.geometry.local_projection`, and the whole pipeline runs on the
+        projected points with the Euclidean distance, instead of the given distance.
+        Ring areas are then in square kilometers.
 
-    # Step 4: Returns list of alpha shape polygons in descending order by
-    # polygon area.
-    alpha_shape_polygons_list.sort(key=area_of_polygon, reverse=True)
-    return alpha_shape_polygons_list
+    simplify
+        If given, the rings are simplified with the Douglas-Peucker algorithm, with
+        this tolerance in units of the distance function, e.g. kilometers for the
+        Haversine distance, keeping them valid, see
+        `concave_uhull.simplify.simplify_rings`.
+
+    stats
+        Optional statistics where the wall time of each stage of the computation and
+        the number of points, simplices, alpha triangles, boundary edges and rings are
+        recorded, see `concave_uhull.stats.PipelineStats`.
+
+    Returns
+    -------
+    List[List[Tuple]]
+        Returns list of alpha shape polygons in descending order by polygon area.
+
+    Raises
+    ------
+    AssertionError
+        If the method is not one of "boundary_tracing" or "shortest_path".
+        If the name of the quantile estimator is unknown.
+        If the alpha is "auto" and the criterion is unknown or lacks its target.
+        If drop_interior is True and no resolution is given.
+        If the projection is not one of "local" or "azimuthal_equidistant".
+
+    See Also
+    --------
+    alpha_shape_arrays : Provides the polygons representing the concave hull of the given
+        array of points, in array form.
+    """
+    alpha_shape = alpha_shape_arrays(
+        points=np.asarray(coordinates_points, dtype=float),
+        alpha=alpha,
+        distance=distance,
+        method=method,
+        graph_class=graph_class,
+        fence=fence,
+        criterion=criterion,
+        target=target,
+        deduplicate=deduplicate,
+        resolution=resolution,
+        drop_interior=drop_interior,
+        projection=projection,
+        simplify=simplify,
+        stats=stats,
+    )
+
+    # vertex indices are converted back to the given coordinates
+    vertex_ids = alpha_shape.vertex_ids.tolist()
+    offsets = alpha_shape.offsets.tolist()
+    return [
+        [coordinates_points[vertice] for vertice in vertex_ids[start:end]]
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ]
+
+
+def get_alpha_shape_multipolygon(
+    coordinates_points: List[Tuple],
+    alpha: Union[float, str] = 1.5,
+    distance: Callable = haversine_distance,
+    method: str = "boundary_tracing",
+    graph_class: Type = Graph,
+    fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+    criterion: str = "single_shell",
+    target: Optional[float] = None,
+    deduplicate: bool = False,
+    resolution: Optional[float] = None,
+    drop_interior: bool = False,
+    projection: Optional[str] = None,
+    simplify: Optional[float] = None,
+    stats: Optional[PipelineStats] = None,
+) -> List[List[List[Tuple]]]:
+    """
+    Provides the concave hull of the given set of coordinates as a multipolygon: a list
+    of polygons, each one a shell followed by its holes, as in the GeoJSON and the
+    Simple Features specifications. Shells are in counterclockwise order and holes are
+    in clockwise order.
+
+    Parameters
+    ----------
+    coordinates_points
+        List of point coordinates. Coordinates are represented by tuples of two
+        numerical values.
+
+    alpha, distance, method, graph_class, fence, criterion, target, deduplicate
+        Parameters of the alpha shape, see `get_alpha_shape_polygons`.
+
+    resolution, drop_interior, projection, simplify, stats
+        Parameters of the alpha shape, see `get_alpha_shape_polygons`.
+
+    Returns
+    -------
+    List[List[List[Tuple]]]
+        Returns list of polygons in descending order by shell area, each one a list of
+        rings whose first ring is the shell and the other rings, in descending order by
+        area, are its holes.
+
+    See Also
+    --------
+    concave_uhull.geometry.ring_parents : Get the nesting tree of many rings at once.
+
+    Notes
+    -----
+    Each hole belongs to the smallest shell that contains it. Shells inside holes,
+    islands, are polygons of their own.
+    """
+    alpha_shape = alpha_shape_arrays(
+        points=np.asarray(coordinates_points, dtype=float),
+        alpha=alpha,
+        distance=distance,
+        method=method,
+        graph_class=graph_class,
+        fence=fence,
+        criterion=criterion,
+        target=target,
+        deduplicate=deduplicate,
+        resolution=resolution,
+        drop_interior=drop_interior,
+        projection=projection,
+        simplify=simplify,
+        stats=stats,
+    )
+    stats = stats or _NULL_STATS
+    with stats.stage("nesting"):
+        parents = ring_parents(
+            alpha_shape.coordinates, alpha_shape.offsets
+        ).tolist()
+
+    # vertex indices are converted back to the given coordinates, and each hole is
+    # appended to the polygon of its shell, rings being in descending order by area
+    vertex_ids = alpha_shape.vertex_ids.tolist()
+    offsets = alpha_shape.offsets.tolist()
+    is_hole = alpha_shape.is_hole.tolist()
+    polygons: List[List[List[Tuple]]] = []
+    polygon_of_shell = {}
+    for ring, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+        coordinates = [
+            coordinates_points[vertice] for vertice in vertex_ids[start:end]
+        ]
+        if not is_hole[ring]:
+            polygon_of_shell[ring] = len(polygons)
+            polygons.append([coordinates])
+        elif parents[ring] in polygon_of_shell:
+            polygons[polygon_of_shell[parents[ring]]].append(coordinates)
+    return polygons
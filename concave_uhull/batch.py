@@ -0,0 +1,298 @@
+import math
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from concave_uhull.alpha_shape import alpha_shape_arrays
+from concave_uhull.geometry import haversine_distance
+from concave_uhull.stats import PipelineStats
+
+
+def _get_grouped_points(
+    groups: Union[Mapping, Tuple[np.ndarray, np.ndarray]]
+) -> Tuple[np.ndarray, np.ndarray, Optional[List]]:
+    """
+    Gets the points of all groups concatenated in a single array, along with the group
+    offsets and the group keys, if the groups are given by a mapping.
+    """
+    if isinstance(groups, Mapping):
+        keys = list(groups)
+        arrays = [
+            np.asarray(groups[key], dtype=float).reshape(-1, 2) for key in keys
+        ]
+        offsets = np.cumsum([0] + [len(array) for array in arrays])
+        points = (
+            np.concatenate(arrays) if arrays else np.empty((0, 2), dtype=float)
+        )
+        return np.ascontiguousarray(points), offsets, keys
+    points, offsets = groups
+    points = np.ascontiguousarray(points, dtype=float).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    assert offsets[0] == 0 and offsets[-1] == len(
+        points
+    ), "Offsets must start at 0 and end at the number of points"
+    return points, offsets, None
+
+
+def _get_chunks(offsets: np.ndarray, chunk_size: int) -> List[Tuple]:
+    """
+    Splits the groups into chunks of consecutive groups whose total number of points
+    does not exceed the chunk size, unless the chunk has a single group.
+    """
+    chunks = []
+    chunk_start = 0
+    for group in range(1, len(offsets)):
+        if (
+            offsets[group] - offsets[chunk_start] > chunk_size
+            and group - 1 > chunk_start
+        ):
+            chunks.append((chunk_start, group - 1))
+            chunk_start = group - 1
+    if chunk_start < len(offsets) - 1:
+        chunks.append((chunk_start, len(offsets) - 1))
+    return chunks
+
+
+def _compute_groups(
+    points: np.ndarray,
+    offsets: np.ndarray,
+    alpha_shape_kwargs: Dict,
+    as_arrays: bool,
+    stats: Optional[PipelineStats] = None,
+) -> List:
+    """
+    Computes the alpha shape of each group of points. A group that raises an exception
+    gets the exception as result, so that it does not prevent the computation of the
+    other groups.
+    """
+    results: List = []
+    for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist()):
+        try:
+            alpha_shape = alpha_shape_arrays(
+                points=points[start:end], stats=stats, **alpha_shape_kwargs
+            )
+        except Exception as error:
+            results.append(error)
+            continue
+        if as_arrays:
+            results.append(alpha_shape)
+            continue
+        coordinates = list(map(tuple, alpha_shape.coordinates.tolist()))
+        ring_offsets = alpha_shape.offsets.tolist()
+        results.append(
+            [
+                coordinates[ring_start:ring_end]
+                for ring_start, ring_end in zip(
+                    ring_offsets[:-1], ring_offsets[1:]
+                )
+            ]
+        )
+    return results
+
+
+def _compute_shared_memory_groups(
+    shared_memory_name: str,
+    shape: Tuple[int, int],
+    offsets: np.ndarray,
+    alpha_shape_kwargs: Dict,
+    as_arrays: bool,
+    collect_stats: bool = False,
+) -> Tuple[List, Optional[PipelineStats]]:
+    """
+    Computes the alpha shape of each group of points, in a worker process, reading the
+    points from shared memory. Statistics of the computation are returned, if they are
+    collected, to be merged in the calling process.
+    """
+    stats = PipelineStats() if collect_stats else None
+    shared_points = shared_memory.SharedMemory(name=shared_memory_name)
+    try:
+        points: np.ndarray = np.ndarray(
+            shape, dtype=np.float64, buffer=shared_points.buf
+        )
+        results = _compute_groups(
+            points=points[offsets[0] : offsets[-1]],
+            offsets=offsets - offsets[0],
+            alpha_shape_kwargs=alpha_shape_kwargs,
+            as_arrays=as_arrays,
+            stats=stats,
+        )
+        del points
+    finally:
+        shared_points.close()
+    return results, stats
+
+
+def batch_alpha_shape_polygons(
+    groups: Union[Mapping, Tuple[np.ndarray, np.ndarray]],
+    alpha: Union[float, str] = 1.5,
+    distance: Callable = haversine_distance,
+    workers: Optional[int] = None,
+    executor: str = "process",
+    chunk_size: Optional[int] = None,
+    method: str = "boundary_tracing",
+    as_arrays: bool = False,
+    fence: Union[str, Callable] = "exact",
+    projection: Optional[str] = None,
+    stats: Optional[PipelineStats] = None,
+) -> Union[Dict, List]:
+    """
+    Provides the alpha shape polygons of many groups of points at once, computing the
+    groups in parallel. Groups are dispatched to the workers in chunks of consecutive
+    groups, sized by their number of points.
+
+    Parameters
+    ----------
+    groups
+        Either a mapping from group keys to the points of each group, as lists of
+        coordinates or arrays of shape (n, 2), or a tuple with an array of shape (n, 2)
+        of the points of all groups, concatenated, and an integer array of shape (g + 1,)
+        with the offsets of the groups in the points array.
+
+    alpha
+        Float value responsible for determining the 'width' of Tukey's fence, or
+        "auto" to select the alpha of each group, see
+        `concave_uhull.alpha_shape.alpha_shape_arrays`.
+
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices. With the "process" executor, it must
+        be picklable, e.g. a function defined at module level.
+
+    workers
+        Maximum number of workers. By default, the number of processors. With a single
+        worker, groups are computed in the calling thread.
+
+    executor
+        Either "process" (default), to compute groups in worker processes that read the
+        points from shared memory, or "thread", to compute groups in worker threads.
+
+    chunk_size
+        Maximum number of points of the groups sent together to a worker. A group with
+        more points is sent alone. By default, the points are split in about four
+        chunks per worker, so that the workers are kept busy until the end.
+
+    method
+        Method used to extract the polygons from the boundary edges, see
+        `concave_uhull.alpha_shape.alpha_shape_arrays`.
+
+    as_arrays
+        If True, the result of each group is an AlphaShapeArrays instead of a list of
+        polygons.
+
+    fence
+        Estimator of the quartiles of the edge lengths of each group, see
+        `concave_uhull.alpha_shape.alpha_shape_arrays`. With the "process" executor, a
+        callable must be picklable.
+
+    projection
+        If given, the points of each group are projected to a local metric plane, see
+        `concave_uhull.alpha_shape.alpha_shape_arrays`.
+
+    stats
+        Optional statistics where the wall time of each stage of the computation of
+        all groups is recorded, see `concave_uhull.stats.PipelineStats`. The
+        statistics of the workers are merged once their chunk is done, so stage times
+        add up the time spent by every worker.
+
+    Returns
+    -------
+    Union[Dict, List]
+        The result of each group, in input order, in a dictionary keyed by group if the
+        groups are given by a mapping, otherwise in a list. The result of a group is its
+        list of alpha shape polygons in descending order by polygon area, or its
+        AlphaShapeArrays. If the computation of a group raises an exception, e.g. a group
+        of collinear points that cannot be triangulated, its result is the exception.
+
+    Raises
+    ------
+    AssertionError
+        If the executor is not one of "process" or "thread".
+        If the offsets do not start at 0 and end at the number of points.
+
+    See Also
+    --------
+    concave_uhull.alpha_shape.alpha_shape_arrays : Provides the polygons representing the
+        concave hull of the given array of points, in array form.
+    """
+    assert executor in ("process", "thread"), f"Unknown executor {executor}"
+    points, offsets, keys = _get_grouped_points(groups)
+    alpha_shape_kwargs = dict(
+        alpha=alpha,
+        distance=distance,
+        method=method,
+        fence=fence,
+        projection=projection,
+    )
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(math.ceil(offsets[-1] / (4 * workers)), 1)
+    chunks = _get_chunks(offsets, chunk_size)
+
+    results: List = []
+    if workers == 1 or len(chunks) <= 1:
+        results = _compute_groups(
+            points=points,
+            offsets=offsets,
+            alpha_shape_kwargs=alpha_shape_kwargs,
+            as_arrays=as_arrays,
+            stats=stats,
+        )
+    elif executor == "thread":
+        # each chunk records its own statistics, which are not thread-safe
+        chunk_stats = [
+            PipelineStats() if stats is not None else None for _ in chunks
+        ]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures: List[Future] = [
+                pool.submit(
+                    _compute_groups,
+                    points=points,
+                    offsets=offsets[first : last + 1],
+                    alpha_shape_kwargs=alpha_shape_kwargs,
+                    as_arrays=as_arrays,
+                    stats=chunk_stats[chunk],
+                )
+                for chunk, (first, last) in enumerate(chunks)
+            ]
+            for future, worker_stats in zip(futures, chunk_stats):
+                results.extend(future.result())
+                if stats is not None and worker_stats is not None:
+                    stats.merge(worker_stats)
+    else:
+        # points are copied once to shared memory, instead of being pickled to each
+        # worker process
+        shared_points = shared_memory.SharedMemory(
+            create=True, size=max(points.nbytes, 1)
+        )
+        try:
+            np.ndarray(
+                points.shape, dtype=np.float64, buffer=shared_points.buf
+            )[:] = points
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _compute_shared_memory_groups,
+                        shared_memory_name=shared_points.name,
+                        shape=points.shape,
+                        offsets=offsets[first : last + 1],
+                        alpha_shape_kwargs=alpha_shape_kwargs,
+                        as_arrays=as_arrays,
+                        collect_stats=stats is not None,
+                    )
+                    for first, last in chunks
+                ]
+                for future in futures:
+                    chunk_results, worker_stats = future.result()
+                    results.extend(chunk_results)
+                    if stats is not None and worker_stats is not None:
+                        stats.merge(worker_stats)
+        finally:
+            shared_points.close()
+            shared_points.unlink()
+
+    if keys is None:
+        return results
+    return dict(zip(keys, results))
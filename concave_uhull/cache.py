@@ -0,0 +1,477 @@
+import hashlib
+import importlib
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from concave_uhull.alpha_shape import (
+    AlphaShapeArrays,
+    AlphaTriangulation,
+    alpha_shape_arrays,
+)
+from concave_uhull.fence import QuantileEstimator
+from concave_uhull.geometry import haversine_distance
+from concave_uhull.graph import Graph
+from concave_uhull.stats import PipelineStats
+
+
+def get_fingerprint(points: np.ndarray) -> str:
+    """
+    Get a fingerprint of an array of points, the BLAKE2b hash of its shape and its
+    float64 buffer.
+
+    Parameters
+    ----------
+    points
+        Array of shape (n, 2) with the point coordinates.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of 32 characters.
+    """
+    points = np.ascontiguousarray(points, dtype=float)
+    fingerprint = hashlib.blake2b(digest_size=16)
+    fingerprint.update(str(points.shape).encode())
+    fingerprint.update(points.data)
+    return fingerprint.hexdigest()
+
+
+def _is_importable(value) -> bool:
+    """
+    Checks whether a function or class is found back by importing its module and
+    getting its qualified name, so that the name identifies it across processes, unlike
+    the names of lambdas and of functions defined inside functions.
+    """
+    try:
+        found = importlib.import_module(value.__module__)
+        for name in value.__qualname__.split("."):
+            found = getattr(found, name)
+    except (ImportError, AttributeError, TypeError):
+        return False
+    return found is value
+
+
+def _get_identity(value) -> Tuple[str, Optional[object]]:
+    """
+    Gets a string that identifies a parameter value, along with the value itself if
+    the string identifies it only while it is alive: the representation of plain
+    scalars and strings, the qualified name of importable functions and classes, and
+    otherwise the name and the id of the object, such as a lambda, a closure, a
+    partial function or a callable instance.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value), None
+    if hasattr(value, "__qualname__") and _is_importable(value):
+        return f"{value.__module__}.{value.__qualname__}", None
+    name = getattr(value, "__qualname__", type(value).__qualname__)
+    return f"{name}@{id(value)}", value
+
+
+class HullCache:
+    """
+    Opt-in cache of alpha shapes, keyed by the fingerprint of the points and the
+    parameters of the alpha shape, with a least recently used eviction bound by bytes.
+    The Delaunay simplices and the edge lengths of each point set are cached as well,
+    as separate entries, so that other alphas on the same points only repeat the
+    boundary extraction.
+
+    Parameters
+    ----------
+    max_bytes
+        Maximum number of bytes of the arrays kept in memory.
+
+    cache_dir
+        Optional directory where each entry is also saved as a .npz file, so that it
+        outlives the process. Files are never evicted.
+
+    Attributes
+    ----------
+    hits
+        Number of lookups found in memory or on disk.
+    misses
+        Number of lookups that had to be computed.
+    nbytes
+        Number of bytes of the arrays kept in memory.
+
+    See Also
+    --------
+    concave_uhull.alpha_shape.get_alpha_shape_polygons : Provides a list of polygons
+        representing the concave hull of the given set of coordinates.
+
+    Notes
+    -----
+    Cached arrays are read-only, since they are shared by every lookup. Functions,
+    such as the distance, are identified by their qualified name if importing it finds
+    them back. Other objects, such as lambdas, closures and partial functions, are
+    identified by the object itself, which their entries keep alive until they are
+    evicted, and their entries are only kept in memory.
+    """
+
+    def __init__(
+        self, max_bytes: int = 256 * 2**20, cache_dir: Optional[str] = None
+    ):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._referents: Dict[str, Tuple] = {}
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """
+        Removes all entries kept in memory, but not the files of the cache directory.
+
+        Returns
+        -------
+        None
+            Returns None
+        """
+        self._entries.clear()
+        self._referents.clear()
+        self.nbytes = 0
+
+    def _get_path(self, key: str) -> str:
+        """Gets the path of the .npz file of an entry."""
+        return os.path.join(str(self.cache_dir), f"{key}.npz")
+
+    def _get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Gets the arrays of an entry, from memory or from the cache directory, or None
+        if the entry is not cached.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        if self.cache_dir is not None and os.path.exists(self._get_path(key)):
+            with np.load(self._get_path(key)) as npz_file:
+                arrays = {name: npz_file[name] for name in npz_file.files}
+            self.hits += 1
+            self._put(key, arrays, persist=False)
+            return arrays
+        self.misses += 1
+        return None
+
+    def _put(
+        self,
+        key: str,
+        arrays: Dict[str, np.ndarray],
+        persist: bool = True,
+        referents: Tuple = (),
+    ) -> None:
+        """
+        Puts the arrays of an entry in memory, evicting the least recently used
+        entries beyond the maximum number of bytes, and in the cache directory. The
+        objects whose id is part of the key are kept alive along with the entry, so
+        that their id is not reused, and the entry is not saved.
+        """
+        for array in arrays.values():
+            array.flags.writeable = False
+        if persist and not referents and self.cache_dir is not None:
+            np.savez(self._get_path(key), **arrays)  # type: ignore
+        nbytes = sum(array.nbytes for array in arrays.values())
+        if nbytes > self.max_bytes:
+            return
+        self._entries[key] = arrays
+        if referents:
+            self._referents[key] = referents
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._referents.pop(evicted_key, None)
+            self.nbytes -= sum(array.nbytes for array in evicted.values())
+
+    @staticmethod
+    def _get_key(*parts) -> str:
+        """Gets the key of an entry from its parts."""
+        return hashlib.blake2b(
+            "|".join(map(str, parts)).encode(), digest_size=16
+        ).hexdigest()
+
+    def simplices(
+        self, points: np.ndarray, fingerprint: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Provides the Delaunay simplices of the points, from the cache if possible.
+
+        Parameters
+        ----------
+        points
+            Array of shape (n, 2) with the point coordinates.
+
+        fingerprint
+            Fingerprint of the points, computed if not given.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array of shape (t, 3) with the vertex indices of each triangle, in
+            counterclockwise order.
+        """
+        fingerprint = fingerprint or get_fingerprint(points)
+        key = self._get_key("simplices", fingerprint)
+        arrays = self._get(key)
+        if arrays is None:
+            arrays = {"simplices": AlphaTriangulation(points).simplices}
+            self._put(key, arrays)
+        return arrays["simplices"]
+
+    def edge_lengths(
+        self,
+        points: np.ndarray,
+        distance: Callable = haversine_distance,
+        fingerprint: Optional[str] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Provides the edge lengths of the Delaunay triangulation of the points, from the
+        cache if possible.
+
+        Parameters
+        ----------
+        points
+            Array of shape (n, 2) with the point coordinates.
+
+        distance
+            Function that receives two tuples of coordinates of vertices and obtains a
+            measure of distance between the vertices.
+
+        fingerprint
+            Fingerprint of the points, computed if not given.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Integer array of shape (e, 2) with the vertex indices of each edge, integer
+            array of shape (t, 3) with the index of the edge of each side of each
+            triangle, and array of shape (e,) with the length of each edge.
+
+        See Also
+        --------
+        concave_uhull.alpha_shape.AlphaTriangulation : Delaunay triangulation of a set
+            of points, with the intermediate stages of the alpha shape.
+        """
+        fingerprint = fingerprint or get_fingerprint(points)
+        distance_identity, distance_referent = _get_identity(distance)
+        key = self._get_key("edge_lengths", fingerprint, distance_identity)
+        arrays = self._get(key)
+        if arrays is None:
+            triangulation = AlphaTriangulation(points, distance=distance)
+            triangulation._set_stages(
+                simplices=self.simplices(points, fingerprint=fingerprint)
+            )
+            arrays = {
+                "edges": triangulation.edges,
+                "triangle_edges": triangulation.triangle_edges,
+                "edge_lengths": triangulation.edge_lengths,
+            }
+            self._put(
+                key,
+                arrays,
+                referents=(distance_referent,) if distance_referent else (),
+            )
+        return (
+            arrays["edges"],
+            arrays["triangle_edges"],
+            arrays["edge_lengths"],
+        )
+
+    def alpha_shape_arrays(
+        self,
+        points: np.ndarray,
+        alpha: Union[float, str] = 1.5,
+        distance: Callable = haversine_distance,
+        method: str = "boundary_tracing",
+        graph_class: Type = Graph,
+        fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+        criterion: str = "single_shell",
+        target: Optional[float] = None,
+        deduplicate: bool = False,
+        resolution: Optional[float] = None,
+        drop_interior: bool = False,
+        projection: Optional[str] = None,
+        simplify: Optional[float] = None,
+        stats: Optional[PipelineStats] = None,
+    ) -> AlphaShapeArrays:
+        """
+        Provides the alpha shape polygons of the given array of points, in array form,
+        from the cache if possible. On a miss, the cached simplices and edge lengths of
+        the points are reused, unless the alpha is "auto", the points are thinned,
+        projected or simplified, or statistics are recorded, which run the whole
+        pipeline.
+
+        Parameters
+        ----------
+        points
+            Array of shape (n, 2) with the point coordinates.
+
+        alpha, distance, method, graph_class, fence, criterion, target, deduplicate
+            Parameters of the alpha shape, see
+            `concave_uhull.alpha_shape.alpha_shape_arrays`.
+
+        resolution, drop_interior, projection, simplify, stats
+            Parameters of the alpha shape, see
+            `concave_uhull.alpha_shape.alpha_shape_arrays`. Statistics are only
+            recorded on a miss.
+
+        Returns
+        -------
+        AlphaShapeArrays
+            Coordinates of the ring vertices, their indices in the given points, ring
+            offsets, ring areas and hole flags, as read-only arrays.
+
+        Raises
+        ------
+        AssertionError
+            If the method is not one of "boundary_tracing" or "shortest_path".
+        """
+        assert method in (
+            "boundary_tracing",
+            "shortest_path",
+        ), f"Unknown method {method}"
+        points = np.ascontiguousarray(points, dtype=float)
+        fingerprint = get_fingerprint(points)
+        distance_identity, distance_referent = _get_identity(distance)
+        fence_identity, fence_referent = _get_identity(fence)
+        key = self._get_key(
+            "alpha_shape",
+            fingerprint,
+            alpha,
+            distance_identity,
+            method,
+            fence_identity,
+            criterion,
+            target,
+            deduplicate,
+            resolution,
+            drop_interior,
+            projection,
+            simplify,
+        )
+        arrays = self._get(key)
+        if arrays is not None:
+            return AlphaShapeArrays(**arrays)
+
+        if (
+            alpha == "auto"
+            or deduplicate
+            or resolution is not None
+            or drop_interior
+            or projection is not None
+            or simplify is not None
+            or stats is not None
+        ):
+            alpha_shape = alpha_shape_arrays(
+                points=points,
+                alpha=alpha,
+                distance=distance,
+                method=method,
+                graph_class=graph_class,
+                fence=fence,
+                criterion=criterion,
+                target=target,
+                deduplicate=deduplicate,
+                resolution=resolution,
+                drop_interior=drop_interior,
+                projection=projection,
+                simplify=simplify,
+                stats=stats,
+            )
+        else:
+            edges, triangle_edges, edge_lengths = self.edge_lengths(
+                points, distance, fingerprint=fingerprint
+            )
+            triangulation = AlphaTriangulation(
+                points, distance=distance, fence=fence
+            )
+            triangulation._set_stages(
+                simplices=self.simplices(points, fingerprint=fingerprint),
+                _edges=(edges, triangle_edges),
+                edge_lengths=edge_lengths,
+            )
+            alpha_shape = triangulation.arrays(
+                float(alpha), method=method, graph_class=graph_class
+            )
+        self._put(
+            key,
+            alpha_shape._asdict(),
+            referents=tuple(
+                referent
+                for referent in (distance_referent, fence_referent)
+                if referent is not None
+            ),
+        )
+        return alpha_shape
+
+    def get_alpha_shape_polygons(
+        self,
+        coordinates_points: List[Tuple],
+        alpha: Union[float, str] = 1.5,
+        distance: Callable = haversine_distance,
+        method: str = "boundary_tracing",
+        graph_class: Type = Graph,
+        fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+        criterion: str = "single_shell",
+        target: Optional[float] = None,
+        deduplicate: bool = False,
+        resolution: Optional[float] = None,
+        drop_interior: bool = False,
+        projection: Optional[str] = None,
+        simplify: Optional[float] = None,
+        stats: Optional[PipelineStats] = None,
+    ) -> List[List[Tuple]]:
+        """
+        Provides the list of alpha shape polygons of the given set of coordinates, from
+        the cache if possible.
+
+        Parameters
+        ----------
+        coordinates_points
+            List of point coordinates. Coordinates are represented by tuples of two
+            numerical values.
+
+        alpha, distance, method, graph_class, fence, criterion, target, deduplicate
+            Parameters of the alpha shape, see
+            `concave_uhull.alpha_shape.get_alpha_shape_polygons`.
+
+        resolution, drop_interior, projection, simplify, stats
+            Parameters of the alpha shape, see
+            `concave_uhull.alpha_shape.get_alpha_shape_polygons`.
+
+        Returns
+        -------
+        List[List[Tuple]]
+            Returns list of alpha shape polygons in descending order by polygon area.
+        """
+        alpha_shape = self.alpha_shape_arrays(
+            points=np.asarray(coordinates_points, dtype=float),
+            alpha=alpha,
+            distance=distance,
+            method=method,
+            graph_class=graph_class,
+            fence=fence,
+            criterion=criterion,
+            target=target,
+            deduplicate=deduplicate,
+            resolution=resolution,
+            drop_interior=drop_interior,
+            projection=projection,
+            simplify=simplify,
+            stats=stats,
+        )
+
+        # vertex indices are converted back to the given coordinates
+        vertex_ids = alpha_shape.vertex_ids.tolist()
+        offsets = alpha_shape.offsets.tolist()
+        return [
+            [coordinates_points[vertice] for vertice in vertex_ids[start:end]]
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
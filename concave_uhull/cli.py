@@ -0,0 +1,555 @@
+"""
+Command-line interface to compute the concave hulls of the points of a file, one per
+group of points, in parallel, with bounded memory.
+
+Usage
+-----
+    concave-uhull points.csv --group-by vehicle --output hulls.geojson
+    concave-uhull points.parquet --x lon --y lat --group-by zone --partitions 64
+    concave-uhull points.npy --distance euclidean --format wkb --output hulls.csv
+
+Points are read in chunks of rows and, with a group-by column, split into partitions
+by a hash of their group, spilled to temporary files when there is more than one
+partition, so that memory holds a single partition at a time. By default, the number
+of partitions is estimated from the input size, to fit a memory limit. The hulls of the groups
+of each partition are computed in parallel and written as soon as they are done.
+Without a group-by column, the points are spilled to a temporary file, memory-mapped
+for a single hull, which is computed tile by tile with a tile size, required when
+the points exceed the memory limit.
+
+Input that cannot be read is reported as a usage error, with exit status 2, and the
+exit status is 1 if the hull of any group failed, such as a group of collinear points.
+"""
+import argparse
+import csv
+import itertools
+import math
+import operator
+import os
+import sys
+import tempfile
+import time
+import zlib
+from typing import IO, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from concave_uhull.alpha_shape import AlphaShapeArrays
+from concave_uhull.batch import batch_alpha_shape_polygons
+from concave_uhull.encoders import (
+    _FEATURE_COLLECTION,
+    _get_geojson_feature,
+    to_wkb,
+    to_wkt,
+)
+from concave_uhull.geometry import euclidean_distance, haversine_distance
+from concave_uhull.stats import PipelineStats
+from concave_uhull.tiling import tiled_alpha_shape_arrays
+
+DISTANCES = {"haversine": haversine_distance, "euclidean": euclidean_distance}
+
+Chunk = Tuple[np.ndarray, Optional[np.ndarray]]
+
+
+def _read_csv(
+    path: str,
+    x: Optional[str],
+    y: Optional[str],
+    group_by: Optional[str],
+    chunk_size: int,
+) -> Iterator[Chunk]:
+    """
+    Reads the points of a CSV file with a header, and their groups, in chunks of rows.
+    Groups are read as strings.
+    """
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        columns = [x or "lng", y or "lat"] + ([group_by] if group_by else [])
+        for column in columns:
+            if column not in header:
+                raise ValueError(f"Unknown column {column}")
+        get_columns = operator.itemgetter(
+            *(header.index(column) for column in columns)
+        )
+        while True:
+            rows = np.array(
+                list(map(get_columns, itertools.islice(reader, chunk_size))),
+                dtype=str,
+            ).reshape(-1, len(columns))
+            if len(rows) == 0:
+                return
+            yield rows[:, :2].astype(float), rows[:, 2] if group_by else None
+
+
+def _read_parquet(
+    path: str,
+    x: Optional[str],
+    y: Optional[str],
+    group_by: Optional[str],
+    chunk_size: int,
+) -> Iterator[Chunk]:
+    """
+    Reads the points of a Parquet file, and their groups, in batches of rows. Requires
+    pyarrow.
+    """
+    try:
+        import pyarrow.parquet as parquet
+    except ImportError as error:
+        raise ImportError("Reading Parquet files requires pyarrow") from error
+
+    columns = [x or "lng", y or "lat"] + ([group_by] if group_by else [])
+    for batch in parquet.ParquetFile(path).iter_batches(
+        batch_size=chunk_size, columns=columns
+    ):
+        arrays = [
+            batch.column(column).to_numpy(zero_copy_only=False)
+            for column in columns
+        ]
+        points = np.column_stack(arrays[:2]).astype(float)
+        keys = arrays[2] if group_by else None
+        if keys is not None and keys.dtype.kind == "O":
+            keys = keys.astype(str)
+        yield points, keys
+
+
+def _read_npy(
+    path: str,
+    x: Optional[str],
+    y: Optional[str],
+    group_by: Optional[str],
+    chunk_size: int,
+) -> Iterator[Chunk]:
+    """
+    Reads the points of a two-dimensional .npy array, and their groups, in chunks of
+    rows of the memory-mapped array. Columns are given by their index.
+    """
+    array = np.load(path, mmap_mode="r")
+    if array.ndim != 2:
+        raise ValueError("The .npy array must have two dimensions")
+    columns = [int(x or 0), int(y or 1)]
+    for start in range(0, len(array), chunk_size):
+        rows = np.asarray(array[start : start + chunk_size])
+        yield (
+            rows[:, columns].astype(float),
+            rows[:, int(group_by)] if group_by else None,
+        )
+
+
+READERS = {".csv": _read_csv, ".parquet": _read_parquet, ".npy": _read_npy}
+
+# approximate bytes of memory taken by the points and keys of each byte of input, as
+# parsed floats and strings of CSV, or decompressed columns of Parquet
+MEMORY_PER_INPUT_BYTE = {".csv": 2.0, ".parquet": 4.0, ".npy": 1.0}
+
+
+def _get_memory_estimate(path: str, extension: str) -> float:
+    """Gets an estimate of the memory, in MiB, taken by the points of the input."""
+    return os.path.getsize(path) * MEMORY_PER_INPUT_BYTE[extension] / 2**20
+
+
+class _Partitions:
+    """
+    Points of the groups, split into partitions by a hash of their group, so that each
+    partition holds whole groups. With more than one partition, the chunks of each
+    partition are appended to a temporary file instead of being kept in memory.
+    Ungrouped points are always appended to a temporary file of raw coordinates,
+    which is memory-mapped as a single partition.
+    """
+
+    def __init__(self, num_partitions: int = 1, grouped: bool = True):
+        self.num_partitions = num_partitions
+        self.grouped = grouped
+        self.num_points = 0
+        self._chunks: List[Chunk] = []
+        self._directory: Optional[tempfile.TemporaryDirectory] = None
+        if num_partitions > 1 or not grouped:
+            self._directory = tempfile.TemporaryDirectory(
+                prefix="concave_uhull_"
+            )
+
+    def _get_path(self, partition: int) -> str:
+        assert self._directory is not None
+        return os.path.join(self._directory.name, f"{partition}.npy")
+
+    def append(self, points: np.ndarray, keys: Optional[np.ndarray]) -> None:
+        self.num_points += len(points)
+        if not self.grouped:
+            with open(self._get_path(0), "ab") as file:
+                np.ascontiguousarray(points, dtype=np.float64).tofile(file)
+            return
+        if self._directory is None or keys is None:
+            self._chunks.append((points, keys))
+            return
+
+        # the partition of each group is the CRC32 of its key, which, unlike the hash
+        # of strings, is the same in every run
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        checksums = np.array(
+            [zlib.crc32(str(key).encode()) for key in unique_keys.tolist()],
+            dtype=np.int64,
+        )
+        partitions = checksums[inverse] % self.num_partitions
+        for partition in np.unique(partitions).tolist():
+            is_in_partition = partitions == partition
+            with open(self._get_path(partition), "ab") as file:
+                np.save(file, points[is_in_partition])
+                np.save(file, keys[is_in_partition])
+
+    def __iter__(self) -> Iterator[Chunk]:
+        if not self.grouped:
+            if self.num_points:
+                yield np.memmap(
+                    self._get_path(0), dtype=np.float64, mode="r"
+                ).reshape(-1, 2), None
+            return
+        if self._directory is None:
+            if self._chunks:
+                yield _concatenate_chunks(self._chunks)
+            return
+        for partition in range(self.num_partitions):
+            if not os.path.exists(self._get_path(partition)):
+                continue
+            chunks = []
+            with open(self._get_path(partition), "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                while file.tell() < size:
+                    chunks.append((np.load(file), np.load(file)))
+            yield _concatenate_chunks(chunks)
+
+    def close(self) -> None:
+        if self._directory is not None:
+            self._directory.cleanup()
+
+
+def _concatenate_chunks(chunks: List[Chunk]) -> Chunk:
+    """Concatenates the points and the keys of chunks."""
+    points = np.concatenate([points for points, _ in chunks])
+    if chunks[0][1] is None:
+        return points, None
+    return points, np.concatenate([keys for _, keys in chunks])
+
+
+def _get_groups(
+    points: np.ndarray, keys: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, List]:
+    """
+    Gets the points sorted by group, along with the group offsets and the group keys,
+    in ascending order. Without keys, all the points are a single group.
+    """
+    if keys is None:
+        return points, np.array([0, len(points)]), [None]
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    offsets = np.concatenate(
+        ([0], np.cumsum(np.bincount(inverse, minlength=len(unique_keys))))
+    )
+    return (
+        points[np.argsort(inverse, kind="stable")],
+        offsets,
+        unique_keys.tolist(),
+    )
+
+
+class _GeoJSONWriter:
+    """Writes the hulls as the features of a GeoJSON FeatureCollection."""
+
+    def __init__(self, file: IO[str], precision: int = 6):
+        self.file = file
+        self.precision = precision
+        self.num_features = 0
+        file.write(_FEATURE_COLLECTION[0])
+
+    def write(self, key, result: Union[AlphaShapeArrays, Exception]) -> None:
+        if self.num_features:
+            self.file.write(", ")
+        self.file.write(_get_geojson_feature(key, result, self.precision))
+        self.num_features += 1
+
+    def close(self) -> None:
+        self.file.write(_FEATURE_COLLECTION[1])
+
+
+class _CSVWriter:
+    """
+    Writes the hulls as the rows of a CSV file, with the key of each group and the
+    hexadecimal WKB or the WKT of its hull, empty if its computation failed.
+    """
+
+    def __init__(self, file: IO[str], format: str, precision: int = 6):
+        self.format = format
+        self.precision = precision
+        self.writer = csv.writer(file, lineterminator="\n")
+        self.writer.writerow(["key", format])
+
+    def write(self, key, result: Union[AlphaShapeArrays, Exception]) -> None:
+        geometry = ""
+        if isinstance(result, AlphaShapeArrays):
+            geometry = (
+                to_wkb(result).hex()
+                if self.format == "wkb"
+                else to_wkt(result, precision=self.precision)
+            )
+        self.writer.writerow(["" if key is None else key, geometry])
+
+    def close(self) -> None:
+        pass
+
+
+def _parse_alpha(value: str) -> Union[float, str]:
+    return value if value == "auto" else float(value)
+
+
+def _parse_positive_int(value: str) -> int:
+    if int(value) < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return int(value)
+
+
+def _parse_positive_float(value: str) -> float:
+    if not float(value) > 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number")
+    return float(value)
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="concave-uhull",
+        description=__doc__.split("\n\n")[0].strip(),
+    )
+    parser.add_argument(
+        "input", help="CSV file with a header, Parquet file or .npy array"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file, by default stdout"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["geojson", "wkb", "wkt"],
+        default="geojson",
+        help="GeoJSON FeatureCollection, or CSV of keys and hex WKB or WKT",
+    )
+    parser.add_argument(
+        "--x",
+        help="column of the x coordinates, by default lng, or 0 for .npy",
+    )
+    parser.add_argument(
+        "--y",
+        help="column of the y coordinates, by default lat, or 1 for .npy",
+    )
+    parser.add_argument(
+        "--group-by", help="column of the groups, a hull per group"
+    )
+    parser.add_argument(
+        "--alpha", type=_parse_alpha, default=1.5, help='float or "auto"'
+    )
+    parser.add_argument(
+        "--distance", choices=list(DISTANCES), default="haversine"
+    )
+    parser.add_argument(
+        "--projection", choices=["local", "azimuthal_equidistant"]
+    )
+    parser.add_argument(
+        "--method",
+        choices=["boundary_tracing", "shortest_path"],
+        default="boundary_tracing",
+    )
+    parser.add_argument(
+        "--fence", choices=["exact", "sketch", "reservoir"], default="exact"
+    )
+    parser.add_argument(
+        "--workers",
+        type=_parse_positive_int,
+        help="by default, the number of processors",
+    )
+    parser.add_argument(
+        "--executor", choices=["process", "thread"], default="process"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_parse_positive_int,
+        default=1_000_000,
+        help="number of rows read at a time",
+    )
+    parser.add_argument(
+        "--partitions",
+        type=_parse_positive_int,
+        help="number of partitions of the groups, spilled to temporary files "
+        "when greater than 1, by default enough for the points of a partition "
+        "to fit in the memory limit",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=_parse_positive_float,
+        default=1024.0,
+        help="approximate memory, in MiB, of the points of a partition, "
+        "estimated from the input size; ungrouped input beyond it requires "
+        "--tile-size. Peak memory is a few times the points of the largest "
+        "partition, or of the largest tile, for their triangulations",
+    )
+    parser.add_argument(
+        "--tile-size",
+        type=_parse_positive_float,
+        help="without a group-by column, side of the tiles of the points, in units "
+        "of the coordinates, to compute the hull tile by tile in bounded memory",
+    )
+    parser.add_argument(
+        "--precision",
+        type=int,
+        choices=range(16),
+        metavar="{0..15}",
+        default=6,
+        help="maximum number of decimals of the GeoJSON and WKT coordinates",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="do not print progress"
+    )
+    return parser
+
+
+def _format_stats(title: str, stats: PipelineStats) -> str:
+    """Formats the timings and the counters of statistics as lines of text."""
+    lines = [title]
+    for name, elapsed in stats.timings.items():
+        lines.append(f"{name:>20} {elapsed:>10.3f} s")
+    for name, value in stats.counters.items():
+        lines.append(f"{name:>20} {value:>10}")
+    return "\n".join(lines)
+
+
+def _get_tiled_results(
+    points: np.ndarray, args: argparse.Namespace
+) -> List[Union[AlphaShapeArrays, Exception]]:
+    """
+    Gets the hull of the points computed tile by tile, as the result of a single
+    group, which is the exception raised if the computation failed.
+    """
+    try:
+        return [
+            tiled_alpha_shape_arrays(
+                points,
+                tile_size=args.tile_size,
+                alpha=args.alpha,
+                distance=DISTANCES[args.distance],
+                fence=args.fence,
+                chunk_size=args.chunk_size,
+            )
+        ]
+    except Exception as error:
+        return [error]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+    if args.tile_size is not None:
+        if args.group_by:
+            parser.error("--tile-size requires ungrouped points")
+        if args.alpha == "auto" or args.projection:
+            parser.error(
+                "--tile-size requires a float alpha and no projection"
+            )
+        if args.method != "boundary_tracing":
+            parser.error("--tile-size requires the boundary_tracing method")
+    extension = os.path.splitext(args.input)[1].lower()
+    if extension not in READERS:
+        parser.error(f"Unknown input format {extension}")
+
+    try:
+        memory_estimate = _get_memory_estimate(args.input, extension)
+    except OSError as error:
+        parser.error(f"cannot read {args.input}: {error}")
+    if args.group_by and args.partitions is None:
+        args.partitions = max(
+            math.ceil(memory_estimate / args.memory_limit), 1
+        )
+    if (
+        not args.group_by
+        and args.tile_size is None
+        and memory_estimate > args.memory_limit
+    ):
+        parser.error(
+            f"ungrouped input of about {memory_estimate:.0f} MiB exceeds the "
+            "memory limit, and requires --tile-size"
+        )
+
+    def log(message: str) -> None:
+        if not args.quiet:
+            print(message, file=sys.stderr)
+
+    # the job stages are timed on the wall clock, and the stages of the hulls are
+    # summed over the workers
+    job_stats = PipelineStats()
+    stats = PipelineStats()
+    partitions = _Partitions(
+        args.partitions if args.group_by else 1, grouped=bool(args.group_by)
+    )
+    output = (
+        sys.stdout
+        if args.output == "-"
+        else open(args.output, "w", newline="")
+    )
+    try:
+        with job_stats.stage("reading"):
+            try:
+                for points, keys in READERS[extension](
+                    args.input, args.x, args.y, args.group_by, args.chunk_size
+                ):
+                    partitions.append(points, keys)
+                    log(f"read {partitions.num_points} points")
+            except (ImportError, OSError, ValueError, IndexError) as error:
+                parser.error(f"cannot read {args.input}: {error}")
+
+        writer = (
+            _GeoJSONWriter(output, precision=args.precision)
+            if args.format == "geojson"
+            else _CSVWriter(output, args.format, precision=args.precision)
+        )
+        for partition, (points, keys) in enumerate(partitions):
+            start = time.perf_counter()
+            with job_stats.stage("grouping"):
+                points, offsets, group_keys = _get_groups(points, keys)
+            with job_stats.stage("hulls"):
+                results = (
+                    _get_tiled_results(points, args)
+                    if keys is None and args.tile_size
+                    else batch_alpha_shape_polygons(
+                        (points, offsets),
+                        alpha=args.alpha,
+                        distance=DISTANCES[args.distance],
+                        workers=args.workers,
+                        executor=args.executor,
+                        method=args.method,
+                        as_arrays=True,
+                        fence=args.fence,
+                        projection=args.projection,
+                        stats=stats,
+                    )
+                )
+            with job_stats.stage("writing"):
+                for key, result in zip(group_keys, results):
+                    writer.write(key, result)
+                    if isinstance(result, Exception):
+                        job_stats.count("failed_groups", 1)
+                        message = (str(result).strip().splitlines() or [""])[0]
+                        log(
+                            f"group {key} failed: "
+                            f"{type(result).__name__}: {message}"
+                        )
+            job_stats.count("groups", len(group_keys))
+            log(
+                f"partition {partition + 1}: {len(group_keys)} groups, "
+                f"{len(points)} points, {time.perf_counter() - start:.2f} s"
+            )
+        writer.close()
+    finally:
+        partitions.close()
+        if output is not sys.stdout:
+            output.close()
+
+    log(_format_stats("job (wall time)", job_stats))
+    log(_format_stats("hulls (summed over workers)", stats))
+    return 1 if job_stats.counters.get("failed_groups") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
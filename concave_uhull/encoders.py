@@ -0,0 +1,573 @@
+import json
+from typing import (
+    IO,
+    BinaryIO,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from concave_uhull.alpha_shape import AlphaShapeArrays
+from concave_uhull.geometry import ring_parents
+
+
+class MultiPolygonArrays(NamedTuple):
+    """
+    Multipolygons in the flat layout of GeoArrow: the coordinates of the vertices of
+    all rings concatenated in a single buffer, delimited by three levels of offsets.
+    The vertices of the ring i are those between the ring offsets i and i + 1, the
+    rings of the polygon j are those between the polygon offsets j and j + 1, whose
+    first ring is the shell and the other rings are its holes, and the polygons of the
+    multipolygon k are those between the geometry offsets k and k + 1.
+
+    Attributes
+    ----------
+    coordinates
+        Array of shape (m, 2) with the concatenated coordinates of the ring vertices.
+    ring_offsets
+        Integer array of shape (r + 1,) with the position in the buffer of the first
+        vertex of each ring, followed by the length of the buffer.
+    polygon_offsets
+        Integer array of shape (p + 1,) with the index of the first ring of each
+        polygon, followed by the number of rings.
+    geometry_offsets
+        Integer array of shape (g + 1,) with the index of the first polygon of each
+        multipolygon, followed by the number of polygons.
+    """
+
+    coordinates: np.ndarray
+    ring_offsets: np.ndarray
+    polygon_offsets: np.ndarray
+    geometry_offsets: np.ndarray
+
+
+# delimiters of the text encodings: around each vertex, between the coordinates of a
+# vertex, between vertices, before the first ring, between rings of a polygon,
+# between polygons, after the last ring and for an empty multipolygon
+_WKT_DELIMITERS = ("", " ", "", ", ", "MULTIPOLYGON (((", "), (", ")), ((")
+_WKT_ENDS = (")))", "MULTIPOLYGON EMPTY")
+_GEOJSON_DELIMITERS = (
+    "[",
+    ", ",
+    "]",
+    ", ",
+    '{"type": "MultiPolygon", "coordinates": [[[',
+    "], [",
+    "]], [[",
+)
+_GEOJSON_ENDS = ("]]]}", '{"type": "MultiPolygon", "coordinates": []}')
+_FEATURE_COLLECTION = ('{"type": "FeatureCollection", "features": [', "]}\n")
+
+
+def _get_polygon_rings(
+    alpha_shape: AlphaShapeArrays,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the rings of the alpha shape grouped by polygon, each shell followed by its
+    holes, along with the polygon offsets in the grouped rings. Polygons are in
+    descending order by shell area, and each hole belongs to the smallest shell that
+    contains it, as in `concave_uhull.alpha_shape.get_alpha_shape_multipolygon`.
+    """
+    is_hole = np.asarray(alpha_shape.is_hole, dtype=bool)
+    parents = ring_parents(alpha_shape.coordinates, alpha_shape.offsets)
+    polygon_of_ring = np.cumsum(~is_hole) - 1
+
+    # holes whose parent is not a shell are dropped
+    hole_parents = parents[is_hole]
+    has_shell = hole_parents >= 0
+    has_shell[has_shell] = ~is_hole[hole_parents[has_shell]]
+    polygon_of_ring[is_hole] = np.where(
+        has_shell, polygon_of_ring[hole_parents], -1
+    )
+
+    rings = np.flatnonzero(polygon_of_ring >= 0)
+    rings = rings[np.lexsort((rings, is_hole[rings], polygon_of_ring[rings]))]
+    num_rings = np.bincount(
+        polygon_of_ring[rings], minlength=int(np.sum(~is_hole))
+    )
+    return rings, np.concatenate(([0], np.cumsum(num_rings)))
+
+
+def to_multipolygon_arrays(
+    alpha_shapes: Iterable[Union[AlphaShapeArrays, Exception]]
+) -> MultiPolygonArrays:
+    """
+    Gets the flat multipolygon layout of many alpha shapes, a multipolygon per alpha
+    shape, e.g. the results of `concave_uhull.batch.batch_alpha_shape_polygons` with
+    as_arrays=True.
+
+    Parameters
+    ----------
+    alpha_shapes
+        Alpha shapes in array form. Any other item, such as the exception of a group
+        whose computation failed, gets an empty multipolygon.
+
+    Returns
+    -------
+    MultiPolygonArrays
+        The multipolygons of the alpha shapes, in the given order.
+    """
+    coordinates, ring_lengths, polygon_lengths, geometry_lengths = (
+        [np.empty((0, 2), dtype=float)],
+        [np.empty(0, dtype=np.int64)],
+        [np.empty(0, dtype=np.int64)],
+        [],
+    )
+    for alpha_shape in alpha_shapes:
+        if not isinstance(alpha_shape, AlphaShapeArrays):
+            geometry_lengths.append(0)
+            continue
+        rings, polygon_offsets = _get_polygon_rings(alpha_shape)
+        lengths = np.diff(alpha_shape.offsets)[rings]
+        grouped_offsets = np.concatenate(([0], np.cumsum(lengths)))
+        positions = np.repeat(
+            alpha_shape.offsets[:-1][rings] - grouped_offsets[:-1], lengths
+        ) + np.arange(grouped_offsets[-1])
+        coordinates.append(alpha_shape.coordinates[positions])
+        ring_lengths.append(lengths)
+        polygon_lengths.append(np.diff(polygon_offsets))
+        geometry_lengths.append(len(polygon_offsets) - 1)
+
+    def get_offsets(lengths: np.ndarray) -> np.ndarray:
+        return np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+
+    return MultiPolygonArrays(
+        coordinates=np.concatenate(coordinates).astype(float),
+        ring_offsets=get_offsets(np.concatenate(ring_lengths)),
+        polygon_offsets=get_offsets(np.concatenate(polygon_lengths)),
+        geometry_offsets=get_offsets(np.array(geometry_lengths, np.int64)),
+    )
+
+
+def _get_geometry(
+    multipolygons: MultiPolygonArrays, geometry: int = 0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the coordinates, ring offsets and polygon offsets of a single multipolygon of
+    the flat layout, with offsets starting at 0.
+    """
+    first_polygon, last_polygon = multipolygons.geometry_offsets[
+        geometry : geometry + 2
+    ]
+    polygon_offsets = multipolygons.polygon_offsets[
+        first_polygon : last_polygon + 1
+    ]
+    ring_offsets = multipolygons.ring_offsets[
+        polygon_offsets[0] : polygon_offsets[-1] + 1
+    ]
+    return (
+        multipolygons.coordinates[ring_offsets[0] : ring_offsets[-1]],
+        ring_offsets - ring_offsets[0],
+        polygon_offsets - polygon_offsets[0],
+    )
+
+
+def _insert_delimiters(
+    buffer: np.ndarray,
+    positions: np.ndarray,
+    delimiters: np.ndarray,
+    kinds: np.ndarray,
+) -> np.ndarray:
+    """
+    Inserts byte strings in a byte buffer, in a single pass: the row kinds[i] of the
+    delimiters, a matrix of bytes with a row per byte string padded with zeros, is
+    inserted at the position i. Byte strings inserted at the same position keep their
+    order.
+    """
+    is_byte = delimiters[kinds] != 0
+    return np.insert(
+        buffer,
+        np.repeat(positions, is_byte.sum(axis=1)),
+        delimiters[kinds][is_byte],
+    )
+
+
+def _get_byte_matrix(strings: Tuple[str, ...]) -> np.ndarray:
+    """Gets a matrix of bytes with a row per ASCII string, padded with zeros."""
+    width = max(max(len(string) for string in strings), 1)
+    matrix = np.zeros((len(strings), width), dtype=np.uint8)
+    for row, string in enumerate(strings):
+        matrix[row, : len(string)] = np.frombuffer(string.encode(), np.uint8)
+    return matrix
+
+
+def _format_numbers(
+    values: np.ndarray, precision: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Formats numbers as decimal text with at most the given number of decimals, without
+    trailing zeros. Gets a matrix of ASCII bytes with a row per number and the mask of
+    the bytes of each number, so that no string is created per number.
+    """
+    scale = 10**precision
+    assert np.all(np.isfinite(values)), "Coordinates must be finite"
+    assert (
+        np.max(np.abs(values), initial=0.0) * scale < 2**62
+    ), "Coordinates are too large for the precision"
+    scaled = np.rint(np.abs(values) * scale).astype(np.int64)
+    num_integer_digits = len(str(int(scaled.max(initial=0) // scale)))
+
+    # a column for the sign, the integer digits, the decimal point and the decimals
+    width = num_integer_digits + precision + 2
+    digits = np.empty((len(values), width), dtype=np.uint8)
+    mask = np.empty((len(values), width), dtype=bool)
+    digits[:, 0] = ord("-")
+    mask[:, 0] = (values < 0) & (scaled > 0)
+    for position in range(num_integer_digits):
+        power = scale * 10 ** (num_integer_digits - 1 - position)
+        digits[:, 1 + position] = ord("0") + scaled // power % 10
+        mask[:, 1 + position] = (scaled >= power) | (power == scale)
+    for position in range(precision):
+        power = 10 ** (precision - 1 - position)
+        column = num_integer_digits + 2 + position
+        digits[:, column] = ord("0") + scaled // power % 10
+        mask[:, column] = scaled % (10 * power) != 0
+    digits[:, num_integer_digits + 1] = ord(".")
+    mask[:, num_integer_digits + 1] = (
+        mask[:, num_integer_digits + 2] if precision else False
+    )
+    return digits, mask
+
+
+def _encode_text(
+    coordinates: np.ndarray,
+    ring_offsets: np.ndarray,
+    polygon_offsets: np.ndarray,
+    precision: int,
+    delimiters: Tuple[str, ...],
+    ends: Tuple[str, str],
+) -> str:
+    """
+    Encodes a multipolygon as text, with the given delimiters, formatting all the
+    coordinates at once.
+    """
+    if len(ring_offsets) < 2:
+        return ends[1]
+    assert 0 <= precision <= 15, "Precision must be between 0 and 15"
+    vertex_open, coordinate_separator, vertex_close, vertex_separator = (
+        _get_byte_matrix((delimiter,)) for delimiter in delimiters[:4]
+    )
+    x_digits, x_mask = _format_numbers(coordinates[:, 0], precision)
+    y_digits, y_mask = _format_numbers(coordinates[:, 1], precision)
+
+    # a row per vertex with the delimiters, except the separator of the last vertex
+    # of each ring
+    def broadcast(row: np.ndarray) -> np.ndarray:
+        return np.broadcast_to(row, (len(coordinates), row.shape[1]))
+
+    is_separator = broadcast(vertex_separator != 0).copy()
+    is_separator[ring_offsets[1:] - 1] = False
+    mask = np.concatenate(
+        (
+            broadcast(vertex_open != 0),
+            x_mask,
+            broadcast(coordinate_separator != 0),
+            y_mask,
+            broadcast(vertex_close != 0),
+            is_separator,
+        ),
+        axis=1,
+    )
+    text = np.concatenate(
+        (
+            broadcast(vertex_open),
+            x_digits,
+            broadcast(coordinate_separator),
+            y_digits,
+            broadcast(vertex_close),
+            broadcast(vertex_separator),
+        ),
+        axis=1,
+    )[mask]
+
+    # delimiters before each ring, either the first ring, a hole or a shell, and
+    # after the last ring
+    vertex_positions = np.concatenate(([0], np.cumsum(mask.sum(axis=1))))
+    kinds = np.full(len(ring_offsets) - 1, 1)
+    kinds[polygon_offsets[:-1]] = 2
+    kinds[0] = 0
+    text = _insert_delimiters(
+        text,
+        np.append(vertex_positions[ring_offsets[:-1]], len(text)),
+        _get_byte_matrix(delimiters[4:] + ends[:1]),
+        np.append(kinds, 3),
+    )
+    return text.tobytes().decode("ascii")
+
+
+def to_wkt(alpha_shape: AlphaShapeArrays, precision: int = 6) -> str:
+    """
+    Encodes the alpha shape as the Well-Known Text of a multipolygon.
+
+    Parameters
+    ----------
+    alpha_shape
+        Alpha shape in array form.
+
+    precision
+        Maximum number of decimals of the coordinates, from 0 to 15. Trailing zeros
+        are removed.
+
+    Returns
+    -------
+    str
+        The WKT of the multipolygon of the alpha shape, each polygon being a shell
+        followed by its holes, in descending order by shell area.
+
+    Raises
+    ------
+    AssertionError
+        If the precision is not between 0 and 15.
+        If the coordinates are not finite or too large for the precision.
+    """
+    return _encode_text(
+        *_get_geometry(to_multipolygon_arrays([alpha_shape])),
+        precision=precision,
+        delimiters=_WKT_DELIMITERS,
+        ends=_WKT_ENDS,
+    )
+
+
+def to_geojson(alpha_shape: AlphaShapeArrays, precision: int = 6) -> str:
+    """
+    Encodes the alpha shape as a GeoJSON MultiPolygon geometry.
+
+    Parameters
+    ----------
+    alpha_shape
+        Alpha shape in array form, with coordinates of the form (lng, lat).
+
+    precision
+        Maximum number of decimals of the coordinates, from 0 to 15. Trailing zeros
+        are removed. The default of 6 decimals, about 10 centimeters, follows the
+        recommendation of the GeoJSON specification.
+
+    Returns
+    -------
+    str
+        The GeoJSON of the multipolygon of the alpha shape, each polygon being a shell
+        in counterclockwise order followed by its holes in clockwise order, as required
+        by the GeoJSON specification.
+
+    Raises
+    ------
+    AssertionError
+        If the precision is not between 0 and 15.
+        If the coordinates are not finite or too large for the precision.
+
+    References
+    ----------
+    .. [1] The GeoJSON Format, https://www.rfc-editor.org/rfc/rfc7946
+    """
+    return _encode_text(
+        *_get_geometry(to_multipolygon_arrays([alpha_shape])),
+        precision=precision,
+        delimiters=_GEOJSON_DELIMITERS,
+        ends=_GEOJSON_ENDS,
+    )
+
+
+def to_wkb(alpha_shape: AlphaShapeArrays, byte_order: str = "little") -> bytes:
+    """
+    Encodes the alpha shape as the Well-Known Binary of a multipolygon.
+
+    Parameters
+    ----------
+    alpha_shape
+        Alpha shape in array form.
+
+    byte_order
+        Byte order of the WKB, either "little" (default) or "big".
+
+    Returns
+    -------
+    bytes
+        The WKB of the multipolygon of the alpha shape, each polygon being a shell
+        followed by its holes, in descending order by shell area.
+
+    Raises
+    ------
+    AssertionError
+        If the byte order is not one of "little" or "big".
+    """
+    assert byte_order in ("little", "big"), f"Unknown byte order {byte_order}"
+    coordinates, ring_offsets, polygon_offsets = _get_geometry(
+        to_multipolygon_arrays([alpha_shape])
+    )
+    endianness = "<" if byte_order == "little" else ">"
+    flag = 1 if byte_order == "little" else 0
+
+    # the header of the multipolygon and of each polygon is a byte order flag, a
+    # geometry type and a number of parts, and each ring starts with its number of
+    # points, then the coordinates follow as doubles
+    header_dtype = np.dtype(
+        [
+            ("flag", "u1"),
+            ("type", f"{endianness}u4"),
+            ("count", f"{endianness}u4"),
+        ]
+    )
+    multipolygon_header = np.array(
+        [(flag, 6, len(polygon_offsets) - 1)], dtype=header_dtype
+    )
+    ring_dtype = np.dtype(
+        [("polygon", header_dtype), ("count", f"{endianness}u4")]
+    )
+    ring_headers = np.zeros(len(ring_offsets) - 1, dtype=ring_dtype)
+    ring_headers["count"] = np.diff(ring_offsets)
+    polygon_headers = ring_headers["polygon"][polygon_offsets[:-1]]
+    polygon_headers["flag"] = flag
+    polygon_headers["type"] = 3
+    polygon_headers["count"] = np.diff(polygon_offsets)
+    ring_headers["polygon"][polygon_offsets[:-1]] = polygon_headers
+
+    # the polygon header is only written before the first ring of each polygon
+    is_byte = np.ones((len(ring_headers), ring_dtype.itemsize), dtype=bool)
+    is_byte[:, : header_dtype.itemsize] = False
+    is_byte[polygon_offsets[:-1], : header_dtype.itemsize] = True
+    header_bytes = ring_headers.view(np.uint8).reshape(-1, ring_dtype.itemsize)
+    buffer = np.insert(
+        np.frombuffer(
+            coordinates.astype(f"{endianness}f8").tobytes(), dtype=np.uint8
+        ),
+        np.repeat(16 * ring_offsets[:-1], is_byte.sum(axis=1)),
+        header_bytes[is_byte],
+    )
+    return multipolygon_header.tobytes() + buffer.tobytes()
+
+
+def _get_geojson_feature(
+    key, alpha_shape: Union[AlphaShapeArrays, Exception], precision: int = 6
+) -> str:
+    """
+    Gets the GeoJSON Feature of an alpha shape, with its key as property, or with a
+    null geometry if it is not an alpha shape.
+    """
+    geometry = (
+        to_geojson(alpha_shape, precision=precision)
+        if isinstance(alpha_shape, AlphaShapeArrays)
+        else "null"
+    )
+    properties = json.dumps({"key": key}, default=str)
+    return (
+        f'{{"type": "Feature", "properties": {properties}, '
+        f'"geometry": {geometry}}}'
+    )
+
+
+def write_geojson(
+    file: IO[str],
+    alpha_shapes: Union[Mapping, Iterable[Union[AlphaShapeArrays, Exception]]],
+    precision: int = 6,
+) -> int:
+    """
+    Writes many alpha shapes as a GeoJSON FeatureCollection, a feature at a time, so
+    that the whole collection is never held in memory, e.g. the results of
+    `concave_uhull.batch.batch_alpha_shape_polygons` with as_arrays=True.
+
+    Parameters
+    ----------
+    file
+        Text file where the GeoJSON is written.
+
+    alpha_shapes
+        Either a mapping from keys to alpha shapes in array form, or an iterable of
+        alpha shapes in array form. Any other item, such as the exception of a group
+        whose computation failed, gets a feature with a null geometry.
+
+    precision
+        Maximum number of decimals of the coordinates, see `to_geojson`.
+
+    Returns
+    -------
+    int
+        Number of features written. The "key" property of each feature is the key of
+        its alpha shape, or its index in the iterable.
+    """
+    items = (
+        alpha_shapes.items()
+        if isinstance(alpha_shapes, Mapping)
+        else enumerate(alpha_shapes)
+    )
+    file.write(_FEATURE_COLLECTION[0])
+    num_features = 0
+    for key, alpha_shape in items:
+        if num_features:
+            file.write(", ")
+        file.write(_get_geojson_feature(key, alpha_shape, precision))
+        num_features += 1
+    file.write(_FEATURE_COLLECTION[1])
+    return num_features
+
+
+def save_npz(
+    file: Union[str, BinaryIO],
+    alpha_shapes: Union[Mapping, Iterable[Union[AlphaShapeArrays, Exception]]],
+) -> None:
+    """
+    Saves many alpha shapes in the flat multipolygon layout, as the arrays of a
+    compressed numpy .npz file, see `to_multipolygon_arrays`.
+
+    Parameters
+    ----------
+    file
+        Path or binary file where the arrays are saved.
+
+    alpha_shapes
+        Either a mapping from keys to alpha shapes in array form, whose keys are saved
+        as the array "keys", or an iterable of alpha shapes in array form. Any other
+        item, such as the exception of a group whose computation failed, gets an empty
+        multipolygon.
+
+    Returns
+    -------
+    None
+        Returns None
+
+    Raises
+    ------
+    AssertionError
+        If the keys are not numbers or strings.
+    """
+    keys: Optional[np.ndarray] = None
+    if isinstance(alpha_shapes, Mapping):
+        keys = np.asarray(list(alpha_shapes))
+        assert (
+            keys.ndim == 1 and keys.dtype.kind in "biufU"
+        ), "Keys must be numbers or strings"
+        alpha_shapes = alpha_shapes.values()
+    arrays = to_multipolygon_arrays(alpha_shapes)._asdict()
+    if keys is not None:
+        arrays["keys"] = keys
+    np.savez_compressed(file, **arrays)
+
+
+def load_npz(
+    file: Union[str, BinaryIO]
+) -> Tuple[MultiPolygonArrays, Optional[np.ndarray]]:
+    """
+    Loads alpha shapes saved by `save_npz`.
+
+    Parameters
+    ----------
+    file
+        Path or binary file of the saved arrays.
+
+    Returns
+    -------
+    Tuple[MultiPolygonArrays, Optional[np.ndarray]]
+        The multipolygons of the alpha shapes, and their keys, if they were saved from
+        a mapping, otherwise None.
+    """
+    with np.load(file, allow_pickle=False) as arrays:
+        return (
+            MultiPolygonArrays(
+                *(arrays[field] for field in MultiPolygonArrays._fields)
+            ),
+            arrays["keys"] if "keys" in arrays else None,
+        )
@@ -0,0 +1,309 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+def get_alpha_fence(
+    q25: float, q75: float, alpha: float = 1.5
+) -> Tuple[float, float]:
+    """
+    Get the Tukey's fence for the given alpha (a.k.a alpha fence), from the first and
+    third quartiles of the edge lengths.
+
+    Parameters
+    ----------
+    q25
+        First quartile of the edge lengths.
+    q75
+        Third quartile of the edge lengths.
+    alpha
+        Float value responsible for determining the 'width' of Tukey's fence.
+
+    Returns
+    -------
+    Tuple[float, float]
+        Minimum and maximum acceptable lengths, exclusive.
+
+    References
+    ----------
+    .. [1] Tukey's fences, https://en.wikipedia.org/wiki/Outlier#Tukey's_fences
+    """
+    intr_qr = q75 - q25
+    return q25 - (alpha * intr_qr), q75 + (alpha * intr_qr)
+
+
+def get_critical_alphas(
+    lengths: np.ndarray, q25: float, q75: float
+) -> np.ndarray:
+    """
+    Get the critical alpha of each length, such that the Tukey's fence of any greater
+    alpha admits the length, and the fence of any other alpha rejects it.
+
+    Parameters
+    ----------
+    lengths
+        Array with the edge lengths.
+    q25
+        First quartile of the edge lengths.
+    q75
+        Third quartile of the edge lengths.
+
+    Returns
+    -------
+    np.ndarray
+        Array with the critical alpha of each length, infinite if no fence admits it,
+        as when the interquartile range is zero.
+
+    Notes
+    -----
+    A length L is inside the fence of alpha if q25 - alpha * iqr < L < q75 + alpha *
+    iqr, that is, if alpha is greater than both (L - q75) / iqr and (q25 - L) / iqr.
+    """
+    lengths = np.asarray(lengths, dtype=float)
+    intr_qr = q75 - q25
+    if intr_qr <= 0:
+        return np.full(lengths.shape, np.inf)
+    return np.maximum(lengths - q75, q25 - lengths) / intr_qr
+
+
+class QuantileEstimator(ABC):
+    """
+    Base class of the estimators of the quantiles of the edge lengths, which receive
+    the lengths in batches of any size.
+
+    Attributes
+    ----------
+    count
+        Number of values received so far.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    @abstractmethod
+    def update(self, values: np.ndarray) -> None:
+        """
+        Receives a batch of values.
+
+        Parameters
+        ----------
+        values
+            Array with the values of the batch.
+
+        Returns
+        -------
+        None
+            Returns None
+        """
+
+    @abstractmethod
+    def quantiles(self, q: Sequence[float]) -> np.ndarray:
+        """
+        Estimates quantiles of the values received so far.
+
+        Parameters
+        ----------
+        q
+            Sequence of probabilities of the quantiles to estimate, between 0 and 1.
+
+        Returns
+        -------
+        np.ndarray
+            Array with the estimated quantiles.
+        """
+
+
+class ExactQuantiles(QuantileEstimator):
+    """
+    Exact quantiles, computed from all values received, stored as float32. Values are
+    only rounded to float32, with relative error below 6e-8, and memory grows with the
+    number of values, 4 bytes each.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._batches: List[np.ndarray] = []
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float32).ravel()
+        self._batches.append(values)
+        self.count += len(values)
+
+    def quantiles(self, q: Sequence[float]) -> np.ndarray:
+        assert self.count > 0, "No values to estimate quantiles"
+        if len(self._batches) > 1:
+            self._batches = [np.concatenate(self._batches)]
+        return np.quantile(self._batches[0], q).astype(float)
+
+
+class SketchQuantiles(QuantileEstimator):
+    """
+    Streaming quantile sketch in bounded memory, made of a hierarchy of compactors. The
+    level h holds values of weight 2^h; when it exceeds k values, they are sorted and
+    every other value, starting at a random offset, is promoted to the level h + 1.
+
+    Parameters
+    ----------
+    k
+        Capacity of each level. Memory is O(k log(n / k)) values for n values received.
+    seed
+        Seed of the random offsets of the compactions.
+
+    Notes
+    -----
+    A compaction at the level h changes the rank of any value by at most 2^h, and there
+    are at most n / (k 2^h) compactions at the level h. Hence, the rank of an estimated
+    quantile is within (log2(n / k) + 1) n / k of the exact one. As the random offsets
+    make compaction errors cancel out, typical errors are much smaller, of the order of
+    sqrt(log2(n / k)) n / k.
+
+    References
+    ----------
+    .. [1] Z. Karnin, K. Lang and E. Liberty, "Optimal Quantile Approximation in
+    Streams", https://arxiv.org/abs/1603.05346
+    """
+
+    def __init__(self, k: int = 1024, seed: Optional[int] = None) -> None:
+        super().__init__()
+        self.k = k
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float32)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float32).ravel()
+        self.count += len(values)
+        self._levels[0] = np.concatenate((self._levels[0], values))
+        level = -1
+        while level + 1 < len(self._levels):
+            level += 1
+            if len(self._levels[level]) <= self.k:
+                continue
+
+            # an odd value out stays at the level, the others are compacted
+            compacted = np.sort(self._levels[level])
+            self._levels[level] = compacted[len(compacted) // 2 * 2 :]
+            promoted = compacted[
+                self._rng.integers(2) : len(compacted) // 2 * 2 : 2
+            ]
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float32))
+            self._levels[level + 1] = np.concatenate(
+                (self._levels[level + 1], promoted)
+            )
+
+    def quantiles(self, q: Sequence[float]) -> np.ndarray:
+        assert self.count > 0, "No values to estimate quantiles"
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(values_level), 2.0**level)
+                for level, values_level in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        cumulative_weights = np.cumsum(weights[order])
+        ranks = np.asarray(q, dtype=float) * cumulative_weights[-1]
+        positions = np.minimum(
+            np.searchsorted(cumulative_weights, ranks),
+            len(values) - 1,
+        )
+        return values[order][positions].astype(float)
+
+
+class ReservoirQuantiles(QuantileEstimator):
+    """
+    Quantiles of a uniform random sample of the values received, kept in a reservoir of
+    fixed size.
+
+    Parameters
+    ----------
+    size
+        Size of the reservoir. Memory is size float32 values.
+    seed
+        Seed of the random sampling.
+
+    Notes
+    -----
+    By the Dvoretzky–Kiefer–Wolfowitz inequality, the rank of every estimated quantile,
+    relative to the number of values received, is within sqrt(ln(2 / delta) / (2 size))
+    of the exact one with probability 1 - delta. For the default size, the relative
+    rank error is below 0.0062 with probability 0.999.
+
+    References
+    ----------
+    .. [1] Reservoir sampling, https://en.wikipedia.org/wiki/Reservoir_sampling
+    .. [2] Dvoretzky–Kiefer–Wolfowitz inequality,
+    https://en.wikipedia.org/wiki/Dvoretzky%E2%80%93Kiefer%E2%80%93Wolfowitz_inequality
+    """
+
+    def __init__(
+        self, size: int = 100_000, seed: Optional[int] = None
+    ) -> None:
+        super().__init__()
+        self.size = size
+        self._reservoir = np.empty(size, dtype=np.float32)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float32).ravel()
+
+        # the reservoir is filled with the first values
+        filled = min(self.count, self.size)
+        fill = min(self.size - filled, len(values))
+        self._reservoir[filled : filled + fill] = values[:fill]
+        self.count += fill
+
+        # the value of position t replaces a random value of the reservoir with
+        # probability size / t, see [1]
+        remaining = values[fill:]
+        positions = self.count + np.arange(1, len(remaining) + 1)
+        is_sampled = self._rng.random(len(remaining)) < self.size / positions
+        replaced = self._rng.integers(
+            0, self.size, np.count_nonzero(is_sampled)
+        )
+        self._reservoir[replaced] = remaining[is_sampled]
+        self.count += len(remaining)
+
+    def quantiles(self, q: Sequence[float]) -> np.ndarray:
+        assert self.count > 0, "No values to estimate quantiles"
+        sample = self._reservoir[: min(self.count, self.size)]
+        return np.quantile(sample, q).astype(float)
+
+
+_QUANTILE_ESTIMATORS = {
+    "exact": ExactQuantiles,
+    "sketch": SketchQuantiles,
+    "reservoir": ReservoirQuantiles,
+}
+
+
+def get_quantile_estimator(
+    fence: Union[str, Callable[[], QuantileEstimator]] = "exact"
+) -> QuantileEstimator:
+    """
+    Get a new estimator of the quantiles of the edge lengths.
+
+    Parameters
+    ----------
+    fence
+        Either the name of an estimator, "exact", "sketch" or "reservoir", with default
+        parameters, or a callable that returns a new estimator, such as
+        functools.partial(ReservoirQuantiles, size=10_000).
+
+    Returns
+    -------
+    QuantileEstimator
+        A new estimator, without values.
+
+    Raises
+    ------
+    AssertionError
+        If the name of the estimator is unknown.
+    """
+    if isinstance(fence, str):
+        assert (
+            fence in _QUANTILE_ESTIMATORS
+        ), f"Unknown quantile estimator {fence}"
+        return _QUANTILE_ESTIMATORS[fence]()
+    return fence()
@@ -1,33 +1,106 @@
-from typing import List, Tuple
+import math
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
 from scipy.spatial import Delaunay
 
+# radius of Earth in kilometers
+_RADIUS_EARTH = 6371000.0 / 1000.0
 
-def euclidean_distance(coord1: Tuple, coord2: Tuple) -> float:
+
+def euclidean_distance(
+    coord1: Union[Tuple, np.ndarray],
+    coord2: Union[Tuple, np.ndarray],
+    dtype: Optional[type] = None,
+) -> Union[float, np.ndarray]:
     """
     Calculate the Euclidean distance between coordinates.
 
     Parameters
     ----------
     coord1
-        Tuple of coordinates of the source point.
+        Tuple of coordinates of the source point, or array of shape (..., 2) with the
+        coordinates of many source points.
     coord2
-        Tuple of coordinates of the target point.
+        Tuple of coordinates of the target point, or array of shape (..., 2) with the
+        coordinates of many target points, broadcastable with the source points.
+    dtype
+        Floating point type of the computation with arrays, e.g. np.float32 to halve
+        memory traffic. By default, float64.
 
     Returns
     -------
-    float
-        Euclid distance between source and target points.
+    Union[float, np.ndarray]
+        Euclid distance between source and target points, or array of shape (...)
+        with the distance between each pair of points, for array coordinates.
 
     References
     ----------
     .. [1] Euclidean distance, https://en.wikipedia.org/wiki/Euclidean_distance
     """
-    return np.hypot(coord1[0] - coord2[0], coord1[1] - coord2[1])
+    if not isinstance(coord1, np.ndarray) and not isinstance(
+        coord2, np.ndarray
+    ):
+        return math.hypot(coord1[0] - coord2[0], coord1[1] - coord2[1])
+    coords1: np.ndarray = np.asarray(coord1, dtype=dtype or float)
+    coords2: np.ndarray = np.asarray(coord2, dtype=dtype or float)
+    return np.hypot(
+        coords1[..., 0] - coords2[..., 0], coords1[..., 1] - coords2[..., 1]
+    )
 
 
-def haversine_distance(coord1: Tuple, coord2: Tuple) -> float:
+def haversine_distance_radians(
+    coord1: Union[Tuple, np.ndarray],
+    coord2: Union[Tuple, np.ndarray],
+) -> Union[float, np.ndarray]:
+    """
+    Calculate the Haversine distance between coordinates in radians, e.g. converted
+    once with np.radians for many distance computations.
+
+    Parameters
+    ----------
+    coord1
+        Tuple of (lng, lat) coordinates of the source point, in radians, or array of
+        shape (..., 2) with the coordinates of many source points.
+    coord2
+        Tuple of (lng, lat) coordinates of the target point, in radians, or array of
+        shape (..., 2) with the coordinates of many target points, broadcastable with
+        the source points.
+
+    Returns
+    -------
+    Union[float, np.ndarray]
+        Haversine distance between coordinates in kilometers, or array of shape (...)
+        with the distance between each pair of points, for array coordinates.
+
+    See Also
+    --------
+    haversine_distance : Calculate the Haversine distance between coordinates.
+    """
+    if not isinstance(coord1, np.ndarray) and not isinstance(
+        coord2, np.ndarray
+    ):
+        lon1, lat1 = coord1
+        lon2, lat2 = coord2
+        a = math.sin((lat2 - lat1) / 2.0) ** 2 + math.cos(lat1) * math.cos(
+            lat2
+        ) * (math.sin((lon2 - lon1) / 2.0) ** 2)
+        return _RADIUS_EARTH * 2 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+
+    coords1, coords2 = np.asarray(coord1), np.asarray(coord2)
+    lon1, lat1 = coords1[..., 0], coords1[..., 1]
+    lon2, lat2 = coords2[..., 0], coords2[..., 1]
+    a = np.square(np.sin((lat2 - lat1) / 2.0)) + np.cos(lat1) * np.cos(
+        lat2
+    ) * np.square(np.sin((lon2 - lon1) / 2.0))
+    return _RADIUS_EARTH * 2 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+
+
+def haversine_distance(
+    coord1: Union[Tuple, np.ndarray],
+    coord2: Union[Tuple, np.ndarray],
+    dtype: Optional[type] = None,
+) -> Union[float, np.ndarray]:
     """
     Calculate the Haversine distance between coordinates.
 
@@ -38,38 +111,184 @@ def haversine_distance(coord1: Tuple, coord2: Tuple) -> float:
     Parameters
     ----------
     coord1
-        Tuple of coordinates of the source point.
+        Tuple of coordinates of the source point, or array of shape (..., 2) with the
+        coordinates of many source points.
     coord2
-        Tuple of coordinates of the target point.
+        Tuple of coordinates of the target point, or array of shape (..., 2) with the
+        coordinates of many target points, broadcastable with the source points.
+    dtype
+        Floating point type of the computation with arrays, e.g. np.float32 to halve
+        memory traffic, at the cost of an error of about a meter. By default, float64.
 
     Returns
     -------
-    float
-        Haversine distance between coordinates in kilometers.
+    Union[float, np.ndarray]
+        Haversine distance between coordinates in kilometers, or array of shape (...)
+        with the distance between each pair of points, for array coordinates.
+
+    See Also
+    --------
+    haversine_distance_radians : Calculate the Haversine distance between coordinates
+        in radians.
 
     References
     ----------
     .. [1] Haversine formula, https://en.wikipedia.org/wiki/Haversine_formula
     """
     # Coordinates in decimal degrees (e.g. 2.89078, 12.79797)
-    lon1, lat1 = coord1
-    lon2, lat2 = coord2
+    if not isinstance(coord1, np.ndarray) and not isinstance(
+        coord2, np.ndarray
+    ):
+        return haversine_distance_radians(
+            (math.radians(coord1[0]), math.radians(coord1[1])),
+            (math.radians(coord2[0]), math.radians(coord2[1])),
+        )
+    return haversine_distance_radians(
+        np.radians(np.asarray(coord1, dtype=dtype or float)),
+        np.radians(np.asarray(coord2, dtype=dtype or float)),
+    )
+
+
+# Distance functions shipped with the package, which broadcast over arrays of
+# coordinates, see `get_vectorized_distance`.
+_BROADCASTING_DISTANCES = (
+    euclidean_distance,
+    haversine_distance,
+    haversine_distance_radians,
+)
+
+# Coordinates of the rows used to probe whether a custom distance broadcasts.
+_PROBE_COORDS1 = np.array([[0.0, 0.0], [1.0, 2.0], [-3.0, 0.5]])
+_PROBE_COORDS2 = np.array([[1.0, 1.0], [2.0, -1.0], [0.5, 4.0]])
+
+
+def _is_broadcasting_distance(distance: Callable) -> bool:
+    """
+    Checks whether a custom distance function broadcasts over arrays of shape (n, 2),
+    by comparing its result on a few rows with the distances of each pair of rows.
+    """
+    try:
+        with np.errstate(all="ignore"):
+            distances = np.asarray(distance(_PROBE_COORDS1, _PROBE_COORDS2))
+    except Exception:
+        return False
+    expected = [
+        distance(tuple(coord1), tuple(coord2))
+        for coord1, coord2 in zip(
+            _PROBE_COORDS1.tolist(), _PROBE_COORDS2.tolist()
+        )
+    ]
+    return distances.shape == (len(expected),) and bool(
+        np.allclose(distances, expected, rtol=1e-4, equal_nan=True)
+    )
+
+
+def get_vectorized_distance(distance: Callable) -> Callable:
+    """
+    Get the array version of a distance function. An array version receives two
+    arrays of shape (n, 2) and returns an array of shape (n,) with the distance between
+    the coordinates on each row.
+
+    The package distance functions broadcast over arrays. Any other distance function
+    may provide its own array version in a `vectorized` attribute. Otherwise, it is
+    probed on a few rows: if it broadcasts, it is used as is, and if not, the scalar
+    function is applied to each pair of rows.
+
+    Parameters
+    ----------
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices.
+
+    Returns
+    -------
+    Callable
+        Function that receives two arrays of coordinates of shape (n, 2) and returns
+        the distances between them, row by row.
+    """
+    if distance in _BROADCASTING_DISTANCES:
+        return distance
+    if hasattr(distance, "vectorized"):
+        return getattr(distance, "vectorized")
+    if _is_broadcasting_distance(distance):
+        return distance
+
+    def _vectorized_distance(
+        coords1: np.ndarray, coords2: np.ndarray
+    ) -> np.ndarray:
+        """Apply the scalar distance function to each pair of rows."""
+        return np.fromiter(
+            (
+                distance(coord1, coord2)
+                for coord1, coord2 in zip(
+                    map(tuple, coords1.tolist()), map(tuple, coords2.tolist())
+                )
+            ),
+            dtype=float,
+            count=len(coords1),
+        )
+
+    return _vectorized_distance
+
+
+def orient_simplices(points: np.ndarray, simplices: np.ndarray) -> np.ndarray:
+    """
+    Orient triangles in counterclockwise order. Triangles whose vertices are in
+    clockwise order are flipped, in place.
+
+    Parameters
+    ----------
+    points
+        Array of shape (n, 2) with the coordinates of the points.
+    simplices
+        Integer array of shape (m, 3), where each row holds the indices, in the given
+        points, of the vertices of a triangle.
+
+    Returns
+    -------
+    np.ndarray
+        The given simplices, with the vertices of each triangle in counterclockwise
+        order.
+    """
+    p1, p2, p3 = (points[simplices[:, j]] for j in range(3))
+    clockwise = (p2[:, 0] - p1[:, 0]) * (p3[:, 1] - p1[:, 1]) - (
+        p3[:, 0] - p1[:, 0]
+    ) * (p2[:, 1] - p1[:, 1]) < 0
+    simplices[clockwise] = simplices[clockwise][:, [0, 2, 1]]
+    return simplices
 
-    # radius of Earth in kilometers
-    radius_earth = 6371000.0 / 1000.0
 
-    # Haversine Formula
-    phi_1 = np.radians(lat1)
-    phi_2 = np.radians(lat2)
-    delta_phi = np.radians(lat2 - lat1)
-    delta_lambda = np.radians(lon2 - lon1)
-    a = np.square(np.sin(delta_phi / 2.0)) + np.cos(phi_1) * np.cos(
-        phi_2
-    ) * np.square(np.sin(delta_lambda / 2.0))
-    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+def delaunay_simplices(
+    coordinates_points: Union[List[Tuple], np.ndarray]
+) -> np.ndarray:
+    """
+    Get the indices of the vertices of the triangles of a Delaunay triangulation of the
+    coordinates of the points. Vertices of each triangle are given in counterclockwise
+    order.
 
-    # output distance in kilometers
-    return radius_earth * c
+    Parameters
+    ----------
+    coordinates_points
+        List of point coordinates or array of shape (n, 2).
+
+    Returns
+    -------
+    np.ndarray
+        Integer array of shape (m, 3), where each row holds the indices, in the given
+        coordinates, of the vertices of a triangle.
+
+    References
+    ----------
+    .. [1] scipy.spatial.Delaunay,
+    https://docs.scipy.org/doc/scipy/reference/generated/scipy.spatial.Delaunay.html
+
+    Notes
+    -----
+    qhull does not guarantee the orientation of the simplices, so triangles in
+    clockwise order are flipped.
+    """
+    points = np.asarray(coordinates_points, dtype=float)
+    return orient_simplices(points, Delaunay(points).simplices)
 
 
 def delaunay_triangulation(coordinates_points: List[Tuple]) -> List:
@@ -93,9 +312,7 @@ def delaunay_triangulation(coordinates_points: List[Tuple]) -> List:
     .. [2] scipy.spatial.Delaunay,
     https://docs.scipy.org/doc/scipy/reference/generated/scipy.spatial.Delaunay.html
     """
-    delaunay_triangulation_indices = Delaunay(
-        np.array(coordinates_points)
-    ).simplices
+    delaunay_triangulation_indices = delaunay_simplices(coordinates_points)
     return [
         (
             coordinates_points[idx1],
@@ -106,31 +323,342 @@ def delaunay_triangulation(coordinates_points: List[Tuple]) -> List:
     ]
 
 
-def area_of_polygon(coordinates_polygon_vertices: List[Tuple]) -> float:
+def equal_area_projection(coordinates: np.ndarray) -> np.ndarray:
+    """
+    Project (lng, lat) coordinates, in decimal degrees, with the Lambert cylindrical
+    equal-area projection of a sphere of the radius of Earth. Areas in the projected
+    plane are the areas on the sphere, in square kilometers.
+
+    Parameters
+    ----------
+    coordinates
+        Array of shape (n, 2) with the (lng, lat) coordinates of the points.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n, 2) with the projected coordinates of the points, in
+        kilometers.
+
+    References
+    ----------
+    .. [1] Lambert cylindrical equal-area projection,
+    https://en.wikipedia.org/wiki/Lambert_cylindrical_equal-area_projection
+    """
+    coordinates = np.asarray(coordinates, dtype=float)
+    return np.column_stack(
+        (
+            _RADIUS_EARTH * np.radians(coordinates[:, 0]),
+            _RADIUS_EARTH * np.sin(np.radians(coordinates[:, 1])),
+        )
+    )
+
+
+def local_projection(
+    coordinates: np.ndarray,
+    projection: str = "local",
+    center: Optional[Tuple[float, float]] = None,
+) -> np.ndarray:
+    """
+    Project (lng, lat) coordinates, in decimal degrees, to a local metric plane around
+    a center, where the Euclidean distance between nearby points approximates the
+    Haversine distance, in kilometers.
+
+    Parameters
+    ----------
+    coordinates
+        Array of shape (n, 2) with the (lng, lat) coordinates of the points.
+    projection
+        Either "local" (default), for the equirectangular projection with the
+        parallel of the center as standard parallel, or "azimuthal_equidistant",
+        which preserves the distances from the center to every point.
+    center
+        Tuple of (lng, lat) coordinates of the center of the projection. By default,
+        the mean of the coordinates.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n, 2) with the projected coordinates of the points, in
+        kilometers.
+
+    Raises
+    ------
+    AssertionError
+        If the projection is not one of "local" or "azimuthal_equidistant".
+
+    References
+    ----------
+    .. [1] Equirectangular projection,
+    https://en.wikipedia.org/wiki/Equirectangular_projection
+    .. [2] Azimuthal equidistant projection,
+    https://en.wikipedia.org/wiki/Azimuthal_equidistant_projection
+
+    Notes
+    -----
+    Both projections distort distances and areas away from the center, by less than
+    1% within about 100 km of the center at mid latitudes. Points must not straddle
+    the antimeridian.
+    """
+    assert projection in (
+        "local",
+        "azimuthal_equidistant",
+    ), f"Unknown projection {projection}"
+    coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+    if center is None:
+        center = (
+            tuple(coordinates.mean(axis=0)) if len(coordinates) else (0, 0)
+        )
+    lng0, lat0 = np.radians(center)
+    lng, lat = np.radians(coordinates[:, 0]), np.radians(coordinates[:, 1])
+    if projection == "local":
+        return _RADIUS_EARTH * np.column_stack(
+            ((lng - lng0) * np.cos(lat0), lat - lat0)
+        )
+
+    # angular distance c from the center, and the scale factor c / sin(c) of the
+    # projection, which tends to 1 at the center
+    cos_dlng = np.cos(lng - lng0)
+    cos_c = np.sin(lat0) * np.sin(lat) + np.cos(lat0) * np.cos(lat) * cos_dlng
+    c = np.arccos(np.clip(cos_c, -1.0, 1.0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = np.where(c > 0, c / np.sin(c), 1.0)
+    return _RADIUS_EARTH * np.column_stack(
+        (
+            scale * np.cos(lat) * np.sin(lng - lng0),
+            scale
+            * (
+                np.cos(lat0) * np.sin(lat)
+                - np.sin(lat0) * np.cos(lat) * cos_dlng
+            ),
+        )
+    )
+
+
+def areas_of_rings(
+    coordinates: np.ndarray,
+    offsets: np.ndarray,
+    geodesic: bool = False,
+    signed: bool = False,
+) -> np.ndarray:
+    """
+    Calculate the areas of many rings at once using Shoelace formula. The coordinates of
+    the vertices of all rings are concatenated in a single buffer, and the vertices of
+    the ring i are those between the offsets i and i + 1 of the buffer.
+
+    Parameters
+    ----------
+    coordinates
+        Array of shape (m, 2) with the concatenated coordinates of the ring vertices.
+        Rings may repeat their first vertex at the end or not.
+    offsets
+        Integer array of shape (r + 1,), with the position in the buffer of the first
+        vertex of each ring, followed by the length of the buffer.
+    geodesic
+        If True, coordinates are taken as (lng, lat) in decimal degrees and areas are
+        calculated on an equal-area projection of Earth, in square kilometers.
+        Otherwise, areas are planar, in squared units of the coordinates.
+    signed
+        If True, areas of rings in counterclockwise order are positive and areas of
+        rings in clockwise order are negative. Otherwise, absolute areas are returned.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (r,) with the area of each ring.
+
+    See Also
+    --------
+    area_of_polygon : Calculate area of polygon using Shoelace formula.
+    equal_area_projection : Project (lng, lat) coordinates with the Lambert cylindrical
+        equal-area projection.
+
+    References
+    ----------
+    .. [1] Shoelace formula, https://en.wikipedia.org/wiki/Shoelace_formula
+    """
+    coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if geodesic:
+        coordinates = equal_area_projection(coordinates)
+    starts, ends = offsets[:-1], offsets[1:]
+    areas = np.zeros(len(starts))
+    not_empty = ends > starts
+    if not np.any(not_empty):
+        return areas
+
+    # each vertex is followed by the next vertex of its ring, the last vertex of a
+    # ring is followed by the first one
+    successor = np.arange(1, len(coordinates) + 1)
+    successor[ends[not_empty] - 1] = starts[not_empty]
+    x, y = coordinates[:, 0], coordinates[:, 1]
+    cross_products = x * y[successor] - x[successor] * y
+
+    # segment sums of the cross products of each ring
+    areas[not_empty] = 0.5 * np.add.reduceat(cross_products, starts[not_empty])
+    return areas if signed else np.abs(areas)
+
+
+def ring_parents(
+    coordinates: np.ndarray,
+    offsets: np.ndarray,
+    chunk_size: int = 2**22,
+) -> np.ndarray:
+    """
+    Get the nesting tree of many rings at once: the parent of each ring is the
+    smallest ring that contains it, such as the shell of a hole, or the hole of an
+    island inside it. Rings must not cross each other, as the rings of an alpha shape.
+
+    Parameters
+    ----------
+    coordinates
+        Array of shape (m, 2) with the concatenated coordinates of the ring vertices.
+        Rings may repeat their first vertex at the end or not.
+    offsets
+        Integer array of shape (r + 1,), with the position in the buffer of the first
+        vertex of each ring, followed by the length of the buffer.
+    chunk_size
+        Maximum number of pairs of an edge and a test point processed at once, which
+        bounds the memory of the sweep.
+
+    Returns
+    -------
+    np.ndarray
+        Integer array of shape (r,) with the index of the parent of each ring, or -1
+        for the outermost rings.
+
+    See Also
+    --------
+    areas_of_rings : Calculate the areas of many rings at once using Shoelace formula.
+
+    Notes
+    -----
+    Each ring is represented by the midpoint of its first edge, which is inside or
+    outside every other ring, even when rings touch at a vertex. The rings that contain
+    a midpoint are found by ray casting with a sweep over the x axis: the midpoints are
+    sorted by x, so that each edge is only tested against the midpoints within its x
+    range, and a ring contains a midpoint when an odd number of its edges cross the
+    vertical ray above the midpoint. The short edges of alpha shapes span few
+    midpoints, so the cost is close to O(m log r), instead of the O(m r) of testing
+    every ring against every other ring.
+    """
+    coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    starts, ends = offsets[:-1], offsets[1:]
+    num_rings = len(starts)
+    parents = np.full(num_rings, -1, dtype=np.int64)
+    has_edge = ends - starts > 1
+    if not np.any(has_edge):
+        return parents
+
+    # edges of all rings, the last vertex of a ring is followed by the first one
+    not_empty = ends > starts
+    successor = np.arange(1, len(coordinates) + 1)
+    successor[ends[not_empty] - 1] = starts[not_empty]
+    edge_rings = np.repeat(np.arange(num_rings), ends - starts)
+    x1, y1 = coordinates[:, 0], coordinates[:, 1]
+    x2, y2 = x1[successor], y1[successor]
+
+    # test points, sorted by x, and the range of test points of each edge, such
+    # that min(x1, x2) <= x < max(x1, x2)
+    test_rings = np.flatnonzero(has_edge)
+    test_points = 0.5 * (
+        coordinates[starts[test_rings]] + coordinates[starts[test_rings] + 1]
+    )
+    order = np.argsort(test_points[:, 0], kind="stable")
+    test_rings, test_points = test_rings[order], test_points[order]
+    lows = np.searchsorted(test_points[:, 0], np.minimum(x1, x2))
+    highs = np.searchsorted(test_points[:, 0], np.maximum(x1, x2))
+    counts = highs - lows
+
+    # crossings of the edges with the vertical rays above the test points, keyed
+    # by test point and ring of the edge, in chunks of bounded size
+    crossing_keys = []
+    edges = np.flatnonzero(counts)
+    bounds = np.searchsorted(
+        np.cumsum(counts[edges]),
+        np.arange(chunk_size, counts.sum() + chunk_size, chunk_size),
+        side="right",
+    )
+    for chunk in np.split(edges, np.unique(np.minimum(bounds, len(edges)))):
+        if not len(chunk):
+            continue
+        pair_edges = np.repeat(chunk, counts[chunk])
+        pair_points = (
+            np.arange(len(pair_edges))
+            - np.repeat(
+                np.cumsum(counts[chunk]) - counts[chunk], counts[chunk]
+            )
+            + lows[pair_edges]
+        )
+        px, py = test_points[pair_points, 0], test_points[pair_points, 1]
+        edge_y = y1[pair_edges] + (px - x1[pair_edges]) * (
+            y2[pair_edges] - y1[pair_edges]
+        ) / (x2[pair_edges] - x1[pair_edges])
+        is_crossing = (py < edge_y) & (
+            edge_rings[pair_edges] != test_rings[pair_points]
+        )
+        crossing_keys.append(
+            pair_points[is_crossing] * num_rings
+            + edge_rings[pair_edges[is_crossing]]
+        )
+
+    # a ring contains a test point if an odd number of its edges cross its ray,
+    # and the parent of a ring is the smallest ring that contains its test point
+    if not crossing_keys:
+        return parents
+    keys, num_crossings = np.unique(
+        np.concatenate(crossing_keys), return_counts=True
+    )
+    keys = keys[num_crossings % 2 == 1]
+    children, containers = test_rings[keys // num_rings], keys % num_rings
+    areas = areas_of_rings(coordinates, offsets)
+    by_area = np.lexsort((areas[containers], children))
+    children, containers = children[by_area], containers[by_area]
+    is_first = np.ones(len(children), dtype=bool)
+    is_first[1:] = children[1:] != children[:-1]
+    parents[children[is_first]] = containers[is_first]
+    return parents
+
+
+def area_of_polygon(
+    coordinates_polygon_vertices: Union[List[Tuple], np.ndarray],
+    geodesic: bool = False,
+) -> float:
     """
     Calculate area of polygon using Shoelace formula.
 
     Parameters
     ----------
     coordinates_polygon_vertices
-        List of tuples representing the coordinates of the polygon's vertices.
+        List of tuples, or array of shape (n, 2), representing the coordinates of the
+        polygon's vertices.
+    geodesic
+        If True, coordinates are taken as (lng, lat) in decimal degrees and the area is
+        calculated on an equal-area projection of Earth, in square kilometers.
+        Otherwise, the area is planar, in squared units of the coordinates.
 
     Returns
     -------
     float
         Area of polygon calculated using Shoelace Formula.
 
+    See Also
+    --------
+    areas_of_rings : Calculate the areas of many rings at once using Shoelace formula.
+
     References
     ----------
     .. [1] Shoelace formula, https://en.wikipedia.org/wiki/Shoelace_formula#Other_formulas
     """
     # get coordinates of vertices
-    x, y = zip(*coordinates_polygon_vertices)
+    coordinates = np.asarray(coordinates_polygon_vertices, dtype=float)
+    if geodesic:
+        coordinates = equal_area_projection(coordinates)
+    x, y = coordinates[:, 0], coordinates[:, 1]
 
     # variation of the Shoelace formula, see [1].
-    area = 0.0
-    for i in range(-1, len(coordinates_polygon_vertices) - 1):
-        area += x[i] * (y[i + 1] - y[i - 1])
+    area = np.dot(x, np.roll(y, -1) - np.roll(y, 1))
 
     # Return area
-    return 0.5 * abs(area)
+    return 0.5 * abs(float(area))
@@ -1,34 +1,70 @@
 from collections import defaultdict
 from heapq import heappop, heappush
-from typing import Dict, List, Set, Tuple
+from typing import (
+    Callable,
+    DefaultDict,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from concave_uhull.stats import _NULL_STATS, PipelineStats
 
 
 class Graph:
     """
     A utility class for edge-induced graph structure, supports edge addition
-    and removal operations.
+    and removal operations. Nodes can be any hashable object, such as tuples of
+    coordinates or vertex indices. Edge weights are either computed with the weight
+    function or given along with the edge list.
     """
 
-    def __init__(self, edge_list, weight_function):
-        self.adjacency_set = defaultdict(set)
-        self.weight = defaultdict(dict)
-        self.nodes = set()
+    def __init__(
+        self,
+        edge_list: Iterable,
+        weight_function: Optional[Callable] = None,
+        edge_weights: Optional[Iterable[float]] = None,
+    ):
+        self.adjacency_set: DefaultDict = defaultdict(set)
+        self.weight: DefaultDict = defaultdict(dict)
+        self.nodes: Set = set()
+
+        # edge weights are either given or computed with the weight function
+        assert (weight_function is None) != (
+            edge_weights is None
+        ), "Either weight_function or edge_weights must be given"
+        if isinstance(edge_list, np.ndarray):
+            edge_list = edge_list.tolist()
+        if edge_weights is None:
+            edge_weights = (
+                weight_function(source, target)  # type: ignore
+                for source, target in edge_list
+            )
+        elif isinstance(edge_weights, np.ndarray):
+            edge_weights = edge_weights.tolist()
 
-        for source, target in edge_list:
+        for (source, target), weight in zip(edge_list, edge_weights):
             self.add_edge(
                 edge_source=source,
                 edge_target=target,
-                edge_weight=weight_function(source, target),
+                edge_weight=weight,
             )
 
-    def __getitem__(self, node: Tuple) -> set:
+    def __getitem__(self, node: Hashable) -> set:
         return self.adjacency_set[node]
 
     def __len__(self) -> int:
         return len(self.nodes)
 
     def add_edge(
-        self, edge_source: Tuple, edge_target: Tuple, edge_weight: float
+        self, edge_source: Hashable, edge_target: Hashable, edge_weight: float
     ) -> None:
         """
         Adds nodes and edges to the undirected graph's adjacency set, as well as
@@ -37,9 +73,9 @@ class Graph:
         Parameters
         ----------
         edge_source
-            Tuple with the coordinates of the source of the edge.
+            Source node of the edge, such as a tuple of coordinates or a vertex index.
         edge_target
-            Tuple with the coordinates of the target of the edge.
+            Target node of the edge, such as a tuple of coordinates or a vertex index.
         edge_weight
             A weight for the edge formed by the nodes.
 
@@ -75,8 +111,8 @@ class Graph:
 
     def remove_edge(
         self,
-        edge_source: Tuple,
-        edge_target: Tuple,
+        edge_source: Hashable,
+        edge_target: Hashable,
     ) -> None:
         """
         Remove edge from undirected graph adjacency set. In addition, it removes
@@ -85,9 +121,9 @@ class Graph:
         Parameters
         ----------
         edge_source
-            Tuple with the coordinates of the source of the edge.
+            Source node of the edge, such as a tuple of coordinates or a vertex index.
         edge_target
-            Tuple with the coordinates of the target of the edge.
+            Target node of the edge, such as a tuple of coordinates or a vertex index.
 
         Returns
         -------
@@ -116,10 +152,260 @@ class Graph:
         del self.weight[edge_target][edge_source]
 
 
+class _CompactGraphWeights:
+    """
+    Read-only view of the edge weights of a CompactGraph, with the same indexing as
+    the weight attribute of the Graph class: weight[source][target].
+    """
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: "CompactGraph"):
+        self._graph = graph
+
+    def __getitem__(self, node: int) -> Dict[int, float]:
+        slots = self._graph._alive_slots(node)
+        return dict(
+            zip(
+                self._graph._indices[slots].tolist(),
+                self._graph._weights[slots].tolist(),
+            )
+        )
+
+
+class CompactGraph:
+    """
+    An array-backed alternative to the Graph class, for large edge-induced graphs whose
+    nodes are integer vertex indices. Adjacency is stored in compressed sparse row
+    (CSR) layout, with int32 neighbor indices and float64 edge weights, and removed
+    edges are marked in a tombstone mask instead of being deleted. It supports the
+    same edge addition and removal operations and indexing as the Graph class.
+
+    Notes
+    -----
+    Edges added after construction are kept aside and merged into the CSR arrays on
+    the next read, which rebuilds the arrays. The class is meant for graphs built in
+    bulk from an edge list, followed by reads and edge removals.
+    """
+
+    __slots__ = (
+        "nodes",
+        "weight",
+        "_indptr",
+        "_indices",
+        "_weights",
+        "_removed",
+        "_added",
+    )
+
+    def __init__(
+        self,
+        edge_list: Iterable,
+        weight_function: Optional[Callable] = None,
+        edge_weights: Optional[Iterable[float]] = None,
+    ):
+        # edge weights are either given or computed with the weight function
+        assert (weight_function is None) != (
+            edge_weights is None
+        ), "Either weight_function or edge_weights must be given"
+        edges = np.asarray(edge_list, dtype=np.int64).reshape(-1, 2)
+        if edge_weights is None:
+            edge_weights = [
+                weight_function(source, target)  # type: ignore
+                for source, target in edges.tolist()
+            ]
+        if not isinstance(edge_weights, np.ndarray):
+            edge_weights = np.fromiter(edge_weights, dtype=np.float64)
+        weights = edge_weights.astype(np.float64, copy=False)
+
+        self.nodes: Set = set(np.unique(edges).tolist())
+        self.weight = _CompactGraphWeights(self)
+        self._added: List = []
+        self._build(edges, weights)
+
+    def _build(self, edges: np.ndarray, weights: np.ndarray) -> None:
+        """Builds the CSR arrays of the undirected graph from its edges."""
+        edge_keys = edges.min(axis=1) * (
+            int(edges.max(initial=0)) + 1
+        ) + edges.max(axis=1)
+        assert len(np.unique(edge_keys)) == len(
+            edge_keys
+        ), "Edge list has repeated edges"
+        sources = np.concatenate((edges[:, 0], edges[:, 1]))
+        targets = np.concatenate((edges[:, 1], edges[:, 0]))
+        order = np.argsort(sources, kind="stable")
+        num_nodes = int(sources.max()) + 1 if len(sources) else 0
+        self._indptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(sources, minlength=num_nodes)))
+        )
+        self._indices = targets[order].astype(np.int32)
+        self._weights = np.concatenate((weights, weights))[order]
+        self._removed = np.zeros(len(self._indices), dtype=bool)
+
+    def _merge_added_edges(self) -> None:
+        """Rebuilds the CSR arrays with the edges added after construction."""
+        alive = np.flatnonzero(~self._removed)
+        sources = np.repeat(
+            np.arange(len(self._indptr) - 1), np.diff(self._indptr)
+        )[alive]
+        targets = self._indices[alive].astype(np.int64)
+        weights = self._weights[alive]
+
+        # each undirected edge is kept once, from its smaller node
+        once = sources < targets
+        edges = np.concatenate(
+            (
+                np.column_stack((sources[once], targets[once])),
+                np.array([edge for edge, _ in self._added], dtype=np.int64),
+            )
+        )
+        weights = np.concatenate(
+            (weights[once], [weight for _, weight in self._added])
+        )
+        self._added = []
+        self._build(edges, weights)
+
+    def _alive_slots(self, node: int) -> np.ndarray:
+        """Gets the positions, in the CSR arrays, of the edges of the node."""
+        if self._added:
+            self._merge_added_edges()
+        if not 0 <= node < len(self._indptr) - 1:
+            return np.empty(0, dtype=np.int64)
+        slots = np.arange(self._indptr[node], self._indptr[node + 1])
+        return slots[~self._removed[slots]]
+
+    def __getitem__(self, node: int) -> set:
+        slots = self._alive_slots(node)
+        return set(self._indices[slots].tolist())
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add_edge(
+        self, edge_source: int, edge_target: int, edge_weight: float
+    ) -> None:
+        """
+        Adds nodes and edges to the undirected graph, as well as the weight of the added
+        edge.
+
+        Parameters
+        ----------
+        edge_source
+            Vertex index of the source of the edge.
+        edge_target
+            Vertex index of the target of the edge.
+        edge_weight
+            A weight for the edge formed by the nodes.
+
+        Returns
+        -------
+        None
+            Returns None
+
+        Raises
+        ------
+        AssertionError
+            If the edge already exists in the undirected graph.
+        """
+        # assertions about edge existence
+        assert (
+            edge_target not in self[edge_source]
+        ), f"Edge ({edge_source}, {edge_target}) already exists"
+        assert (
+            edge_source not in self[edge_target]
+        ), f"Edge ({edge_target}, {edge_source}) already exists"
+
+        # add nodes, the edge is merged into the CSR arrays on the next read
+        self.nodes.add(edge_source)
+        self.nodes.add(edge_target)
+        self._added.append(((edge_source, edge_target), edge_weight))
+
+    def remove_edge(self, edge_source: int, edge_target: int) -> None:
+        """
+        Remove edge from undirected graph, by marking both of its directions as removed
+        in the tombstone mask.
+
+        Parameters
+        ----------
+        edge_source
+            Vertex index of the source of the edge.
+        edge_target
+            Vertex index of the target of the edge.
+
+        Returns
+        -------
+        None
+            Returns None
+
+        Raises
+        ------
+        AssertionError
+            If the edge does not exist in the undirected graph.
+        """
+        for source, target in (
+            (edge_source, edge_target),
+            (edge_target, edge_source),
+        ):
+            slots = self._alive_slots(source)
+            slots = slots[self._indices[slots] == target]
+            assert len(slots) > 0, f"No edge ({source}, {target}) to remove"
+            self._removed[slots[0]] = True
+
+
+def _best_first_search(
+    graph: Union[Graph, CompactGraph],
+    edge_source: Hashable,
+    edge_target: Hashable,
+    heuristic: Optional[Callable] = None,
+    stats: Optional[PipelineStats] = None,
+) -> Tuple[Dict, Dict]:
+    """
+    Best-first search shared by Dijkstra's and A* algorithms. Nodes are explored in
+    increasing order of their distance from the source node, plus the heuristic
+    estimate of their distance to the target node, if a heuristic is given.
+
+    Distances and predecessors are only stored for the nodes reached by the search,
+    distances of the remaining nodes default to infinity. Therefore, the cost of a
+    search depends on the size of the explored region and not on the size of the graph.
+    The number of pops and the maximum size of the heap are recorded in the stats.
+    """
+    distance: DefaultDict = defaultdict(lambda: float("inf"))
+    distance[edge_source] = 0.0
+    explored: Set = set()
+    heap: List = [(0.0, edge_source)]
+    predecessors: Dict = dict()
+    pops, max_heap_size = 0, 1
+    while heap:
+        _, node = heappop(heap)
+        pops += 1
+        if node == edge_target:
+            break
+        if node in explored:
+            continue
+        explored.add(node)
+        distance_node = distance[node]
+        for neighbor, weight in graph.weight[node].items():
+            distance_neighbor = distance_node + weight
+            if distance_neighbor < distance[neighbor]:
+                distance[neighbor] = distance_neighbor
+                priority = distance_neighbor
+                if heuristic is not None:
+                    priority += heuristic(neighbor, edge_target)
+                heappush(heap, (priority, neighbor))
+                predecessors[neighbor] = node
+
+        # the heap only grows while the neighbors are pushed
+        if len(heap) > max_heap_size:
+            max_heap_size = len(heap)
+    (stats or _NULL_STATS).record_search(pops, max_heap_size)
+    return distance, predecessors
+
+
 def dijkstra_algorithm(
-    graph: Graph,
-    edge_source: Tuple,
-    edge_target: Tuple,
+    graph: Union[Graph, CompactGraph],
+    edge_source: Hashable,
+    edge_target: Hashable,
+    stats: Optional[PipelineStats] = None,
 ) -> Tuple[Dict, Dict]:
     """
     Dijkstra's algorithm for the shortest path problem between a single source
@@ -130,68 +416,125 @@ def dijkstra_algorithm(
     Parameters
     ----------
     graph
-        An instance of the Graph class, an undirected weighted graph represented
-        by adjacency set.
+        An instance of the Graph or CompactGraph classes, an undirected weighted graph
+        represented by adjacency set or by compressed sparse row arrays.
     edge_source
-        Tuple with the coordinates of the source of the edge.
+        Source node of the edge, such as a tuple of coordinates or a vertex index.
     edge_target
-        Tuple with the coordinates of the target of the edge.
+        Target node of the edge, such as a tuple of coordinates or a vertex index.
+    stats
+        Optional statistics where the number of nodes popped from the heap and the
+        maximum size of the heap are recorded.
 
     Returns
     -------
     Tuple[Dict, Dict]
         distance:
             Dictionary where each key represents a destination node and the value represents
-            the shortest path distance/cost between the source node and the key node.
+            the shortest path distance/cost between the source node and the key node. Nodes
+            not reached by the search have infinite distance.
         predecessors:
             Dictionary where each key represents a target node and the value represents the
             predecessor node on the shortest path between the source node and the key node.
     """
-    explored: Set = set()
-    distance: Dict = {
-        node: float("inf") if node != edge_source else 0.0
-        for node in graph.nodes
-    }
-    heap: List = [(distance[edge_source], edge_source)]
-    predecessors: Dict = dict()
-    while heap:
-        distance_node, node = heappop(heap)
-        if node == edge_target:
-            break
-        explored.add(node)
-        for neighbor in graph[node]:
-            distance_neighbor = distance_node + graph.weight[node][neighbor]
-            if distance_neighbor < distance[neighbor]:
-                distance[neighbor] = distance_neighbor
-                heappush(heap, (distance[neighbor], neighbor))
-                predecessors[neighbor] = node
-    return distance, predecessors
+    return _best_first_search(
+        graph=graph,
+        edge_source=edge_source,
+        edge_target=edge_target,
+        stats=stats,
+    )
+
+
+def astar_algorithm(
+    graph: Union[Graph, CompactGraph],
+    edge_source: Hashable,
+    edge_target: Hashable,
+    heuristic: Callable,
+    stats: Optional[PipelineStats] = None,
+) -> Tuple[Dict, Dict]:
+    """
+    A* algorithm for the shortest path problem between a source node and a target node
+    with edges of non-negative weights. The search is guided towards the target node by
+    a heuristic estimate of the distance between nodes, such as the Euclidean or the
+    Haversine distance when nodes are coordinates and edge weights are distances.
+
+    Parameters
+    ----------
+    graph
+        An instance of the Graph or CompactGraph classes, an undirected weighted graph
+        represented by adjacency set or by compressed sparse row arrays.
+    edge_source
+        Source node of the edge, such as a tuple of coordinates or a vertex index.
+    edge_target
+        Target node of the edge, such as a tuple of coordinates or a vertex index.
+    heuristic
+        Function that receives two nodes and estimates the distance between them. To
+        obtain shortest paths, it must never overestimate the distance of the shortest
+        path between the nodes.
+    stats
+        Optional statistics where the number of nodes popped from the heap and the
+        maximum size of the heap are recorded.
+
+    Returns
+    -------
+    Tuple[Dict, Dict]
+        distance:
+            Dictionary where each key represents a node reached by the search and the value
+            represents the distance/cost of the path found between the source node and the
+            key node. Nodes not reached by the search have infinite distance.
+        predecessors:
+            Dictionary where each key represents a target node and the value represents the
+            predecessor node on the path found between the source node and the key node.
+
+    References
+    ----------
+    .. [1] A* search algorithm, https://en.wikipedia.org/wiki/A*_search_algorithm
+    """
+    return _best_first_search(
+        graph=graph,
+        edge_source=edge_source,
+        edge_target=edge_target,
+        heuristic=heuristic,
+        stats=stats,
+    )
 
 
 def shortest_path_algorithm(
-    graph: Graph,
-    edge_source: Tuple,
-    edge_target: Tuple,
-) -> List[Tuple]:
+    graph: Union[Graph, CompactGraph],
+    edge_source: Hashable,
+    edge_target: Hashable,
+    algorithm: str = "dijkstra",
+    heuristic: Optional[Callable] = None,
+    stats: Optional[PipelineStats] = None,
+) -> List[Hashable]:
     """
-    It uses Dijkstra's algorithm to obtain the shortest path between the source node
-    and the destination node. The obtained path is represented by a list of coordinates
-    of the nodes, where the first coordinate of the list is the source node and the
-    last coordinate of the list is the target node.
+    It uses Dijkstra's algorithm, or the A* algorithm, to obtain the shortest path between
+    the source node and the destination node. The obtained path is represented by a list
+    of coordinates of the nodes, where the first coordinate of the list is the source node
+    and the last coordinate of the list is the target node.
 
     Parameters
     ----------
     graph
-        An instance of the Graph class, an undirected weighted graph represented
-        by adjacency set.
+        An instance of the Graph or CompactGraph classes, an undirected weighted graph
+        represented by adjacency set or by compressed sparse row arrays.
     edge_source
-        Tuple with the coordinates of the source of the edge.
+        Source node of the edge, such as a tuple of coordinates or a vertex index.
     edge_target
-        Tuple with the coordinates of the target of the edge.
+        Target node of the edge, such as a tuple of coordinates or a vertex index.
+    algorithm
+        Shortest path algorithm, either "dijkstra" (default) or "astar".
+    heuristic
+        Function that receives two nodes and estimates the distance between them,
+        required by the "astar" algorithm. For example, the Euclidean or the Haversine
+        distance, when nodes are coordinates and edge weights are distances.
+    stats
+        Optional statistics where the number of nodes popped from the heap and the
+        maximum size of the heap are recorded.
 
     Returns
     -------
-    List[Tuple]
+    List[Hashable]
         A list of coordinates of the nodes, where the first coordinate of the list is
         the source node and the last coordinate of the list is the target node.
 
@@ -200,6 +543,7 @@ def shortest_path_algorithm(
     AssertionError
         If the source node or destination node does not belong to the graph.
         If there is no path between source node and destination node.
+        If the algorithm is unknown, or it is "astar" and no heuristic is given.
     """
     # assertion about both nodes belong to the graph
     assertion_msg = (
@@ -208,10 +552,26 @@ def shortest_path_algorithm(
     assert edge_source in graph.nodes, assertion_msg
     assert edge_target in graph.nodes, assertion_msg
 
-    # get path cost and predecessor nodes using dijkstra's algorithm
-    distances, predecessors = dijkstra_algorithm(
-        graph=graph, edge_source=edge_source, edge_target=edge_target
-    )
+    # get path cost and predecessor nodes using the chosen algorithm
+    assert algorithm in ("dijkstra", "astar"), f"Unknown algorithm {algorithm}"
+    if algorithm == "astar":
+        assert (
+            heuristic is not None
+        ), "The astar algorithm requires a heuristic"
+        distances, predecessors = astar_algorithm(
+            graph=graph,
+            edge_source=edge_source,
+            edge_target=edge_target,
+            heuristic=heuristic,
+            stats=stats,
+        )
+    else:
+        distances, predecessors = dijkstra_algorithm(
+            graph=graph,
+            edge_source=edge_source,
+            edge_target=edge_target,
+            stats=stats,
+        )
 
     # assertion about no path connecting the nodes
     assert distances[edge_target] != float(
@@ -226,3 +586,122 @@ def shortest_path_algorithm(
         current_edge = predecessors[current_edge]
         path.append(current_edge)
     return path[::-1]
+
+
+def _split_ring(ring: List[int]) -> List[List[int]]:
+    """
+    Splits a closed walk, whose first vertex is repeated at the end, into simple
+    cycles at its repeated vertices. Every cycle keeps the direction of the walk, so
+    its orientation tells shells from holes. The walk starts from its smallest
+    half-edge, so that the cycles do not depend on where it was entered.
+    """
+    num_vertices = len(ring) - 1
+    start = min(
+        range(num_vertices), key=lambda index: (ring[index], ring[index + 1])
+    )
+    ring = ring[start:-1] + ring[: start + 1]
+    cycles: List[List[int]] = []
+    path: List[int] = []
+    position_in_path: Dict[int, int] = {}
+    for vertex in ring[:-1]:
+        if vertex not in position_in_path:
+            position_in_path[vertex] = len(path)
+            path.append(vertex)
+            continue
+        start = position_in_path[vertex]
+        cycles.append(path[start:] + [vertex])
+        for removed in path[start + 1 :]:
+            del position_in_path[removed]
+        del path[start + 1 :]
+    if path:
+        cycles.append(path + [path[0]])
+    return cycles
+
+
+def trace_boundary_rings(
+    half_edges: np.ndarray,
+    coordinates: np.ndarray,
+) -> List[List[int]]:
+    """
+    Traces the rings formed by oriented boundary half-edges, such as the boundary edges of
+    a triangulation whose triangles are in counterclockwise order. Each half-edge is
+    followed by a half-edge leaving its target vertex, so every ring is obtained by
+    walking the half-edges, each of them exactly once.
+
+    Parameters
+    ----------
+    half_edges
+        Integer array of shape (k, 2), where each row holds the indices of the source and
+        target vertices of a half-edge. Every vertex must have as many half-edges leaving
+        it as arriving at it.
+    coordinates
+        Array of shape (n, 2) with the coordinates of the vertices, used to choose the
+        turn at pinch vertices.
+
+    Returns
+    -------
+    List[List[int]]
+        A list of simple rings, each one a list of vertex indices where the first
+        vertex is repeated at the end of the list.
+
+    Raises
+    ------
+    AssertionError
+        If a half-edge arrives at a vertex that has no half-edge leaving it.
+
+    Notes
+    -----
+    A pinch vertex has more than one half-edge leaving it. When arriving at a pinch
+    vertex from a vertex u, the half-edge taken is the first one found rotating
+    clockwise from the direction of u. This turn keeps apart islands that touch at a
+    pinch vertex, but walks from a shell into a hole that touches it, and no local
+    turn separates both cases. Each walk is therefore split at its repeated vertices
+    into simple rings, whose orientation tells shells from holes.
+    """
+    half_edges = np.asarray(half_edges, dtype=np.int64).reshape(-1, 2)
+    sources, targets = half_edges[:, 0], half_edges[:, 1]
+
+    # half-edges grouped by source vertex, as in a compressed sparse row layout
+    order = np.argsort(sources, kind="stable")
+    out_degree = np.bincount(sources, minlength=len(coordinates))
+    out_start = np.concatenate(([0], np.cumsum(out_degree)))
+    assert np.all(
+        out_degree[targets] > 0
+    ), "Boundary half-edges do not form closed rings"
+
+    # successor of each half-edge, trivial when its target has a single
+    # half-edge leaving it
+    successor = order[out_start[targets]]
+    for edge in np.flatnonzero(out_degree[targets] > 1).tolist():
+        source, pinch = sources[edge], targets[edge]
+        candidates = order[out_start[pinch] : out_start[pinch + 1]]
+        back = coordinates[source] - coordinates[pinch]
+        forward = coordinates[targets[candidates]] - coordinates[pinch]
+        clockwise_angle = np.mod(
+            np.arctan2(back[1], back[0])
+            - np.arctan2(forward[:, 1], forward[:, 0]),
+            2.0 * np.pi,
+        )
+        clockwise_angle[clockwise_angle == 0.0] = 2.0 * np.pi
+        successor[edge] = candidates[np.argmin(clockwise_angle)]
+
+    # every ring is a cycle of the successor permutation
+    rings: List[List[int]] = []
+    visited = [False] * len(half_edges)
+    successor_list = successor.tolist()
+    sources_list = sources.tolist()
+    for start in range(len(half_edges)):
+        if visited[start]:
+            continue
+        ring = []
+        edge = start
+        while not visited[edge]:
+            visited[edge] = True
+            ring.append(sources_list[edge])
+            edge = successor_list[edge]
+        ring.append(ring[0])
+        if len(set(ring)) < len(ring) - 1:
+            rings.extend(_split_ring(ring))
+        else:
+            rings.append(ring)
+    return rings
@@ -0,0 +1,563 @@
+from typing import Callable, List, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.spatial import Delaunay
+
+from concave_uhull.alpha_shape import (
+    AlphaShapeArrays,
+    _get_boundary_edges,
+    _get_side_lengths,
+    _get_sorted_alpha_shape_arrays,
+    _is_alpha_triangle,
+)
+from concave_uhull.fence import (
+    QuantileEstimator,
+    get_alpha_fence,
+    get_quantile_estimator,
+)
+from concave_uhull.geometry import haversine_distance, orient_simplices
+from concave_uhull.graph import trace_boundary_rings
+
+
+def _get_triangle_keys(simplices: np.ndarray) -> np.ndarray:
+    """
+    Gets a key for each triangle that does not depend on the order of its vertices,
+    to match the triangles of successive triangulations.
+    """
+    sorted_simplices = np.ascontiguousarray(
+        np.sort(simplices, axis=1), dtype=np.int64
+    )
+    return sorted_simplices.view(np.dtype((np.void, 24))).ravel()
+
+
+def _get_edge_keys(edges: np.ndarray) -> np.ndarray:
+    """
+    Gets a key for each edge that does not depend on the order of its vertices, to
+    match the edges of successive triangulations.
+    """
+    sorted_edges = np.ascontiguousarray(np.sort(edges, axis=1), dtype=np.int64)
+    return sorted_edges.view(np.dtype((np.void, 16))).ravel()
+
+
+def _get_sides(
+    simplices: np.ndarray, is_alpha: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the sides of the triangles, as in `_get_side_lengths`, and the orientation
+    of each side of an alpha triangle: 1 if it goes from its smallest vertex index to
+    the largest one, -1 otherwise, and 0 for the sides of the other triangles.
+    """
+    sides = simplices[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).astype(np.int64)
+    orientations = np.where(sides[:, 0] < sides[:, 1], 1, -1) * np.repeat(
+        is_alpha, 3
+    )
+    return sides, orientations
+
+
+def _get_sorted_quantiles(
+    sorted_values: np.ndarray, q: Sequence[float]
+) -> np.ndarray:
+    """
+    Gets the quantiles of sorted values, interpolated linearly as `np.quantile`,
+    without sorting them again.
+    """
+    positions = np.asarray(q, dtype=float) * (len(sorted_values) - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (positions - lower) * (
+        sorted_values[upper] - sorted_values[lower]
+    )
+
+
+class IncrementalAlphaShape:
+    """
+    Alpha shape of a growing set of points, such as a continuous GPS feed. New points
+    are added to an incremental Delaunay triangulation, and only the triangles created
+    by them, and the rings touching them, are recomputed.
+
+    The Tukey's fence is kept from the last full computation, while the quartiles of
+    the edge lengths of the current triangles are tracked exactly, inserting the
+    lengths of the created edges and removing those of the destroyed ones. When they
+    drift from the quartiles of the last full computation by more than the tolerance,
+    relative to the interquartile range of the fence, the alpha shape is fully
+    recomputed with a new fence.
+
+    Parameters
+    ----------
+    points
+        Array of shape (n, 2) with the initial point coordinates. At least three of
+        them must not be collinear.
+
+    alpha
+        Float value responsible for determining the 'width' of Tukey's fence.
+
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices. By default, we use the Haversine
+        distance function, as we assume that the coordinates of the vertices are of
+        the form (lng, lat).
+
+    tolerance
+        Maximum drift of the quartiles of the edge lengths, relative to the
+        interquartile range of the fence, before a full recomputation.
+
+    fence
+        Estimator of the quartiles of the edge lengths at each full computation, see
+        `concave_uhull.fence.get_quantile_estimator`.
+
+    See Also
+    --------
+    concave_uhull.alpha_shape.alpha_shape_arrays : Provides the polygons representing the
+        concave hull of the given array of points, in array form.
+
+    Notes
+    -----
+    Vertex indices of the alpha shape arrays are positions in the concatenation of
+    all points given so far.
+
+    The triangles and the edges of the triangulation are kept in order of their keys
+    between updates, so that the triangles of the next triangulation are matched
+    without sorting them again. Each edge keeps the number of triangles that share
+    it, its length and the sum of its orientations in the alpha triangles, which is
+    not zero only for boundary edges, and whose sign gives their direction.
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        alpha: float = 1.5,
+        distance: Callable = haversine_distance,
+        tolerance: float = 0.05,
+        fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+    ):
+        self.alpha = alpha
+        self.distance = distance
+        self.tolerance = tolerance
+        self.fence = fence
+        self.full_recomputations = 0
+        self._delaunay = Delaunay(
+            np.asarray(points, dtype=float), incremental=True
+        )
+        simplices = orient_simplices(
+            self._delaunay.points, self._delaunay.simplices.copy()
+        )
+        keys = _get_triangle_keys(simplices)
+        order = np.argsort(keys)
+        self._triangle_keys = keys[order]
+        self._simplices = simplices[order]
+        self._lengths = _get_side_lengths(
+            self._delaunay.points, self._simplices, distance
+        )
+        self._recompute()
+
+    @property
+    def points(self) -> np.ndarray:
+        """Array of shape (n, 2) with all points given so far."""
+        return self._delaunay.points
+
+    def _recompute(self) -> None:
+        """
+        Recomputes the edges, the fence, the alpha triangles and all rings.
+        """
+        self.full_recomputations += 1
+        sides = (
+            self._simplices[:, [0, 1, 1, 2, 2, 0]]
+            .reshape(-1, 2)
+            .astype(np.int64)
+        )
+        (
+            self._edge_keys,
+            first_occurrence,
+            edge_of_side,
+            self._edge_counts,
+        ) = np.unique(
+            _get_edge_keys(sides),
+            return_index=True,
+            return_inverse=True,
+            return_counts=True,
+        )
+        edge_of_side = edge_of_side.ravel()
+        self._edge_lengths = self._lengths.ravel()[first_occurrence]
+        self._sorted_lengths = np.sort(self._edge_lengths)
+        self._tracked_quartiles = _get_sorted_quantiles(
+            self._sorted_lengths, [0.25, 0.75]
+        )
+
+        quantile_estimator = get_quantile_estimator(self.fence)
+        quantile_estimator.update(self._edge_lengths)
+        self._quartiles = quantile_estimator.quantiles([0.25, 0.75])
+        q25, q75 = self._quartiles
+        self._is_alpha = _is_alpha_triangle(
+            self._lengths, get_alpha_fence(q25, q75, self.alpha)
+        )
+        _, orientations = _get_sides(self._simplices, self._is_alpha)
+        self._edge_orientations = np.bincount(
+            edge_of_side, weights=orientations, minlength=len(self._edge_keys)
+        ).astype(np.int64)
+
+        boundary_edges = _get_boundary_edges(
+            self._simplices[self._is_alpha], len(self.points)
+        )
+        self._set_rings(
+            trace_boundary_rings(
+                half_edges=boundary_edges, coordinates=self.points
+            )
+        )
+
+    def _set_rings(
+        self,
+        rings: List[List[int]],
+        kept: Tuple[np.ndarray, np.ndarray] = (
+            np.empty(0, dtype=np.int64),
+            np.zeros(1, dtype=np.int64),
+        ),
+    ) -> None:
+        """
+        Sets the alpha shape arrays from the traced rings and the vertex indices and
+        offsets of the rings kept from the previous alpha shape.
+        """
+        kept_vertex_ids, kept_offsets = kept
+        vertex_ids = np.concatenate(
+            (
+                kept_vertex_ids,
+                np.array(
+                    [vertice for ring in rings for vertice in ring],
+                    dtype=np.int64,
+                ),
+            )
+        )
+        offsets = np.concatenate(
+            (
+                kept_offsets,
+                kept_offsets[-1]
+                + np.cumsum([len(ring) for ring in rings], dtype=np.int64),
+            )
+        )
+        self._alpha_shape = _get_sorted_alpha_shape_arrays(
+            points=self.points,
+            vertex_ids=vertex_ids,
+            offsets=offsets,
+            geodesic=self.distance is haversine_distance,
+        )
+
+    def update(self, points: np.ndarray) -> None:
+        """
+        Adds points to the alpha shape.
+
+        Parameters
+        ----------
+        points
+            Array of shape (k, 2) with the coordinates of the new points.
+
+        Returns
+        -------
+        None
+            Returns None
+
+        Notes
+        -----
+        The method performs the following steps to update the alpha shape:
+
+            1. Adds the points to the triangulation, and matches its triangles with
+            the previous ones, by their keys. Only the side lengths of the triangles
+            created by the new points are computed, and classified with the current
+            fence.
+
+            2. Updates the edges shared by the created and the destroyed triangles,
+            along with the sorted lengths of all edges.
+
+            3. If the quartiles of the edge lengths drift beyond the tolerance, the
+            alpha shape is fully recomputed.
+
+            4. Otherwise, rings that do not touch any vertex of a created or destroyed
+            alpha triangle are kept, and the boundary edges of the other rings and of
+            the created and destroyed alpha triangles are traced into new rings.
+        """
+        # Step 1: Adds the points to the triangulation, and matches its
+        # triangles with the previous ones.
+        self._delaunay.add_points(
+            np.asarray(points, dtype=float).reshape(-1, 2)
+        )
+        simplices = self._delaunay.simplices
+        keys = _get_triangle_keys(simplices)
+        positions = np.minimum(
+            np.searchsorted(self._triangle_keys, keys),
+            len(self._triangle_keys) - 1,
+        )
+        is_created = self._triangle_keys[positions] != keys
+        is_destroyed = np.ones(len(self._triangle_keys), dtype=bool)
+        is_destroyed[positions[~is_created]] = False
+
+        order = np.argsort(keys[is_created])
+        created_keys = keys[is_created][order]
+        created_simplices = orient_simplices(
+            self.points, simplices[is_created][order].copy()
+        )
+        created_lengths = _get_side_lengths(
+            self.points, created_simplices, self.distance
+        )
+        q25, q75 = self._quartiles
+        created_is_alpha = _is_alpha_triangle(
+            created_lengths, get_alpha_fence(q25, q75, self.alpha)
+        )
+        destroyed_simplices = self._simplices[is_destroyed]
+        destroyed_lengths = self._lengths[is_destroyed]
+        destroyed_is_alpha = self._is_alpha[is_destroyed]
+
+        # triangles stay in order of their keys
+        insert_positions = np.searchsorted(
+            self._triangle_keys[~is_destroyed], created_keys
+        )
+        for name, created in (
+            ("_triangle_keys", created_keys),
+            ("_simplices", created_simplices),
+            ("_lengths", created_lengths),
+            ("_is_alpha", created_is_alpha),
+        ):
+            setattr(
+                self,
+                name,
+                np.insert(
+                    getattr(self, name)[~is_destroyed],
+                    insert_positions,
+                    created,
+                    axis=0,
+                ),
+            )
+
+        # Step 2: Updates the edges shared by the created and the destroyed
+        # triangles.
+        self._update_edges(
+            (destroyed_simplices, destroyed_lengths, destroyed_is_alpha),
+            (created_simplices, created_lengths, created_is_alpha),
+        )
+
+        # Step 3: If the quartiles of the edge lengths drift beyond the tolerance,
+        # the alpha shape is fully recomputed.
+        drift = np.abs(
+            _get_sorted_quantiles(self._sorted_lengths, [0.25, 0.75])
+            - self._tracked_quartiles
+        )
+        if np.any(drift > self.tolerance * (q75 - q25)):
+            self._recompute()
+            return
+
+        # Step 4: Otherwise, only the rings touching changed alpha triangles are
+        # traced again.
+        changed_simplices = np.concatenate(
+            (
+                destroyed_simplices[destroyed_is_alpha],
+                created_simplices[created_is_alpha],
+            )
+        )
+        self._update_rings(changed_simplices)
+
+    def _update_edges(
+        self,
+        destroyed: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        created: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    ) -> None:
+        """
+        Updates the triangle counts and the orientations of the edges of the destroyed
+        and the created triangles, given by their simplices, side lengths and alpha
+        flags. Edges left without triangles are removed, and new edges are inserted,
+        along with their lengths.
+        """
+        destroyed_sides, destroyed_orientations = _get_sides(
+            destroyed[0], destroyed[2]
+        )
+        created_sides, created_orientations = _get_sides(
+            created[0], created[2]
+        )
+        sign = np.repeat([-1, 1], [len(destroyed_sides), len(created_sides)])
+        changed_keys, first_occurrence, changed_edge_of_side = np.unique(
+            _get_edge_keys(np.concatenate((destroyed_sides, created_sides))),
+            return_index=True,
+            return_inverse=True,
+        )
+        changed_edge_of_side = changed_edge_of_side.ravel()
+        count_changes = np.bincount(
+            changed_edge_of_side, weights=sign, minlength=len(changed_keys)
+        ).astype(np.int64)
+        orientation_changes = np.bincount(
+            changed_edge_of_side,
+            weights=sign
+            * np.concatenate((destroyed_orientations, created_orientations)),
+            minlength=len(changed_keys),
+        ).astype(np.int64)
+        changed_lengths = np.concatenate(
+            (destroyed[1].ravel(), created[1].ravel())
+        )[first_occurrence]
+
+        # changes of the existing edges, which are removed if left without triangles
+        positions = np.minimum(
+            np.searchsorted(self._edge_keys, changed_keys),
+            len(self._edge_keys) - 1,
+        )
+        is_existing = self._edge_keys[positions] == changed_keys
+        existing_positions = positions[is_existing]
+        self._edge_counts[existing_positions] += count_changes[is_existing]
+        self._edge_orientations[existing_positions] += orientation_changes[
+            is_existing
+        ]
+        removed_positions = existing_positions[
+            self._edge_counts[existing_positions] == 0
+        ]
+        removed_lengths = np.sort(self._edge_lengths[removed_positions])
+        for name in ("_edge_keys", "_edge_counts", "_edge_orientations"):
+            setattr(
+                self, name, np.delete(getattr(self, name), removed_positions)
+            )
+        self._edge_lengths = np.delete(self._edge_lengths, removed_positions)
+
+        # new edges, in order of their keys
+        insert_positions = np.searchsorted(
+            self._edge_keys, changed_keys[~is_existing]
+        )
+        for name, inserted in (
+            ("_edge_keys", changed_keys[~is_existing]),
+            ("_edge_counts", count_changes[~is_existing]),
+            ("_edge_orientations", orientation_changes[~is_existing]),
+            ("_edge_lengths", changed_lengths[~is_existing]),
+        ):
+            setattr(
+                self,
+                name,
+                np.insert(getattr(self, name), insert_positions, inserted),
+            )
+
+        # sorted lengths of all edges, where equal removed lengths are told apart
+        # by their rank among them
+        removal_positions = (
+            np.searchsorted(self._sorted_lengths, removed_lengths)
+            + np.arange(len(removed_lengths))
+            - np.searchsorted(removed_lengths, removed_lengths)
+        )
+        self._sorted_lengths = np.delete(
+            self._sorted_lengths, removal_positions
+        )
+        inserted_lengths = np.sort(changed_lengths[~is_existing])
+        self._sorted_lengths = np.insert(
+            self._sorted_lengths,
+            np.searchsorted(self._sorted_lengths, inserted_lengths),
+            inserted_lengths,
+        )
+
+    def _update_rings(self, changed_simplices: np.ndarray) -> None:
+        """
+        Keeps the rings without vertices of the changed alpha triangles and traces
+        the boundary edges of the other rings and of the changed alpha triangles into
+        new rings.
+        """
+        is_changed_vertex = np.zeros(len(self.points), dtype=bool)
+        is_changed_vertex[changed_simplices.ravel()] = True
+        vertex_ids, offsets = (
+            self._alpha_shape.vertex_ids,
+            self._alpha_shape.offsets,
+        )
+        ring_lengths = np.diff(offsets)
+        has_changed_vertex = np.zeros(len(ring_lengths), dtype=bool)
+        if len(vertex_ids):
+            has_changed_vertex = (
+                np.add.reduceat(is_changed_vertex[vertex_ids], offsets[:-1])
+                > 0
+            )
+
+        # rings touching a traced ring at a pinch vertex are traced along with it,
+        # as the rings split from a walk depend on all of its half-edges
+        while np.any(has_changed_vertex):
+            is_traced_vertex = np.zeros(len(self.points), dtype=bool)
+            is_traced_vertex[
+                vertex_ids[np.repeat(has_changed_vertex, ring_lengths)]
+            ] = True
+            touches_traced_vertex = (
+                np.add.reduceat(is_traced_vertex[vertex_ids], offsets[:-1]) > 0
+            )
+            if np.array_equal(touches_traced_vertex, has_changed_vertex):
+                break
+            has_changed_vertex = touches_traced_vertex
+
+        # vertex indices, offsets and half-edges of the kept rings
+        is_kept_vertex = np.repeat(~has_changed_vertex, ring_lengths)
+        kept_vertex_ids = vertex_ids[is_kept_vertex]
+        kept_offsets = np.concatenate(
+            ([0], np.cumsum(ring_lengths[~has_changed_vertex]))
+        )
+        is_ring_end = np.zeros(len(kept_vertex_ids), dtype=bool)
+        is_ring_end[kept_offsets[1:] - 1] = True
+        kept_edge_keys = (
+            kept_vertex_ids[:-1][~is_ring_end[:-1]] * len(self.points)
+            + kept_vertex_ids[1:][~is_ring_end[:-1]]
+        )
+
+        # the boundary edges that are not in the kept rings are edges of the other
+        # rings or of the changed alpha triangles
+        dropped_vertex_ids = vertex_ids[~is_kept_vertex]
+        is_dropped_ring_end = np.zeros(len(dropped_vertex_ids), dtype=bool)
+        is_dropped_ring_end[
+            np.cumsum(ring_lengths[has_changed_vertex]) - 1
+        ] = True
+        candidate_edges = np.concatenate(
+            (
+                np.column_stack(
+                    (dropped_vertex_ids[:-1], dropped_vertex_ids[1:])
+                )[~is_dropped_ring_end[:-1]],
+                _get_sides(
+                    changed_simplices, np.ones(len(changed_simplices), bool)
+                )[0],
+            )
+        ).astype(np.int64)
+        candidate_keys, first_occurrence = np.unique(
+            _get_edge_keys(candidate_edges), return_index=True
+        )
+        candidate_edges = np.sort(candidate_edges[first_occurrence], axis=1)
+        positions = np.minimum(
+            np.searchsorted(self._edge_keys, candidate_keys),
+            len(self._edge_keys) - 1,
+        )
+        orientations = np.where(
+            self._edge_keys[positions] == candidate_keys,
+            self._edge_orientations[positions],
+            0,
+        )
+        boundary_edges = np.where(
+            (orientations > 0)[:, None],
+            candidate_edges,
+            candidate_edges[:, ::-1],
+        )[orientations != 0]
+        edge_keys = (
+            boundary_edges[:, 0] * len(self.points) + boundary_edges[:, 1]
+        )
+        rings = trace_boundary_rings(
+            half_edges=boundary_edges[~np.isin(edge_keys, kept_edge_keys)],
+            coordinates=self.points,
+        )
+        self._set_rings(rings, kept=(kept_vertex_ids, kept_offsets))
+
+    def arrays(self) -> AlphaShapeArrays:
+        """
+        Provides the current alpha shape polygons in array form.
+
+        Returns
+        -------
+        AlphaShapeArrays
+            Coordinates of the ring vertices, their indices in the points given so far,
+            ring offsets, ring areas and hole flags.
+        """
+        return self._alpha_shape
+
+    def polygons(self) -> List[List[Tuple]]:
+        """
+        Provides the current list of alpha shape polygons.
+
+        Returns
+        -------
+        List[List[Tuple]]
+            Returns list of alpha shape polygons in descending order by polygon area.
+        """
+        coordinates = list(map(tuple, self._alpha_shape.coordinates.tolist()))
+        offsets = self._alpha_shape.offsets.tolist()
+        return [
+            coordinates[start:end]
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
@@ -0,0 +1,134 @@
+from typing import Callable, List, Tuple, Union
+
+import numpy as np
+
+from concave_uhull.alpha_shape import AlphaTriangulation
+from concave_uhull.fence import QuantileEstimator
+from concave_uhull.geometry import haversine_distance
+
+
+class HullIndex:
+    """
+    Index of the alpha shape of a set of points that answers point-in-hull queries in
+    bulk. A query point is inside the alpha shape if the Delaunay triangle that
+    contains it is an alpha triangle, so the index reuses the triangulation of the
+    alpha shape, instead of testing the points against the polygons.
+
+    Parameters
+    ----------
+    triangulation
+        Alpha triangulation of the points, whose Delaunay triangulation is reused.
+
+    alpha
+        Float value responsible for determining the 'width' of Tukey's fence.
+
+    Attributes
+    ----------
+    triangulation
+        Alpha triangulation of the points.
+    alpha
+        Alpha of the alpha shape.
+
+    See Also
+    --------
+    concave_uhull.alpha_shape.AlphaTriangulation : Delaunay triangulation of a set of
+        points, with the intermediate stages of the alpha shape.
+
+    Notes
+    -----
+    The triangle of each query point is found by scipy's Delaunay.find_simplex, which
+    walks the triangulation from the triangle of the previous query point. Queries
+    are therefore sorted in strips of a boustrophedon order, so that consecutive
+    points are close, which makes large queries over an order of magnitude faster than
+    in random order.
+    """
+
+    def __init__(self, triangulation: AlphaTriangulation, alpha: float = 1.5):
+        self.triangulation = triangulation
+        self.alpha = alpha
+
+        # find_simplex gives -1 for points outside the triangulation, which maps to
+        # the False appended to the alpha triangle mask
+        self._is_alpha_triangle = np.append(
+            triangulation.is_alpha_triangle(alpha), False
+        )
+        self._lower_bounds = triangulation.points.min(axis=0)
+        self._upper_bounds = triangulation.points.max(axis=0)
+        self._num_strips = max(int(np.sqrt(len(triangulation.simplices))), 1)
+
+    @classmethod
+    def from_points(
+        cls,
+        points: Union[List[Tuple], np.ndarray],
+        alpha: float = 1.5,
+        distance: Callable = haversine_distance,
+        fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+    ) -> "HullIndex":
+        """
+        Builds the index of the alpha shape of the given points.
+
+        Parameters
+        ----------
+        points
+            List of point coordinates or array of shape (n, 2).
+
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        distance
+            Function that receives two tuples of coordinates of vertices and obtains a
+            measure of distance between the vertices. By default, we use the Haversine
+            distance function, as we assume that the coordinates of the vertices are
+            of the form (lng, lat).
+
+        fence
+            Estimator of the quartiles of the edge lengths, see
+            `concave_uhull.fence.get_quantile_estimator`.
+
+        Returns
+        -------
+        HullIndex
+            The index of the alpha shape.
+        """
+        triangulation = AlphaTriangulation(
+            points, distance=distance, fence=fence
+        )
+        return cls(triangulation, alpha=alpha)
+
+    def _get_query_order(self, points: np.ndarray) -> np.ndarray:
+        """
+        Gets an order of the query points in horizontal strips, alternately from left
+        to right and from right to left.
+        """
+        extent = np.maximum(self._upper_bounds - self._lower_bounds, 1e-300)
+        strips = np.floor(
+            (points[:, 1] - self._lower_bounds[1])
+            / extent[1]
+            * self._num_strips
+        )
+        return np.lexsort(
+            (np.where(strips % 2 == 0, points[:, 0], -points[:, 0]), strips)
+        )
+
+    def contains(self, points: Union[List[Tuple], np.ndarray]) -> np.ndarray:
+        """
+        Checks which of the given points are inside the alpha shape.
+
+        Parameters
+        ----------
+        points
+            List of point coordinates or array of shape (m, 2) with the query points.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of shape (m,), True for the points inside the alpha shape.
+            Points on the boundary may be either inside or outside.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        simplices = np.empty(len(points), dtype=np.int64)
+        order = self._get_query_order(points)
+        simplices[order] = self.triangulation.delaunay.find_simplex(
+            points[order]
+        )
+        return self._is_alpha_triangle[simplices]
@@ -0,0 +1,112 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+# offsets of the 8 neighbors of a grid cell
+_NEIGHBOR_OFFSETS = np.array(
+    [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+)
+
+
+def _get_cell_keys(cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets an integer key for each grid cell, with a margin of one cell around the
+    occupied cells, so that the keys of their neighbors are valid as well, and the
+    key offsets of the 8 neighbors of a cell.
+    """
+    cells = cells - cells.min(axis=0) + 1
+    width, height = cells.max(axis=0) + 2
+    assert (
+        width < 2**31 and height < 2**31
+    ), "The resolution is too small for the extent of the points"
+    neighbor_key_offsets = (
+        _NEIGHBOR_OFFSETS[:, 0] * height + _NEIGHBOR_OFFSETS[:, 1]
+    )
+    return cells[:, 0] * height + cells[:, 1], neighbor_key_offsets
+
+
+def thin_points(
+    points: np.ndarray,
+    resolution: Optional[float] = None,
+    drop_interior: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Thin a set of points before computing its alpha shape. Exact duplicates are always
+    removed. With a resolution, the points are bucketed in a square grid and either
+    each cell keeps a single point, or only the interior cells, whose 8 neighbor cells
+    are all occupied, keep a single point, while the other cells keep all their points.
+
+    Parameters
+    ----------
+    points
+        Array of shape (n, 2) with the point coordinates.
+
+    resolution
+        Side of the grid cells, in units of the coordinates, e.g. decimal degrees for
+        (lng, lat) coordinates.
+
+    drop_interior
+        If True, only the points of interior cells are thinned, so that the points
+        near the boundary, which may be vertices of the alpha shape, are all kept.
+        Requires a resolution.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Array of shape (m, 2) with the kept points, and integer array of shape (m,)
+        with their indices in the given points, in ascending order.
+
+    Raises
+    ------
+    AssertionError
+        If drop_interior is True and no resolution is given.
+        If the grid has more than 2^31 cells along one axis.
+
+    Notes
+    -----
+    The kept point of a cell is one of its points, not the center of the cell, so that
+    the vertices of the alpha shape are always given points. Thinning changes the
+    edge lengths, and hence the Tukey's fence: the resolution should be close to the
+    typical distance between neighbor points.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    assert (
+        resolution is not None or not drop_interior
+    ), "Dropping interior points requires a resolution"
+    if resolution is not None and not drop_interior:
+        indices = np.arange(len(points))
+    else:
+        # the first of each run of equal points, sorted by coordinates
+        order = np.lexsort((points[:, 1], points[:, 0]))
+        sorted_points = points[order]
+        is_first = np.ones(len(points), dtype=bool)
+        is_first[1:] = np.any(sorted_points[1:] != sorted_points[:-1], axis=1)
+        indices = order[is_first]
+
+    if resolution is not None:
+        cell_keys, neighbor_key_offsets = _get_cell_keys(
+            np.floor(points[indices] / resolution).astype(np.int64)
+        )
+        occupied_keys, first_occurrence, cell_of_point = np.unique(
+            cell_keys, return_index=True, return_inverse=True
+        )
+        if not drop_interior:
+            indices = indices[first_occurrence]
+        else:
+            # a cell is interior if its 8 neighbor cells are occupied
+            neighbor_keys = occupied_keys[:, None] + neighbor_key_offsets
+            positions = np.minimum(
+                np.searchsorted(occupied_keys, neighbor_keys),
+                len(occupied_keys) - 1,
+            )
+            is_interior = np.all(
+                occupied_keys[positions] == neighbor_keys, axis=1
+            )
+            indices = np.concatenate(
+                (
+                    indices[first_occurrence[is_interior]],
+                    indices[~is_interior[cell_of_point.ravel()]],
+                )
+            )
+    indices = np.sort(indices)
+    return points[indices], indices
@@ -0,0 +1,264 @@
+from typing import Callable, Tuple
+
+import numpy as np
+
+from concave_uhull.geometry import (
+    get_vectorized_distance,
+    haversine_distance,
+    ring_parents,
+)
+
+
+def _get_heights(
+    vertices: np.ndarray,
+    segment_starts: np.ndarray,
+    segment_ends: np.ndarray,
+    distance: Callable,
+) -> np.ndarray:
+    """
+    Gets the distance of each vertex to the line through the ends of its segment: the
+    height of the triangle of the three points, whose area is given by Heron's formula
+    on the side lengths measured with the array version of the distance function.
+    Vertices of segments with coincident ends get their distance to the ends.
+    """
+    a = distance(segment_starts, vertices)
+    b = distance(vertices, segment_ends)
+    c = distance(segment_starts, segment_ends)
+
+    # numerically stable Heron's formula, with the sides sorted as z <= y <= x
+    z, y, x = np.sort(np.column_stack((a, b, c)), axis=1).T
+    area = 0.25 * np.sqrt(
+        np.maximum(
+            (x + (y + z)) * (z - (x - y)) * (z + (x - y)) * (x + (y - z)), 0.0
+        )
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(c > 0, 2.0 * area / c, a)
+
+
+def _douglas_peucker(
+    coordinates: np.ndarray,
+    offsets: np.ndarray,
+    tolerances: np.ndarray,
+    distance: Callable,
+) -> np.ndarray:
+    """
+    Gets the mask of the vertices kept by the Douglas-Peucker algorithm on every ring
+    at once, with a tolerance per ring. All the segments of all the rings are split
+    at each iteration, at their farthest vertex, while it is farther than the
+    tolerance of its ring.
+    """
+    starts, ends = offsets[:-1], offsets[1:]
+    not_empty = ends > starts
+    keep = np.zeros(len(coordinates), dtype=bool)
+    keep[starts[not_empty]] = True
+    keep[ends[not_empty] - 1] = True
+
+    segment_starts, segment_ends = starts[not_empty], ends[not_empty] - 1
+    segment_tolerances = tolerances[not_empty]
+    while True:
+        counts = segment_ends - segment_starts - 1
+        has_interior = counts > 0
+        if not np.any(has_interior):
+            return keep
+        segment_starts = segment_starts[has_interior]
+        segment_ends = segment_ends[has_interior]
+        segment_tolerances = segment_tolerances[has_interior]
+        counts = counts[has_interior]
+
+        # the interior vertices of all segments, concatenated
+        segment_offsets = np.concatenate(([0], np.cumsum(counts)))
+        segment_of_vertex = np.repeat(np.arange(len(counts)), counts)
+        vertices = (
+            np.arange(segment_offsets[-1])
+            - segment_offsets[:-1][segment_of_vertex]
+            + segment_starts[segment_of_vertex]
+            + 1
+        )
+        heights = _get_heights(
+            coordinates[vertices],
+            coordinates[segment_starts][segment_of_vertex],
+            coordinates[segment_ends][segment_of_vertex],
+            distance,
+        )
+
+        # the first farthest vertex of each segment splits it, if it is farther
+        # than the tolerance
+        max_heights = np.maximum.reduceat(heights, segment_offsets[:-1])
+        is_farthest = np.flatnonzero(heights == max_heights[segment_of_vertex])
+        _, first = np.unique(segment_of_vertex[is_farthest], return_index=True)
+        farthest = vertices[is_farthest[first]]
+        is_split = max_heights > segment_tolerances
+        farthest = farthest[is_split]
+        keep[farthest] = True
+        segment_starts, segment_ends = (
+            np.concatenate((segment_starts[is_split], farthest)),
+            np.concatenate((farthest, segment_ends[is_split])),
+        )
+        segment_tolerances = np.tile(segment_tolerances[is_split], 2)
+
+
+def _get_crossing_rings(
+    coordinates: np.ndarray, offsets: np.ndarray
+) -> np.ndarray:
+    """
+    Gets the mask of the rings that have an edge that crosses another edge, of the
+    same ring or of another ring. Edges that only touch at a vertex do not cross.
+    Candidate pairs of edges are those that share a vertical strip and whose bounding
+    boxes overlap, with strips as wide as the mean width of the edges.
+    """
+    starts, ends = offsets[:-1], offsets[1:]
+    not_empty = ends > starts
+    is_crossing_ring = np.zeros(len(starts), dtype=bool)
+
+    # edges from each vertex to the next one of its ring, except empty edges
+    successor = np.arange(1, len(coordinates) + 1)
+    successor[ends[not_empty] - 1] = starts[not_empty]
+    edge_rings = np.repeat(np.arange(len(starts)), ends - starts)
+    is_edge = np.any(coordinates != coordinates[successor], axis=1)
+    sources = coordinates[is_edge]
+    targets = coordinates[successor[is_edge]]
+    edge_rings = edge_rings[is_edge]
+    if len(sources) < 2:
+        return is_crossing_ring
+    lower = np.minimum(sources, targets)
+    upper = np.maximum(sources, targets)
+
+    # vertical strips covered by each edge
+    width = max(float(np.mean(upper[:, 0] - lower[:, 0])), 1e-12)
+    first_strips = np.floor((lower[:, 0] - lower[:, 0].min()) / width)
+    last_strips = np.floor((upper[:, 0] - lower[:, 0].min()) / width)
+    counts = (last_strips - first_strips + 1).astype(np.int64)
+    entry_edges = np.repeat(np.arange(len(sources)), counts)
+    entry_strips = first_strips[entry_edges] + (
+        np.arange(len(entry_edges))
+        - np.repeat(np.cumsum(counts) - counts, counts)
+    )
+    order = np.argsort(entry_strips, kind="stable")
+    entry_edges, entry_strips = entry_edges[order], entry_strips[order]
+
+    # pairs of entries of the same strip
+    strip_ends = np.searchsorted(entry_strips, entry_strips, side="right")
+    pair_counts = strip_ends - np.arange(len(entry_strips)) - 1
+    firsts = np.repeat(np.arange(len(entry_strips)), pair_counts)
+    seconds = (
+        firsts
+        + 1
+        + np.arange(len(firsts))
+        - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+    )
+    edges1, edges2 = entry_edges[firsts], entry_edges[seconds]
+    is_overlap = np.all(
+        (lower[edges1] <= upper[edges2]) & (lower[edges2] <= upper[edges1]),
+        axis=1,
+    )
+    edges1, edges2 = edges1[is_overlap], edges2[is_overlap]
+
+    # proper crossings, where the ends of each edge are strictly on opposite sides
+    # of the other edge
+    def orientation(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+        return np.sign(
+            (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1])
+            - (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1])
+        )
+
+    p1, q1 = sources[edges1], targets[edges1]
+    p2, q2 = sources[edges2], targets[edges2]
+    is_crossing = (orientation(p1, q1, p2) * orientation(p1, q1, q2) < 0) & (
+        orientation(p2, q2, p1) * orientation(p2, q2, q1) < 0
+    )
+    is_crossing_ring[edge_rings[edges1[is_crossing]]] = True
+    is_crossing_ring[edge_rings[edges2[is_crossing]]] = True
+    return is_crossing_ring
+
+
+def simplify_rings(
+    coordinates: np.ndarray,
+    offsets: np.ndarray,
+    tolerance: float,
+    distance: Callable = haversine_distance,
+    max_attempts: int = 8,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simplify many rings at once with the Douglas-Peucker algorithm, keeping them valid:
+    simplified rings have at least three vertices, do not cross themselves nor each
+    other, and keep their nesting, so that holes stay inside their shells.
+
+    Parameters
+    ----------
+    coordinates
+        Array of shape (m, 2) with the concatenated coordinates of the ring vertices.
+        Rings repeat their first vertex at the end.
+    offsets
+        Integer array of shape (r + 1,), with the position in the buffer of the first
+        vertex of each ring, followed by the length of the buffer.
+    tolerance
+        Maximum distance between a removed vertex and the simplified ring, in units of
+        the distance function, e.g. kilometers for the Haversine distance.
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices. By default, we use the Haversine
+        distance function, as we assume that the coordinates of the vertices are of
+        the form (lng, lat).
+    max_attempts
+        Number of times the tolerance of the invalid rings is halved, before they are
+        only simplified by removing collinear vertices.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Integer array with the positions, in the buffer, of the kept vertices, in
+        ascending order, and integer array of shape (r + 1,) with the offsets of the
+        simplified rings in the kept vertices.
+
+    References
+    ----------
+    .. [1] Ramer-Douglas-Peucker algorithm,
+    https://en.wikipedia.org/wiki/Ramer%E2%80%93Douglas%E2%80%93Peucker_algorithm
+    .. [2] Heron's formula, https://en.wikipedia.org/wiki/Heron%27s_formula
+
+    Notes
+    -----
+    The distance of a vertex to a segment is the height of their triangle, from the
+    side lengths given by the distance function, so that the tolerance is measured
+    with the same metric as the alpha shape. The segments of all the rings are split
+    together, so the number of numpy passes is the depth of the recursion of the
+    Douglas-Peucker algorithm, not the number of segments. Rings that are invalid
+    after the simplification are simplified again with half the tolerance, and the
+    crossings are detected by a sweep over vertical strips, in about linear time.
+    """
+    coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    vectorized_distance = get_vectorized_distance(distance)
+    lengths = np.diff(offsets)
+    ring_of_vertex = np.repeat(np.arange(len(lengths)), lengths)
+    tolerances = np.full(len(lengths), float(tolerance))
+    parents = ring_parents(coordinates, offsets)
+
+    for attempt in range(max_attempts + 1):
+        keep = _douglas_peucker(
+            coordinates, offsets, tolerances, vectorized_distance
+        )
+        kept_lengths = np.bincount(
+            ring_of_vertex[keep], minlength=len(lengths)
+        )
+        kept_offsets = np.concatenate(([0], np.cumsum(kept_lengths)))
+        if attempt == max_attempts:
+            break
+
+        # rings that collapsed, cross other rings or changed their nesting are
+        # invalid, along with their old and new parents
+        kept_coordinates = coordinates[keep]
+        is_invalid = (kept_lengths < 4) & (lengths >= 4)
+        is_invalid |= _get_crossing_rings(kept_coordinates, kept_offsets)
+        kept_parents = ring_parents(kept_coordinates, kept_offsets)
+        is_moved = kept_parents != parents
+        is_invalid |= is_moved
+        for moved_parents in (parents[is_moved], kept_parents[is_moved]):
+            is_invalid[moved_parents[moved_parents >= 0]] = True
+        if not np.any(is_invalid):
+            break
+        tolerances[is_invalid] = (
+            tolerances[is_invalid] / 2 if attempt < max_attempts - 1 else 0.0
+        )
+    return np.flatnonzero(keep), kept_offsets
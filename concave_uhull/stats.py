@@ -0,0 +1,210 @@
+import time
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, List, Optional
+
+
+class PipelineStats:
+    """
+    Statistics of alpha shape computations: the wall time of each stage of the
+    pipeline and counters of its intermediate results. Times and counters accumulate
+    over all the computations given the same instance.
+
+    Parameters
+    ----------
+    callback
+        Optional function called at the end of each stage with the name of the stage
+        and its wall time in seconds, e.g. to log slow stages.
+
+    Attributes
+    ----------
+    timings
+        Dictionary with the total wall time, in seconds, of each stage, in the order
+        the stages first ran.
+    counters
+        Dictionary with the total of each counter, such as the number of points,
+        simplices, alpha triangles, boundary edges and rings.
+    search_pops
+        Number of nodes popped from the heap by each shortest path search, one search
+        per ring of the "shortest_path" method.
+    max_heap_size
+        Maximum size of the heap over all the shortest path searches.
+
+    See Also
+    --------
+    concave_uhull.alpha_shape.alpha_shape_arrays : Provides the polygons representing
+        the concave hull of the given array of points, in array form.
+    """
+
+    enabled = True
+
+    def __init__(
+        self, callback: Optional[Callable[[str, float], None]] = None
+    ):
+        self.callback = callback
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.search_pops: List[int] = []
+        self.max_heap_size = 0
+
+    def stage(self, name: str) -> ContextManager[None]:
+        """
+        Gets a context manager that adds its wall time to the time of the given stage.
+
+        Parameters
+        ----------
+        name
+            Name of the stage.
+
+        Returns
+        -------
+        ContextManager[None]
+            Context manager that times the stage.
+        """
+        return _StageTimer(self, name)
+
+    def add_time(self, name: str, elapsed: float) -> None:
+        """
+        Adds the given wall time to the time of a stage.
+
+        Parameters
+        ----------
+        name
+            Name of the stage.
+
+        elapsed
+            Wall time, in seconds.
+
+        Returns
+        -------
+        None
+            Returns None
+        """
+        self.timings[name] = self.timings.get(name, 0.0) + elapsed
+        if self.callback is not None:
+            self.callback(name, elapsed)
+
+    def count(self, name: str, value: int) -> None:
+        """
+        Adds the given value to a counter.
+
+        Parameters
+        ----------
+        name
+            Name of the counter.
+
+        value
+            Value added to the counter.
+
+        Returns
+        -------
+        None
+            Returns None
+        """
+        self.counters[name] = self.counters.get(name, 0) + int(value)
+
+    def record_search(self, pops: int, max_heap_size: int) -> None:
+        """
+        Records the number of nodes popped from the heap by a shortest path search and
+        the maximum size of its heap.
+
+        Parameters
+        ----------
+        pops
+            Number of nodes popped from the heap.
+
+        max_heap_size
+            Maximum size of the heap.
+
+        Returns
+        -------
+        None
+            Returns None
+        """
+        self.search_pops.append(pops)
+        self.max_heap_size = max(self.max_heap_size, max_heap_size)
+
+    def merge(self, other: "PipelineStats") -> None:
+        """
+        Adds the statistics of another instance to these statistics, e.g. those of a
+        worker process.
+
+        Parameters
+        ----------
+        other
+            Statistics to add.
+
+        Returns
+        -------
+        None
+            Returns None
+        """
+        for name, elapsed in other.timings.items():
+            self.add_time(name, elapsed)
+        for name, value in other.counters.items():
+            self.count(name, value)
+        for pops in other.search_pops:
+            self.record_search(pops, other.max_heap_size)
+
+    @property
+    def total_time(self) -> float:
+        """Total wall time of all stages, in seconds."""
+        return sum(self.timings.values())
+
+    def as_dict(self) -> Dict:
+        """
+        Gets the statistics as a dictionary of plain values, e.g. to serialize them as
+        JSON.
+
+        Returns
+        -------
+        Dict
+            Dictionary with the timings, counters, search pops and maximum heap size.
+        """
+        return {
+            "timings": dict(self.timings),
+            "counters": dict(self.counters),
+            "search_pops": list(self.search_pops),
+            "max_heap_size": self.max_heap_size,
+        }
+
+
+class _StageTimer:
+    """Context manager that adds its wall time to the time of a stage."""
+
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats: PipelineStats, name: str):
+        self.stats = stats
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stats.add_time(self.name, time.perf_counter() - self.start)
+
+
+class _NullStats(PipelineStats):
+    """
+    Statistics that record nothing, used when no statistics are requested, so that the
+    instrumented code costs a method call per stage.
+    """
+
+    enabled = False
+    _null_context = nullcontext()
+
+    def stage(self, name: str) -> ContextManager[None]:
+        return self._null_context
+
+    def add_time(self, name: str, elapsed: float) -> None:
+        pass
+
+    def count(self, name: str, value: int) -> None:
+        pass
+
+    def record_search(self, pops: int, max_heap_size: int) -> None:
+        pass
+
+
+_NULL_STATS = _NullStats()
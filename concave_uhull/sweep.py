@@ -0,0 +1,301 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from concave_uhull.alpha_shape import (
+    AlphaShapeArrays,
+    AlphaTriangulation,
+    _get_boundary_edges,
+    _get_edges_alpha_shape_arrays,
+)
+from concave_uhull.fence import QuantileEstimator, get_critical_alphas
+from concave_uhull.geometry import areas_of_rings, haversine_distance
+
+
+class AlphaFiltration:
+    """
+    Alpha triangulations of a set of points for every alpha at once. The points are
+    triangulated, and the edge lengths and their quartiles computed, only once. Since
+    the Tukey's fence grows with alpha, each triangle has a critical alpha, above which
+    all its sides are inside the fence, and the alpha triangles of any alpha are a
+    prefix of the triangles sorted by critical alpha.
+
+    Parameters
+    ----------
+    points
+        Array of shape (n, 2) with the point coordinates.
+
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices. By default, we use the Haversine
+        distance function, as we assume that the coordinates of the vertices are of
+        the form (lng, lat).
+
+    fence
+        Estimator of the quartiles of the edge lengths, see
+        `concave_uhull.fence.get_quantile_estimator`.
+
+    Attributes
+    ----------
+    points
+        Array of shape (n, 2) with the point coordinates.
+    simplices
+        Integer array of shape (t, 3) with the triangles of the Delaunay triangulation,
+        in counterclockwise order, sorted by critical alpha.
+    critical_alphas
+        Sorted array of shape (t,) with the critical alpha of each triangle.
+
+    See Also
+    --------
+    concave_uhull.fence.get_critical_alphas : Get the critical alpha of each length.
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        distance: Callable = haversine_distance,
+        fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+    ):
+        self.points = np.asarray(points, dtype=float)
+        self.distance = distance
+        triangulation = AlphaTriangulation(
+            self.points, distance=distance, fence=fence
+        )
+        q25, q75 = triangulation.quartiles
+        critical_alphas = get_critical_alphas(
+            triangulation.edge_lengths, q25, q75
+        )[triangulation.triangle_edges].max(axis=1)
+        order = np.argsort(critical_alphas, kind="stable")
+        self.simplices = triangulation.simplices[order]
+        self.critical_alphas = critical_alphas[order]
+
+    def _get_candidate_alphas(self) -> np.ndarray:
+        """
+        Gets one non-negative alpha for each distinct set of alpha triangles, in
+        increasing order: the midpoints between consecutive critical alphas.
+        """
+        critical_alphas = np.unique(
+            self.critical_alphas[
+                np.isfinite(self.critical_alphas) & (self.critical_alphas >= 0)
+            ]
+        )
+        if not len(critical_alphas):
+            return np.zeros(1)
+        bounds = np.concatenate(
+            ([0.0], critical_alphas, [critical_alphas[-1] + 1.0])
+        )
+        return np.unique((bounds[:-1] + bounds[1:]) / 2)
+
+    def _get_triangle_areas(self) -> np.ndarray:
+        """
+        Gets the area of each triangle, geodesic when the distance is the Haversine
+        distance.
+        """
+        return areas_of_rings(
+            coordinates=self.points[self.simplices].reshape(-1, 2),
+            offsets=np.arange(0, 3 * len(self.simplices) + 1, 3),
+            geodesic=self.distance is haversine_distance,
+        )
+
+    def select_alpha(
+        self, criterion: str = "single_shell", target: Optional[float] = None
+    ) -> float:
+        """
+        Selects the smallest alpha, that is, the most concave hull, that meets the given
+        criterion, with a bisection over the alphas of the distinct sets of alpha
+        triangles.
+
+        Parameters
+        ----------
+        criterion
+            Either "single_shell" (default), for an alpha shape with a single shell,
+            possibly with holes, that covers all points, "area_ratio", for an alpha
+            shape with at least the target ratio of the area of the convex hull, or
+            "max_rings", for an alpha shape with at most the target number of rings.
+
+        target
+            Area ratio of the "area_ratio" criterion, or number of rings of the
+            "max_rings" criterion.
+
+        Returns
+        -------
+        float
+            The selected alpha. If no alpha meets the criterion, the alpha that admits
+            all triangles with finite critical alpha.
+
+        Raises
+        ------
+        AssertionError
+            If the criterion is not one of "single_shell", "area_ratio" or "max_rings".
+            If the criterion requires a target and none is given.
+
+        Notes
+        -----
+        The bisection assumes that once an alpha meets the criterion, so do all greater
+        alphas. This always holds for the area ratio, as the area of the alpha shape is
+        the sum of the areas of its triangles; for the other criteria, the selected
+        alpha meets the criterion but some smaller alpha may meet it as well. Each step
+        of the bisection costs a boundary extraction, or less, and there are O(log t)
+        steps for t triangles.
+        """
+        assert criterion in (
+            "single_shell",
+            "area_ratio",
+            "max_rings",
+        ), f"Unknown criterion {criterion}"
+
+        if criterion == "area_ratio":
+            assert (
+                target is not None
+            ), "The area_ratio criterion requires a target"
+            cumulative_areas = np.concatenate(
+                ([0.0], np.cumsum(self._get_triangle_areas()))
+            )
+            min_area = target * cumulative_areas[-1]
+
+            def meets_criterion(alpha: float) -> bool:
+                num_triangles = len(self.alpha_triangles(alpha))
+                return bool(cumulative_areas[num_triangles] >= min_area)
+
+        elif criterion == "max_rings":
+            assert (
+                target is not None
+            ), "The max_rings criterion requires a target"
+            max_rings = target
+
+            def meets_criterion(alpha: float) -> bool:
+                return len(self.arrays(alpha).areas) <= max_rings
+
+        else:
+            num_vertices = len(np.unique(self.simplices))
+
+            def meets_criterion(alpha: float) -> bool:
+                triangles = self.alpha_triangles(alpha)
+                if len(np.unique(triangles)) < num_vertices:
+                    return False
+                return int(np.count_nonzero(~self.arrays(alpha).is_hole)) == 1
+
+        # bisection for the first candidate alpha that meets the criterion
+        candidate_alphas = self._get_candidate_alphas()
+        low, high = 0, len(candidate_alphas) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if meets_criterion(float(candidate_alphas[middle])):
+                high = middle
+            else:
+                low = middle + 1
+        return float(candidate_alphas[low])
+
+    def alpha_triangles(self, alpha: float = 1.5) -> np.ndarray:
+        """
+        Provides the alpha triangles for the given alpha, in O(log t) time for t
+        triangles, as a view of the sorted triangles.
+
+        Parameters
+        ----------
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array of shape (m, 3) with the vertex indices of the alpha
+            triangles.
+        """
+        return self.simplices[
+            : np.searchsorted(self.critical_alphas, alpha, side="left")
+        ]
+
+    def arrays(self, alpha: float = 1.5) -> AlphaShapeArrays:
+        """
+        Provides the alpha shape polygons for the given alpha, in array form.
+
+        Parameters
+        ----------
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        Returns
+        -------
+        AlphaShapeArrays
+            Coordinates of the ring vertices, their indices in the points, ring
+            offsets, ring areas and hole flags.
+        """
+        return _get_edges_alpha_shape_arrays(
+            points=self.points,
+            alpha_shape_edges=_get_boundary_edges(
+                self.alpha_triangles(alpha), len(self.points)
+            ),
+            distance=self.distance,
+        )
+
+    def polygons(self, alpha: float = 1.5) -> List[List[Tuple]]:
+        """
+        Provides the list of alpha shape polygons for the given alpha.
+
+        Parameters
+        ----------
+        alpha
+            Float value responsible for determining the 'width' of Tukey's fence.
+
+        Returns
+        -------
+        List[List[Tuple]]
+            Returns list of alpha shape polygons in descending order by polygon area.
+        """
+        alpha_shape = self.arrays(alpha)
+        coordinates = list(map(tuple, alpha_shape.coordinates.tolist()))
+        offsets = alpha_shape.offsets.tolist()
+        return [
+            coordinates[start:end]
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+
+def alpha_shape_sweep(
+    points: np.ndarray,
+    alphas: Iterable[float],
+    distance: Callable = haversine_distance,
+    fence: Union[str, Callable[[], QuantileEstimator]] = "exact",
+    as_arrays: bool = False,
+) -> Dict[float, Union[List[List[Tuple]], AlphaShapeArrays]]:
+    """
+    Provides the alpha shape polygons of the given points for many alpha values, from a
+    single triangulation, with the edge lengths and their quartiles computed once.
+
+    Parameters
+    ----------
+    points
+        Array of shape (n, 2) with the point coordinates.
+
+    alphas
+        Alpha values to compute the polygons for.
+
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices. By default, we use the Haversine
+        distance function, as we assume that the coordinates of the vertices are of
+        the form (lng, lat).
+
+    fence
+        Estimator of the quartiles of the edge lengths, see
+        `concave_uhull.fence.get_quantile_estimator`.
+
+    as_arrays
+        If True, the result of each alpha is an AlphaShapeArrays instead of a list of
+        polygons.
+
+    Returns
+    -------
+    Dict[float, Union[List[List[Tuple]], AlphaShapeArrays]]
+        The alpha shape polygons of each alpha, in descending order by polygon area.
+
+    See Also
+    --------
+    AlphaFiltration : Alpha triangulations of a set of points for every alpha at once,
+        to query other alpha values later.
+    """
+    filtration = AlphaFiltration(points=points, distance=distance, fence=fence)
+    if as_arrays:
+        return {alpha: filtration.arrays(alpha) for alpha in alphas}
+    return {alpha: filtration.polygons(alpha) for alpha in alphas}
@@ -0,0 +1,387 @@
+import os
+import tempfile
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy.spatial import QhullError
+
+from concave_uhull.alpha_shape import (
+    AlphaShapeArrays,
+    AlphaTriangulation,
+    _get_boundary_edges,
+    _get_sorted_alpha_shape_arrays,
+)
+from concave_uhull.fence import QuantileEstimator, get_quantile_estimator
+from concave_uhull.geometry import haversine_distance
+from concave_uhull.graph import trace_boundary_rings
+
+# records of the tile files: the point coordinates and their index in the input
+_TILE_RECORD = np.dtype([("x", "f8"), ("y", "f8"), ("index", "i8")])
+
+
+class _TileGrid:
+    """
+    Square grid of tiles over the bounding box of the points. The tile of a position is
+    always computed with the same formula, so that ownership is never ambiguous.
+    """
+
+    def __init__(
+        self, lower: np.ndarray, upper: np.ndarray, tile_size: float
+    ) -> None:
+        self.lower = lower
+        self.tile_size = tile_size
+        self.shape = np.floor((upper - lower) / tile_size).astype(np.int64) + 1
+
+    def get_tiles(self, positions: np.ndarray) -> np.ndarray:
+        """Gets the tile index of each position, along each axis."""
+        tiles = np.floor((positions - self.lower) / self.tile_size)
+        return np.clip(tiles.astype(np.int64), 0, self.shape - 1)
+
+    def get_tile_ids(self, tiles: np.ndarray) -> np.ndarray:
+        """Gets the flat id of each tile."""
+        return tiles[:, 0] * self.shape[1] + tiles[:, 1]
+
+
+def _get_bounds(
+    points: np.ndarray, chunk_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Gets the bounding box of the points, reading them chunk by chunk."""
+    lower = np.full(2, np.inf)
+    upper = np.full(2, -np.inf)
+    for start in range(0, len(points), chunk_size):
+        chunk = np.asarray(points[start : start + chunk_size], dtype=float)
+        lower = np.minimum(lower, chunk.min(axis=0))
+        upper = np.maximum(upper, chunk.max(axis=0))
+    return lower, upper
+
+
+def _write_tiles(
+    points: np.ndarray,
+    grid: _TileGrid,
+    margin: float,
+    chunk_size: int,
+    tiles_dir: str,
+) -> None:
+    """
+    Appends each point to the file of each tile whose box, expanded by the margin,
+    contains it, reading the points chunk by chunk.
+    """
+    for start in range(0, len(points), chunk_size):
+        chunk = np.asarray(points[start : start + chunk_size], dtype=float)
+        records = np.empty(len(chunk), dtype=_TILE_RECORD)
+        records["x"], records["y"] = chunk[:, 0], chunk[:, 1]
+        records["index"] = np.arange(start, start + len(chunk))
+        lower_tiles = grid.get_tiles(chunk - margin)
+        upper_tiles = grid.get_tiles(chunk + margin)
+
+        # as the margin is smaller than the tiles, a point is in at most 2 x 2 tiles
+        is_x_split = upper_tiles[:, 0] != lower_tiles[:, 0]
+        is_y_split = upper_tiles[:, 1] != lower_tiles[:, 1]
+        tile_ids, point_ids = [], []
+        for x_tiles, y_tiles, is_tile in (
+            (lower_tiles[:, 0], lower_tiles[:, 1], np.ones(len(chunk), bool)),
+            (upper_tiles[:, 0], lower_tiles[:, 1], is_x_split),
+            (lower_tiles[:, 0], upper_tiles[:, 1], is_y_split),
+            (upper_tiles[:, 0], upper_tiles[:, 1], is_x_split & is_y_split),
+        ):
+            tiles = np.column_stack((x_tiles, y_tiles))[is_tile]
+            tile_ids.append(grid.get_tile_ids(tiles))
+            point_ids.append(np.flatnonzero(is_tile))
+        all_tile_ids = np.concatenate(tile_ids)
+        all_point_ids = np.concatenate(point_ids)
+        order = np.argsort(all_tile_ids, kind="stable")
+        all_tile_ids, all_point_ids = all_tile_ids[order], all_point_ids[order]
+        run_starts = np.flatnonzero(
+            np.diff(all_tile_ids, prepend=-1) != 0
+        ).tolist()
+        for run_start, run_end in zip(
+            run_starts, run_starts[1:] + [len(all_tile_ids)]
+        ):
+            path = os.path.join(tiles_dir, f"{all_tile_ids[run_start]}.bin")
+            with open(path, "ab") as tile_file:
+                records[all_point_ids[run_start:run_end]].tofile(tile_file)
+
+
+def _read_tile(tiles_dir: str, tile_id: int) -> np.ndarray:
+    """
+    Reads the records of the points of a tile, keeping a single record per position,
+    the one of the smallest index. As points in the same position are written to the
+    same tiles, every tile identifies them by the same index.
+    """
+    records = np.fromfile(
+        os.path.join(tiles_dir, f"{tile_id}.bin"), dtype=_TILE_RECORD
+    )
+    records = records[
+        np.lexsort((records["index"], records["y"], records["x"]))
+    ]
+    is_first = np.ones(len(records), dtype=bool)
+    is_first[1:] = (records["x"][1:] != records["x"][:-1]) | (
+        records["y"][1:] != records["y"][:-1]
+    )
+    return records[is_first]
+
+
+def _stitch_half_edges(
+    half_edges: np.ndarray, num_vertices: int
+) -> np.ndarray:
+    """
+    Stitches the boundary half-edges of all tiles: opposite half-edges of an edge
+    cancel each other out, and the half-edges that cannot be part of a closed ring,
+    where the triangulations of neighbouring tiles disagree, are removed.
+    """
+    sources, targets = half_edges[:, 0], half_edges[:, 1]
+    edge_keys = np.minimum(sources, targets) * num_vertices + np.maximum(
+        sources, targets
+    )
+    unique_keys, edge_of_half_edge = np.unique(edge_keys, return_inverse=True)
+    edge_of_half_edge = edge_of_half_edge.ravel()
+    is_forward = sources < targets
+    balance = np.bincount(
+        edge_of_half_edge,
+        weights=np.where(is_forward, 1, -1),
+        minlength=len(unique_keys),
+    ).astype(np.int64)
+
+    # each edge is kept once in the direction of its excess of half-edges, if any
+    first_vertices, second_vertices = np.divmod(unique_keys, num_vertices)
+    is_kept = balance != 0
+    stitched = np.where(
+        (balance > 0)[:, None],
+        np.column_stack((first_vertices, second_vertices)),
+        np.column_stack((second_vertices, first_vertices)),
+    )[is_kept]
+
+    # non-manifold seam vertices, with half-edges arriving and none leaving or the
+    # other way around, are pruned until every half-edge can be followed
+    while True:
+        out_degree = np.bincount(stitched[:, 0], minlength=num_vertices)
+        in_degree = np.bincount(stitched[:, 1], minlength=num_vertices)
+        is_closed = (out_degree[stitched[:, 1]] > 0) & (
+            in_degree[stitched[:, 0]] > 0
+        )
+        if is_closed.all():
+            return stitched
+        stitched = stitched[is_closed]
+
+
+def _get_tile_triangulation(
+    records: np.ndarray,
+    distance: Callable,
+    simplices: Optional[np.ndarray] = None,
+) -> Optional[AlphaTriangulation]:
+    """
+    Gets the alpha triangulation of the points of a tile, reusing its simplices if
+    given, or None if the points cannot be triangulated.
+    """
+    triangulation = AlphaTriangulation(
+        np.column_stack((records["x"], records["y"])), distance=distance
+    )
+    if simplices is not None:
+        triangulation._set_stages(simplices=simplices)
+        return triangulation
+    if len(records) < 3:
+        return None
+    try:
+        triangulation.simplices
+    except QhullError:
+        return None
+    return triangulation
+
+
+def tiled_alpha_shape_arrays(
+    points: Union[str, np.ndarray],
+    tile_size: float,
+    margin: Optional[float] = None,
+    alpha: float = 1.5,
+    distance: Callable = haversine_distance,
+    fence: Union[str, Callable[[], QuantileEstimator]] = "sketch",
+    chunk_size: int = 1_000_000,
+    temp_dir: Optional[str] = None,
+) -> AlphaShapeArrays:
+    """
+    Provides the alpha shape polygons of a set of points larger than memory, in array
+    form. The points are partitioned in square tiles, with overlap margins, written to
+    temporary files, and each tile is triangulated on its own, so that peak memory is
+    bounded by the number of points of a tile, plus the boundary edges.
+
+    Parameters
+    ----------
+    points
+        Array of shape (n, 2) with the point coordinates, such as a memory-mapped
+        array, or the path to a .npy file with such an array, which is memory-mapped.
+
+    tile_size
+        Side of the tiles, in units of the coordinates.
+
+    margin
+        Width of the overlap margin around each tile, in units of the coordinates,
+        smaller than the tile size. By default, a quarter of the tile size.
+
+    alpha
+        Float value responsible for determining the 'width' of Tukey's fence.
+
+    distance
+        Function that receives two tuples of coordinates of vertices and obtains a
+        measure of distance between the vertices. By default, we use the Haversine
+        distance function, as we assume that the coordinates of the vertices are of
+        the form (lng, lat).
+
+    fence
+        Estimator of the quartiles of the edge lengths of all tiles, which receives the
+        lengths tile by tile. By default, the "sketch" estimator, in bounded memory,
+        see `concave_uhull.fence.get_quantile_estimator`.
+
+    chunk_size
+        Number of points read at once from the input.
+
+    temp_dir
+        Directory of the temporary tile files, by default the system one.
+
+    Returns
+    -------
+    AlphaShapeArrays
+        Coordinates of the ring vertices, their indices in the given points, ring
+        offsets, ring areas and hole flags.
+
+    Raises
+    ------
+    AssertionError
+        If the margin is not smaller than the tile size.
+
+    See Also
+    --------
+    concave_uhull.alpha_shape.alpha_shape_arrays : Provides the polygons representing the
+        concave hull of the given array of points, in array form.
+
+    Notes
+    -----
+    The function performs the following steps to obtain the alpha shape arrays:
+
+        1. Reads the points chunk by chunk, to get their bounding box, and then to
+        append each point to the file of every tile whose box, expanded by the margin,
+        contains it.
+
+        2. Triangulates each tile and feeds the fence estimator with the lengths of the
+        edges whose midpoint is inside the tile, so that each edge is counted once.
+        The simplices of each tile are saved for the next step.
+
+        3. Gets the alpha triangles of each tile, with the global fence, and keeps the
+        triangles whose centroid is inside the tile, so that each triangle belongs to
+        a single tile. The boundary edges of the kept triangles are collected.
+
+        4. Stitches the boundary edges of all tiles: an edge between triangles of two
+        tiles is collected by both tiles, in opposite directions, and is removed.
+        Points in the same position are identified by the smallest of their indices,
+        so that every tile gives the same vertices to an edge. Boundary edges left
+        without a next or a previous edge, where the triangulations of neighbouring
+        tiles disagree, are removed.
+
+        5. Traces the rings formed by the remaining boundary edges, and returns them in
+        descending order by area.
+
+    The triangles of a tile are the same of the global Delaunay triangulation as long
+    as their circumcircles fit in the margin, so the margin should be several times
+    larger than the longest edge of the alpha triangles. Triangles with larger
+    circumcircles, such as those across empty regions or along the convex hull, may
+    differ, which slightly changes the estimated quartiles and the rings around them.
+    """
+    points_array: np.ndarray = (
+        np.load(points, mmap_mode="r") if isinstance(points, str) else points
+    )
+    margin = tile_size / 4 if margin is None else margin
+    assert margin < tile_size, "The margin must be smaller than the tile size"
+    geodesic = distance is haversine_distance
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as tiles_dir:
+        # Step 1: Partitions the points in tiles with overlap margins.
+        grid = _TileGrid(
+            *_get_bounds(points_array, chunk_size), tile_size=tile_size
+        )
+        _write_tiles(points_array, grid, margin, chunk_size, tiles_dir)
+        tile_ids = sorted(
+            int(name[: -len(".bin")]) for name in os.listdir(tiles_dir)
+        )
+
+        # Step 2: Feeds the fence estimator with the edges of each tile.
+        quantile_estimator = get_quantile_estimator(fence)
+        triangulated_tile_ids = []
+        for tile_id in tile_ids:
+            triangulation = _get_tile_triangulation(
+                _read_tile(tiles_dir, tile_id), distance
+            )
+            if triangulation is None:
+                continue
+            midpoints = triangulation.points[triangulation.edges].mean(axis=1)
+            is_tile_edge = (
+                grid.get_tile_ids(grid.get_tiles(midpoints)) == tile_id
+            )
+            quantile_estimator.update(triangulation.edge_lengths[is_tile_edge])
+            np.save(
+                os.path.join(tiles_dir, f"{tile_id}.simplices.npy"),
+                triangulation.simplices,
+            )
+            triangulated_tile_ids.append(tile_id)
+        quartiles = quantile_estimator.quantiles([0.25, 0.75])
+
+        # Step 3: Collects the boundary edges of the alpha triangles of each tile.
+        half_edges: List[np.ndarray] = []
+        vertex_coordinates: List[np.ndarray] = []
+        for tile_id in triangulated_tile_ids:
+            records = _read_tile(tiles_dir, tile_id)
+            triangulation = _get_tile_triangulation(
+                records,
+                distance,
+                simplices=np.load(
+                    os.path.join(tiles_dir, f"{tile_id}.simplices.npy")
+                ),
+            )
+            assert triangulation is not None
+            triangulation._set_stages(quartiles=quartiles)
+            alpha_triangles = triangulation.alpha_triangles(alpha)
+            centroids = triangulation.points[alpha_triangles].mean(axis=1)
+            is_tile_triangle = (
+                grid.get_tile_ids(grid.get_tiles(centroids)) == tile_id
+            )
+            boundary_edges = _get_boundary_edges(
+                alpha_triangles[is_tile_triangle], len(records)
+            )
+            half_edges.append(records["index"][boundary_edges])
+            vertex_coordinates.append(
+                np.column_stack((records["x"], records["y"]))[
+                    boundary_edges[:, 0]
+                ]
+            )
+
+    # Step 4: Stitches the boundary edges of all tiles, with vertex indices
+    # compacted to the boundary vertices.
+    all_half_edges = (
+        np.concatenate(half_edges)
+        if half_edges
+        else np.empty((0, 2), np.int64)
+    )
+    vertex_ids, compact_half_edges = np.unique(
+        all_half_edges, return_inverse=True
+    )
+    compact_half_edges = compact_half_edges.reshape(-1, 2)
+    coordinates = np.empty((len(vertex_ids), 2))
+    if half_edges:
+        coordinates[compact_half_edges[:, 0]] = np.concatenate(
+            vertex_coordinates
+        )
+    boundary_half_edges = _stitch_half_edges(
+        compact_half_edges, len(vertex_ids)
+    )
+
+    # Step 5: Traces the rings and returns them in descending order by area.
+    rings = trace_boundary_rings(
+        half_edges=boundary_half_edges, coordinates=coordinates
+    )
+    alpha_shape = _get_sorted_alpha_shape_arrays(
+        points=coordinates,
+        vertex_ids=np.array(
+            [vertice for ring in rings for vertice in ring], dtype=np.int64
+        ),
+        offsets=np.cumsum([0] + [len(ring) for ring in rings], dtype=np.int64),
+        geodesic=geodesic,
+    )
+    return alpha_shape._replace(vertex_ids=vertex_ids[alpha_shape.vertex_ids])
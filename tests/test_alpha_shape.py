@@ -1,8 +1,19 @@
 import numpy as np
 import pytest
 
-from concave_uhull.alpha_shape import get_alpha_shape_polygons
-from concave_uhull.geometry import area_of_polygon, euclidean_distance
+from concave_uhull.alpha_shape import (
+    AlphaTriangulation,
+    _get_alpha_shape_edges,
+    alpha_shape_arrays,
+    get_alpha_shape_multipolygon,
+    get_alpha_shape_polygons,
+)
+from concave_uhull.geometry import (
+    area_of_polygon,
+    euclidean_distance,
+    haversine_distance,
+)
+from concave_uhull.graph import CompactGraph
 
 
 @pytest.fixture
@@ -34,11 +45,14 @@ def circular_crown_set(coordinates_square_set):
     )
 
 
-def tests_get_alpha_shape_polygons_in_square_set(coordinates_square_set):
+@pytest.mark.parametrize("method", ["boundary_tracing", "shortest_path"])
+def tests_get_alpha_shape_polygons_in_square_set(
+    coordinates_square_set, method
+):
     """Test get alpha shapes polygons in the set similar to a square of side 4."""
     # get alpha shape polygons of the square set
     polygons = get_alpha_shape_polygons(
-        coordinates_square_set, distance=euclidean_distance
+        coordinates_square_set, distance=euclidean_distance, method=method
     )
 
     # at least one alpha form must be returned
@@ -50,11 +64,14 @@ def tests_get_alpha_shape_polygons_in_square_set(coordinates_square_set):
     assert np.isclose(area_of_polygon(largest_area_polygon), 16.0, atol=0.5)
 
 
-def tests_get_alpha_shape_polygons_in_circular_crown_set(circular_crown_set):
+@pytest.mark.parametrize("method", ["boundary_tracing", "shortest_path"])
+def tests_get_alpha_shape_polygons_in_circular_crown_set(
+    circular_crown_set, method
+):
     """Test get alpha shape polygons in the circular crown set."""
     # get alpha shape polygons from circular crown set
     polygons = get_alpha_shape_polygons(
-        circular_crown_set, distance=euclidean_distance
+        circular_crown_set, distance=euclidean_distance, method=method
     )
 
     # at least two alpha shapes must be returned, one for the outermost points
@@ -73,3 +90,211 @@ def tests_get_alpha_shape_polygons_in_circular_crown_set(circular_crown_set):
     second_largest_area_polygon = polygons[1]
     second_largest_area = area_of_polygon(second_largest_area_polygon)
     assert np.pi < second_largest_area < largest_area
+
+
+def tests_get_alpha_shape_edges():
+    """Test that the boundary edges of the alpha triangulation of a square, with a
+    point in the center, are the sides of the square as pairs of vertex indices."""
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.5, 0.5)]
+    edges = _get_alpha_shape_edges(points, distance=euclidean_distance)
+
+    # the four sides of the square, following the counterclockwise orientation
+    # of the triangles
+    assert sorted(map(tuple, edges.tolist())) == [
+        (0, 1),
+        (1, 2),
+        (2, 3),
+        (3, 0),
+    ]
+
+
+def tests_get_alpha_shape_polygons_unknown_method(coordinates_square_set):
+    """Test that an unknown polygon extraction method is rejected."""
+    with pytest.raises(AssertionError, match="Unknown method"):
+        get_alpha_shape_polygons(coordinates_square_set, method="unknown")
+
+
+def tests_get_alpha_shape_polygons_with_compact_graph(circular_crown_set):
+    """Test that the shortest path method gives the same polygons with both graph
+    classes."""
+    polygons = get_alpha_shape_polygons(
+        circular_crown_set, distance=euclidean_distance, method="shortest_path"
+    )
+    compact_polygons = get_alpha_shape_polygons(
+        circular_crown_set,
+        distance=euclidean_distance,
+        method="shortest_path",
+        graph_class=CompactGraph,
+    )
+    assert np.allclose(
+        sorted(map(area_of_polygon, polygons)),
+        sorted(map(area_of_polygon, compact_polygons)),
+    )
+
+
+@pytest.mark.parametrize("method", ["boundary_tracing", "shortest_path"])
+def tests_alpha_shape_arrays_in_circular_crown_set(circular_crown_set, method):
+    """Test alpha shape arrays of the circular crown set, whose two largest rings
+    are the outer shell and the inner hole."""
+    points = np.array(circular_crown_set)
+    alpha_shape = alpha_shape_arrays(
+        points, distance=euclidean_distance, method=method
+    )
+
+    # rings are delimited by offsets and are closed
+    offsets = alpha_shape.offsets
+    assert offsets[0] == 0 and offsets[-1] == len(alpha_shape.coordinates)
+    assert np.array_equal(
+        alpha_shape.coordinates[offsets[:-1]],
+        alpha_shape.coordinates[offsets[1:] - 1],
+    )
+    assert np.array_equal(
+        alpha_shape.coordinates, points[alpha_shape.vertex_ids]
+    )
+
+    # rings are in descending order by area
+    assert np.all(np.diff(alpha_shape.areas) <= 0)
+    assert np.pi < alpha_shape.areas[1] < alpha_shape.areas[0] < 2 * np.pi
+
+    # the largest ring is the outer shell, the second one is the inner hole
+    assert not alpha_shape.is_hole[0]
+    assert alpha_shape.is_hole[1]
+
+
+def tests_alpha_triangulation(circular_crown_set):
+    triangulation = AlphaTriangulation(
+        circular_crown_set, distance=euclidean_distance
+    )
+    simplices, neighbors = triangulation.simplices, triangulation.neighbors
+
+    # the neighbor opposite to each vertex shares the other two vertices
+    triangles, vertices = np.nonzero(neighbors >= 0)
+    for triangle, vertice in zip(triangles[:100], vertices[:100]):
+        shared = set(simplices[triangle]) - {simplices[triangle, vertice]}
+        assert shared < set(simplices[neighbors[triangle, vertice]])
+
+    alpha_shape = triangulation.arrays(1.5)
+    expected = alpha_shape_arrays(
+        np.asarray(circular_crown_set), distance=euclidean_distance
+    )
+    assert np.array_equal(alpha_shape.vertex_ids, expected.vertex_ids)
+    assert triangulation.polygons(1.5) == get_alpha_shape_polygons(
+        circular_crown_set, distance=euclidean_distance
+    )
+    assert len(triangulation.boundary_edges(0.0)) > len(
+        triangulation.boundary_edges(1.5)
+    )
+
+
+def tests_alpha_triangulation_with_distance(circular_crown_set):
+    triangulation = AlphaTriangulation(
+        circular_crown_set, distance=euclidean_distance
+    )
+    triangulation.alpha_triangles(1.5)
+    haversine_triangulation = triangulation.with_distance(haversine_distance)
+    assert haversine_triangulation.simplices is triangulation.simplices
+    assert "edge_lengths" not in haversine_triangulation.__dict__
+    assert np.array_equal(
+        haversine_triangulation.arrays(1.5).vertex_ids,
+        alpha_shape_arrays(np.asarray(circular_crown_set)).vertex_ids,
+    )
+
+
+@pytest.mark.parametrize("projection", ["local", "azimuthal_equidistant"])
+def tests_alpha_shape_arrays_with_projection(circular_crown_set, projection):
+    """Test alpha shape arrays of the circular crown set placed around Sao Paulo,
+    computed on a local projection, whose areas are in square kilometers."""
+    points = 0.05 * np.array(circular_crown_set) + (-46.7, -23.6)
+    alpha_shape = alpha_shape_arrays(points, projection=projection)
+    geodesic_alpha_shape = alpha_shape_arrays(points)
+
+    # ring coordinates are the given (lng, lat) coordinates
+    assert np.array_equal(
+        alpha_shape.coordinates, points[alpha_shape.vertex_ids]
+    )
+    assert not alpha_shape.is_hole[0]
+    assert alpha_shape.is_hole[1]
+    assert np.allclose(
+        alpha_shape.areas[:2], geodesic_alpha_shape.areas[:2], rtol=1e-2
+    )
+
+    polygons = get_alpha_shape_polygons(
+        list(map(tuple, points)), projection=projection
+    )
+    assert polygons[0] == list(
+        map(tuple, alpha_shape.coordinates[: alpha_shape.offsets[1]])
+    )
+
+
+def tests_get_alpha_shape_multipolygon(circular_crown_set):
+    """Test the multipolygon of the circular crown set, whose largest polygon is the
+    outer shell with the inner hole, and whose holes are all inside shells."""
+    multipolygon = get_alpha_shape_multipolygon(
+        circular_crown_set, distance=euclidean_distance
+    )
+    polygons = get_alpha_shape_polygons(
+        circular_crown_set, distance=euclidean_distance
+    )
+    alpha_shape = alpha_shape_arrays(
+        np.asarray(circular_crown_set), distance=euclidean_distance
+    )
+
+    # every ring is in the multipolygon, shells first and holes after their shell
+    rings = [ring for polygon in multipolygon for ring in polygon]
+    assert sorted(rings) == sorted(polygons)
+    assert len(multipolygon) == np.count_nonzero(~alpha_shape.is_hole)
+    assert multipolygon[0][:2] == polygons[:2]
+    for polygon in multipolygon:
+        shell_area = area_of_polygon(polygon[0])
+        assert all(area_of_polygon(hole) < shell_area for hole in polygon[1:])
+
+
+def tests_get_alpha_shape_multipolygon_of_negative_grid():
+    """Test the multipolygon of a grid in the negative quadrant, whose single shell
+    has no edge to the right of the midpoint of its first edge."""
+    points = [(-x, -y) for x in range(5) for y in range(5)]
+    multipolygon = get_alpha_shape_multipolygon(
+        points, distance=euclidean_distance
+    )
+    assert len(multipolygon) == 1 and len(multipolygon[0]) == 1
+    assert area_of_polygon(multipolygon[0][0]) == pytest.approx(16.0)
+
+
+def tests_alpha_shape_arrays_with_simplify(circular_crown_set):
+    """Test that simplified rings have fewer vertices, taken from the rings of the
+    alpha shape, and keep the shell and the hole of the circular crown set."""
+    points = np.array(circular_crown_set)
+    alpha_shape = alpha_shape_arrays(points, distance=euclidean_distance)
+    simplified = alpha_shape_arrays(
+        points, distance=euclidean_distance, simplify=0.05
+    )
+
+    assert len(simplified.areas) == len(alpha_shape.areas)
+    assert len(simplified.vertex_ids) < len(alpha_shape.vertex_ids) / 2
+    assert set(simplified.vertex_ids) <= set(alpha_shape.vertex_ids)
+    assert np.array_equal(
+        simplified.coordinates, points[simplified.vertex_ids]
+    )
+    assert np.all(np.diff(simplified.offsets) >= 4)
+    assert not simplified.is_hole[0] and simplified.is_hole[1]
+    assert np.allclose(simplified.areas[:2], alpha_shape.areas[:2], rtol=0.05)
+
+    multipolygon = get_alpha_shape_multipolygon(
+        circular_crown_set, distance=euclidean_distance, simplify=0.05
+    )
+    assert sum(map(len, multipolygon)) == len(simplified.areas)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def tests_alpha_shape_arrays_with_pinched_holes(seed):
+    """Test that boundary tracing separates the holes that touch their shell at a
+    pinch vertex, as the shortest paths do."""
+    points = np.random.default_rng(seed).uniform(0, 1, (400, 2))
+    alpha_shape = alpha_shape_arrays(points, method="boundary_tracing")
+    expected = alpha_shape_arrays(points, method="shortest_path")
+
+    assert len(alpha_shape.areas) == len(expected.areas)
+    assert alpha_shape.is_hole.sum() == expected.is_hole.sum() > 0
+    assert alpha_shape.areas.sum() == pytest.approx(expected.areas.sum())
+    for ring in np.split(alpha_shape.vertex_ids, alpha_shape.offsets[1:-1]):
+        assert len(set(ring.tolist())) == len(ring) - 1
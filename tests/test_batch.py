@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from concave_uhull import batch
+from concave_uhull.alpha_shape import (
+    AlphaShapeArrays,
+    get_alpha_shape_polygons,
+)
+from concave_uhull.batch import batch_alpha_shape_polygons
+from concave_uhull.geometry import euclidean_distance
+from concave_uhull.stats import PipelineStats
+
+
+@pytest.fixture
+def groups_of_points():
+    """Groups of random points in squares of different sides, followed by a group
+    of collinear points that cannot be triangulated."""
+    np.random.seed(0)
+    groups = {
+        f"square_{side}": side * np.random.rand(500, 2)
+        for side in (1, 2, 3, 4)
+    }
+    groups["collinear"] = np.column_stack((np.arange(5.0), np.arange(5.0)))
+    return groups
+
+
+@pytest.mark.parametrize(
+    "executor,workers", [("process", 2), ("thread", 2), ("thread", 1)]
+)
+def test_batch_alpha_shape_polygons(groups_of_points, executor, workers):
+    """Test that every group gets the same polygons of the single group function, in
+    input order, and that the degenerate group does not prevent the others."""
+    results = batch_alpha_shape_polygons(
+        groups_of_points,
+        distance=euclidean_distance,
+        workers=workers,
+        executor=executor,
+        chunk_size=1000,
+    )
+
+    # results are in input order
+    assert list(results) == list(groups_of_points)
+
+    # the degenerate group gets the exception raised
+    assert isinstance(results.pop("collinear"), Exception)
+
+    for key, polygons in results.items():
+        expected_polygons = get_alpha_shape_polygons(
+            list(map(tuple, groups_of_points[key].tolist())),
+            distance=euclidean_distance,
+        )
+        assert polygons == expected_polygons
+
+
+def test_batch_alpha_shape_polygons_with_offsets(groups_of_points):
+    """Test groups given by concatenated points and offsets, with results as arrays."""
+    arrays = list(groups_of_points.values())
+    points = np.concatenate(arrays)
+    offsets = np.cumsum([0] + [len(array) for array in arrays])
+
+    results = batch_alpha_shape_polygons(
+        (points, offsets),
+        distance=euclidean_distance,
+        workers=2,
+        chunk_size=1000,
+        as_arrays=True,
+    )
+
+    assert isinstance(results, list) and len(results) == len(arrays)
+    assert all(isinstance(result, AlphaShapeArrays) for result in results[:-1])
+    assert isinstance(results[-1], Exception)
+
+    # offsets must cover all the points
+    with pytest.raises(AssertionError, match="Offsets must start at 0"):
+        batch_alpha_shape_polygons((points, offsets[:-1]))
+
+    # unknown executors are rejected
+    with pytest.raises(AssertionError, match="Unknown executor"):
+        batch_alpha_shape_polygons((points, offsets), executor="unknown")
+
+
+@pytest.mark.parametrize(
+    "executor,workers", [("process", 2), ("thread", 2), ("thread", 1)]
+)
+def test_batch_alpha_shape_polygons_stats(groups_of_points, executor, workers):
+    """Test that the statistics of all groups are merged, whatever the executor."""
+    stats = PipelineStats()
+    results = batch_alpha_shape_polygons(
+        groups_of_points,
+        workers=workers,
+        executor=executor,
+        chunk_size=1000,
+        as_arrays=True,
+        projection="local",
+        stats=stats,
+    )
+
+    assert stats.counters["points"] == sum(
+        len(points) for points in groups_of_points.values()
+    )
+    assert stats.counters["rings"] == sum(
+        len(result.areas)
+        for result in results.values()
+        if isinstance(result, AlphaShapeArrays)
+    )
+    assert {"projection", "triangulation", "areas"} <= set(stats.timings)
+
+
+def test_batch_alpha_shape_polygons_default_chunks(
+    groups_of_points, monkeypatch
+):
+    """Test that, without a chunk size, a modest batch is split among the workers."""
+    chunks = []
+    compute_groups = batch._compute_groups
+
+    def record_chunk(**kwargs):
+        chunks.append(len(kwargs["offsets"]) - 1)
+        return compute_groups(**kwargs)
+
+    monkeypatch.setattr(batch, "_compute_groups", record_chunk)
+    results = batch_alpha_shape_polygons(
+        groups_of_points,
+        distance=euclidean_distance,
+        workers=2,
+        executor="thread",
+    )
+    assert len(chunks) > 1
+    assert sum(chunks) == len(results) == len(groups_of_points)
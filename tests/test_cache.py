@@ -0,0 +1,153 @@
+import functools
+import gc
+import weakref
+
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import (
+    alpha_shape_arrays,
+    get_alpha_shape_polygons,
+)
+from concave_uhull.cache import HullCache, get_fingerprint
+from concave_uhull.geometry import euclidean_distance
+from concave_uhull.stats import PipelineStats
+
+
+@pytest.fixture
+def points():
+    """Array of 2k random points in the unit square."""
+    return np.random.default_rng(0).random((2000, 2))
+
+
+def test_get_fingerprint(points):
+    assert get_fingerprint(points) == get_fingerprint(points.copy())
+    assert get_fingerprint(points) != get_fingerprint(points[::-1])
+    assert get_fingerprint(points) != get_fingerprint(points.reshape(-1, 4))
+
+
+def test_hull_cache_hits_and_misses(points):
+    cache = HullCache()
+    alpha_shape = cache.alpha_shape_arrays(points, distance=euclidean_distance)
+    # alpha shape, simplices and edge lengths, which reuse the simplices
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 3)
+    expected = alpha_shape_arrays(points, distance=euclidean_distance)
+    assert np.array_equal(alpha_shape.vertex_ids, expected.vertex_ids)
+    assert np.allclose(alpha_shape.areas, expected.areas)
+
+    assert (
+        cache.alpha_shape_arrays(points, distance=euclidean_distance)
+        is not None
+    )
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    # another alpha reuses the simplices and the edge lengths
+    cache.alpha_shape_arrays(points, alpha=3.0, distance=euclidean_distance)
+    assert (cache.hits, cache.misses) == (4, 4)
+    with pytest.raises(ValueError):
+        alpha_shape.areas[0] = 0.0
+
+
+def test_hull_cache_eviction(points):
+    cache = HullCache()
+    cache.alpha_shape_arrays(points, distance=euclidean_distance)
+    max_bytes = cache.nbytes
+    cache = HullCache(max_bytes=max_bytes)
+    cache.alpha_shape_arrays(points, distance=euclidean_distance)
+    cache.alpha_shape_arrays(points, alpha=3.0, distance=euclidean_distance)
+    assert cache.nbytes <= max_bytes
+    cache.clear()
+    assert (len(cache), cache.nbytes) == (0, 0)
+
+
+def test_hull_cache_dir(points, tmp_path):
+    coordinates_points = list(map(tuple, points.tolist()))
+    polygons = HullCache(cache_dir=str(tmp_path)).get_alpha_shape_polygons(
+        coordinates_points, distance=euclidean_distance
+    )
+    assert len(list(tmp_path.glob("*.npz"))) == 3
+
+    cache = HullCache(cache_dir=str(tmp_path))
+    assert (
+        cache.get_alpha_shape_polygons(
+            coordinates_points, distance=euclidean_distance
+        )
+        == polygons
+        == get_alpha_shape_polygons(
+            coordinates_points, distance=euclidean_distance
+        )
+    )
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_hull_cache_lambdas(points, tmp_path):
+    cache = HullCache(cache_dir=str(tmp_path))
+    lengths = cache.edge_lengths(points, lambda a, b: 1.0)[2]
+    assert np.all(lengths == 1.0)
+    # another lambda, of the same qualified name, is not a hit
+    lengths = cache.edge_lengths(points, lambda a, b: 2.0)[2]
+    assert np.all(lengths == 2.0)
+    assert (cache.hits, cache.misses) == (1, 3)
+    # only the simplices, which do not depend on the lambdas, are persisted
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+
+def test_hull_cache_unimportable_objects(points, tmp_path):
+    """Test that partial functions, whose representation holds an address, are not
+    persisted, and that unimportable functions are only kept alive by their entries."""
+    cache = HullCache(cache_dir=str(tmp_path))
+    cache.edge_lengths(points, functools.partial(euclidean_distance))
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    distance = lambda a, b: 1.0  # noqa: E731
+    distance_ref = weakref.ref(distance)
+    cache = HullCache()
+    cache.edge_lengths(points, distance)
+    del distance
+    gc.collect()
+    assert distance_ref() is not None
+    cache.clear()
+    gc.collect()
+    assert distance_ref() is None
+
+    # evicted entries release their functions as well
+    cache = HullCache()
+    cache.edge_lengths(points, euclidean_distance)
+    cache = HullCache(max_bytes=cache.nbytes)
+    distance_refs = []
+    for length in (1.0, 2.0, 3.0):
+        distance = lambda a, b, length=length: length  # noqa: E731
+        distance_refs.append(weakref.ref(distance))
+        cache.edge_lengths(points, distance)
+    del distance
+    gc.collect()
+    # the simplices and the edge lengths of the last distance
+    assert (len(cache), len(cache._referents)) == (2, 1)
+    assert [distance_ref() is None for distance_ref in distance_refs] == [
+        True,
+        True,
+        False,
+    ]
+
+
+def test_hull_cache_preprocessing(points):
+    """Test that the preprocessing, projection and simplification are part of the
+    key and give the polygons of the uncached function."""
+    coordinates_points = list(map(tuple, points.tolist()))
+    cache = HullCache()
+    for kwargs in (
+        {},
+        {"resolution": 0.05},
+        {"projection": "local"},
+        {"simplify": 0.5},
+        {"deduplicate": True, "stats": PipelineStats()},
+    ):
+        assert cache.get_alpha_shape_polygons(
+            coordinates_points, **kwargs
+        ) == get_alpha_shape_polygons(coordinates_points, **kwargs)
+    assert (cache.hits, len(cache)) == (1, 7)
+    stats = PipelineStats()
+    cache.get_alpha_shape_polygons(
+        coordinates_points, simplify=1.0, stats=stats
+    )
+    assert "triangulation" in stats.timings
@@ -0,0 +1,294 @@
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import alpha_shape_arrays
+from concave_uhull.cli import main
+from concave_uhull.encoders import to_geojson, to_wkb, to_wkt
+from concave_uhull.geometry import euclidean_distance
+from concave_uhull.tiling import tiled_alpha_shape_arrays
+
+
+@pytest.fixture
+def grouped_points():
+    """Groups of random (lng, lat) points, followed by a group of collinear points
+    that cannot be triangulated."""
+    rng = np.random.default_rng(0)
+    groups = {
+        f"zone_{group}": [-46.6 + 0.01 * group, -23.5]
+        + 0.01 * rng.random((300, 2))
+        for group in range(6)
+    }
+    groups["line"] = np.column_stack((np.arange(5.0), np.arange(5.0)))
+    return groups
+
+
+@pytest.fixture
+def points_csv(tmp_path, grouped_points):
+    """CSV file of the grouped points, in interleaved order."""
+    rows = [
+        (key, lng, lat)
+        for key, points in grouped_points.items()
+        for lng, lat in points.tolist()
+    ]
+    rows = [
+        rows[row] for row in np.random.default_rng(1).permutation(len(rows))
+    ]
+    path = tmp_path / "points.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["zone", "lng", "lat"])
+        writer.writerows(rows)
+    return path
+
+
+def _get_rotated_rings(geometry):
+    """Gets the rings of a GeoJSON MultiPolygon, each starting at its smallest
+    vertex, since the starts depend on the order of the points."""
+    polygons = []
+    for polygon in geometry["coordinates"]:
+        rings = []
+        for ring in polygon:
+            vertices = list(map(tuple, ring[:-1]))
+            start = vertices.index(min(vertices))
+            rings.append(vertices[start:] + vertices[:start])
+        polygons.append(rings)
+    return polygons
+
+
+@pytest.mark.parametrize("partitions", [1, 3])
+def test_cli_geojson(tmp_path, points_csv, grouped_points, partitions, capsys):
+    output = tmp_path / "hulls.geojson"
+    exit_status = main(
+        [
+            str(points_csv),
+            "--group-by",
+            "zone",
+            "--partitions",
+            str(partitions),
+            "--chunk-size",
+            "500",
+            "--workers",
+            "2",
+            "--executor",
+            "thread",
+            "--output",
+            str(output),
+        ]
+    )
+    # the group of collinear points failed
+    assert exit_status == 1
+
+    features = {
+        feature["properties"]["key"]: feature["geometry"]
+        for feature in json.load(open(output))["features"]
+    }
+    assert set(features) == set(grouped_points)
+    assert features.pop("line") is None
+    for key, geometry in features.items():
+        assert _get_rotated_rings(geometry) == _get_rotated_rings(
+            json.loads(to_geojson(alpha_shape_arrays(grouped_points[key])))
+        )
+
+    # progress, failed groups and timings are printed to stderr
+    log = capsys.readouterr().err
+    assert "read 1805 points" in log
+    assert "group line failed: QhullError: " in log
+    assert len([line for line in log.splitlines() if "line" in line]) == 1
+    assert "triangulation" in log
+
+
+def test_cli_npy(tmp_path, grouped_points, capsys):
+    # the groups are in the last column of the array
+    array = np.concatenate(
+        [
+            np.column_stack((points, np.full(len(points), group)))
+            for group, points in enumerate(grouped_points.values())
+        ]
+    )
+    path = tmp_path / "points.npy"
+    np.save(path, array[:, [2, 0, 1]])
+
+    output = tmp_path / "hulls.csv"
+    main(
+        [
+            str(path),
+            "--x",
+            "1",
+            "--y",
+            "2",
+            "--group-by",
+            "0",
+            "--distance",
+            "euclidean",
+            "--format",
+            "wkb",
+            "--workers",
+            "1",
+            "--output",
+            str(output),
+            "--quiet",
+        ]
+    )
+    with open(output, newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["key", "wkb"]
+    assert [row[0] for row in rows[1:]] == [
+        str(float(group)) for group in range(len(grouped_points))
+    ]
+    for row, points in zip(rows[1:-1], grouped_points.values()):
+        alpha_shape = alpha_shape_arrays(points, distance=euclidean_distance)
+        assert bytes.fromhex(row[1]) == to_wkb(alpha_shape)
+    assert rows[-1][1] == ""
+    assert capsys.readouterr().err == ""
+
+
+def test_cli_single_group(points_csv, grouped_points, capsys):
+    main(
+        [
+            str(points_csv),
+            "--format",
+            "wkt",
+            "--projection",
+            "local",
+            "--alpha",
+            "auto",
+            "--quiet",
+        ]
+    )
+    rows = list(csv.reader(capsys.readouterr().out.splitlines()))
+    points = np.concatenate(list(grouped_points.values()))
+    assert len(rows) == 2
+    assert rows[1][0] == ""
+    assert rows[1][1].startswith("MULTIPOLYGON (((")
+
+    # the input is read in a different order, which does not change the shells
+    alpha_shape = alpha_shape_arrays(points, alpha="auto", projection="local")
+    assert rows[1][1].count("((") == to_wkt(alpha_shape).count("((")
+
+
+def test_cli_tiled(tmp_path, grouped_points, capsys):
+    """Test that ungrouped points, spilled to a temporary file, get the hull computed
+    tile by tile."""
+    points = np.concatenate(list(grouped_points.values())[:-1])
+    path = tmp_path / "points.npy"
+    np.save(path, points)
+    main(
+        [
+            str(path),
+            "--distance",
+            "euclidean",
+            "--tile-size",
+            "0.02",
+            "--chunk-size",
+            "500",
+            "--quiet",
+        ]
+    )
+    geometry = json.loads(capsys.readouterr().out)["features"][0]["geometry"]
+    expected = tiled_alpha_shape_arrays(
+        points, tile_size=0.02, distance=euclidean_distance, fence="exact"
+    )
+    assert geometry == json.loads(to_geojson(expected))
+
+    with pytest.raises(SystemExit):
+        main([str(path), "--tile-size", "0.02", "--alpha", "auto"])
+
+
+def test_cli_memory_limit(tmp_path, points_csv, grouped_points, capsys):
+    """Test that the partitions fit the memory limit, and that ungrouped input
+    beyond it requires a tile size."""
+    output = tmp_path / "hulls.geojson"
+    main(
+        [
+            str(points_csv),
+            "--group-by",
+            "zone",
+            "--memory-limit",
+            "0.03",
+            "--workers",
+            "1",
+            "--output",
+            str(output),
+        ]
+    )
+    assert "partition 2:" in capsys.readouterr().err
+    features = json.load(open(output))["features"]
+    assert {feature["properties"]["key"] for feature in features} == set(
+        grouped_points
+    )
+
+    with pytest.raises(SystemExit):
+        main([str(points_csv), "--memory-limit", "0.03"])
+    assert "requires --tile-size" in capsys.readouterr().err
+
+
+def test_cli_parquet(tmp_path, grouped_points):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as parquet
+
+    points = np.concatenate(list(grouped_points.values()))
+    keys = np.repeat(
+        list(grouped_points),
+        [len(points) for points in grouped_points.values()],
+    )
+    path = tmp_path / "points.parquet"
+    parquet.write_table(
+        pyarrow.table(
+            {"lon": points[:, 0], "lat": points[:, 1], "zone": keys}
+        ),
+        path,
+    )
+    output = tmp_path / "hulls.geojson"
+    main(
+        [
+            str(path),
+            "--x",
+            "lon",
+            "--group-by",
+            "zone",
+            "--output",
+            str(output),
+            "--quiet",
+        ]
+    )
+    features = json.load(open(output))["features"]
+    assert [feature["properties"]["key"] for feature in features] == sorted(
+        grouped_points
+    )
+
+
+def test_cli_errors(tmp_path, points_csv, capsys):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "points.txt")])
+    assert "Unknown input format" in capsys.readouterr().err
+
+    # input that cannot be read is a usage error
+    np.save(tmp_path / "points.npy", np.arange(4.0))
+    np.save(tmp_path / "columns.npy", np.zeros((4, 2)))
+    with open(tmp_path / "text.csv", "w") as file:
+        file.write("lng,lat\n1.0,north\n")
+    for argv, message in [
+        ([str(points_csv), "--group-by", "vehicle"], "Unknown column vehicle"),
+        ([str(points_csv), "--x", "lon"], "Unknown column lon"),
+        ([str(tmp_path / "text.csv")], "could not convert"),
+        ([str(tmp_path / "missing.csv")], "No such file"),
+        ([str(tmp_path / "points.npy")], "two dimensions"),
+        ([str(tmp_path / "columns.npy"), "--y", "2"], "out of bounds"),
+    ]:
+        with pytest.raises(SystemExit) as error:
+            main(argv + ["--quiet"])
+        assert error.value.code == 2
+        assert message in capsys.readouterr().err
+
+    for option, value in [
+        ("--distance", "manhattan"),
+        ("--partitions", "0"),
+        ("--chunk-size", "-1"),
+        ("--tile-size", "0"),
+        ("--precision", "16"),
+    ]:
+        with pytest.raises(SystemExit):
+            main([str(points_csv), option, value])
@@ -0,0 +1,252 @@
+import io
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import (
+    AlphaShapeArrays,
+    alpha_shape_arrays,
+    get_alpha_shape_multipolygon,
+)
+from concave_uhull.encoders import (
+    load_npz,
+    save_npz,
+    to_geojson,
+    to_multipolygon_arrays,
+    to_wkb,
+    to_wkt,
+    write_geojson,
+)
+from concave_uhull.geometry import euclidean_distance
+
+
+@pytest.fixture
+def square_with_hole_and_island():
+    """
+    Alpha shape arrays of a square shell with a square hole, and a small square shell,
+    in descending order by area.
+    """
+    rings = [
+        [(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0), (0.0, 0.0)],
+        [(1.0, 1.0), (1.0, 3.0), (3.0, 3.0), (3.0, 1.0), (1.0, 1.0)],
+        [(-1.5, 0.0), (-1.0, 0.0), (-1.0, 0.25), (-1.5, 0.25), (-1.5, 0.0)],
+    ]
+    coordinates = np.concatenate(rings)
+    return AlphaShapeArrays(
+        coordinates=coordinates,
+        vertex_ids=np.arange(len(coordinates)),
+        offsets=np.array([0, 5, 10, 15]),
+        areas=np.array([16.0, 4.0, 0.125]),
+        is_hole=np.array([False, True, False]),
+    )
+
+
+@pytest.fixture
+def empty_alpha_shape():
+    return AlphaShapeArrays(
+        coordinates=np.empty((0, 2)),
+        vertex_ids=np.empty(0, dtype=np.int64),
+        offsets=np.array([0]),
+        areas=np.empty(0),
+        is_hole=np.empty(0, dtype=bool),
+    )
+
+
+def _read_wkb_multipolygon(wkb: bytes):
+    """Reads a WKB multipolygon as a list of polygons, each a list of rings."""
+    position = 0
+
+    def read(fmt):
+        nonlocal position
+        values = struct.unpack_from(fmt, wkb, position)
+        position += struct.calcsize(fmt)
+        return values
+
+    endianness = "<" if read("B")[0] == 1 else ">"
+    geometry_type, num_polygons = read(f"{endianness}II")
+    assert geometry_type == 6
+    polygons = []
+    for _ in range(num_polygons):
+        endianness = "<" if read("B")[0] == 1 else ">"
+        geometry_type, num_rings = read(f"{endianness}II")
+        assert geometry_type == 3
+        polygon = []
+        for _ in range(num_rings):
+            (num_points,) = read(f"{endianness}I")
+            values = read(f"{endianness}{2 * num_points}d")
+            polygon.append(list(zip(values[::2], values[1::2])))
+        polygons.append(polygon)
+    assert position == len(wkb)
+    return polygons
+
+
+def test_to_wkt(square_with_hole_and_island, empty_alpha_shape):
+    assert to_wkt(square_with_hole_and_island) == (
+        "MULTIPOLYGON (((0 0, 4 0, 4 4, 0 4, 0 0), (1 1, 1 3, 3 3, 3 1, 1 1)), "
+        "((-1.5 0, -1 0, -1 0.25, -1.5 0.25, -1.5 0)))"
+    )
+    assert to_wkt(square_with_hole_and_island, precision=0).endswith(
+        "((-2 0, -1 0, -1 0, -2 0, -2 0)))"
+    )
+    assert to_wkt(empty_alpha_shape) == "MULTIPOLYGON EMPTY"
+
+    # numbers are rounded to the precision, without trailing zeros nor negative zeros
+    alpha_shape = square_with_hole_and_island._replace(
+        coordinates=square_with_hole_and_island.coordinates * 1.000001
+        - [46.6, 1e-9]
+    )
+    assert to_wkt(alpha_shape, precision=4).startswith(
+        "MULTIPOLYGON (((-46.6 0, -42.6 0, -42.6 4, -46.6 4, -46.6 0), "
+    )
+
+    with pytest.raises(AssertionError):
+        to_wkt(square_with_hole_and_island, precision=16)
+    with pytest.raises(AssertionError):
+        to_wkt(
+            alpha_shape._replace(coordinates=alpha_shape.coordinates * 1e18)
+        )
+
+
+def test_to_geojson(square_with_hole_and_island, empty_alpha_shape):
+    assert json.loads(to_geojson(square_with_hole_and_island)) == {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [
+                [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+                [[1, 1], [1, 3], [3, 3], [3, 1], [1, 1]],
+            ],
+            [[[-1.5, 0], [-1, 0], [-1, 0.25], [-1.5, 0.25], [-1.5, 0]]],
+        ],
+    }
+    assert json.loads(to_geojson(empty_alpha_shape)) == {
+        "type": "MultiPolygon",
+        "coordinates": [],
+    }
+
+    # the polygons are those of the multipolygon of the alpha shape
+    points = np.random.default_rng(0).uniform(-2.0, 2.0, size=(3000, 2))
+    radii = np.hypot(points[:, 0], points[:, 1])
+    points = points[(1.0 < radii) & (radii < 2.0)]
+    points = np.concatenate((points, 0.3 * points + [10.0, 0.0]))
+    geometry = json.loads(
+        to_geojson(
+            alpha_shape_arrays(points, distance=euclidean_distance),
+            precision=9,
+        )
+    )
+    multipolygon = get_alpha_shape_multipolygon(
+        list(map(tuple, points)), distance=euclidean_distance
+    )
+    assert len(geometry["coordinates"]) == len(multipolygon) > 1
+    assert len(geometry["coordinates"][0]) > 1
+    for polygon, expected_polygon in zip(
+        geometry["coordinates"], multipolygon
+    ):
+        assert len(polygon) == len(expected_polygon)
+        for ring, expected_ring in zip(polygon, expected_polygon):
+            assert np.allclose(ring, expected_ring, atol=1e-9)
+
+
+@pytest.mark.parametrize("byte_order", ["little", "big"])
+def test_to_wkb(square_with_hole_and_island, empty_alpha_shape, byte_order):
+    wkb = to_wkb(square_with_hole_and_island, byte_order=byte_order)
+    assert wkb[0] == (1 if byte_order == "little" else 0)
+    assert _read_wkb_multipolygon(wkb) == [
+        [
+            [(0, 0), (4, 0), (4, 4), (0, 4), (0, 0)],
+            [(1, 1), (1, 3), (3, 3), (3, 1), (1, 1)],
+        ],
+        [[(-1.5, 0), (-1, 0), (-1, 0.25), (-1.5, 0.25), (-1.5, 0)]],
+    ]
+    assert _read_wkb_multipolygon(to_wkb(empty_alpha_shape)) == []
+
+    with pytest.raises(AssertionError):
+        to_wkb(square_with_hole_and_island, byte_order="middle")
+
+
+def test_write_geojson(square_with_hole_and_island, empty_alpha_shape):
+    file = io.StringIO()
+    num_features = write_geojson(
+        file,
+        {
+            "a": square_with_hole_and_island,
+            "b": ValueError("collinear points"),
+            "c": empty_alpha_shape,
+        },
+    )
+    collection = json.loads(file.getvalue())
+    assert num_features == 3
+    assert collection["type"] == "FeatureCollection"
+    assert [feature["properties"] for feature in collection["features"]] == [
+        {"key": "a"},
+        {"key": "b"},
+        {"key": "c"},
+    ]
+    assert collection["features"][0]["geometry"] == json.loads(
+        to_geojson(square_with_hole_and_island)
+    )
+    assert collection["features"][1]["geometry"] is None
+
+    # items of an iterable are keyed by their index
+    file = io.StringIO()
+    assert write_geojson(file, iter([])) == 0
+    assert json.loads(file.getvalue())["features"] == []
+    file = io.StringIO()
+    write_geojson(file, [empty_alpha_shape])
+    assert json.loads(file.getvalue())["features"][0]["properties"] == {
+        "key": 0
+    }
+
+
+def test_save_and_load_npz(square_with_hole_and_island, empty_alpha_shape):
+    alpha_shapes = {
+        "a": square_with_hole_and_island,
+        "b": ValueError("collinear points"),
+        "c": empty_alpha_shape,
+        "d": square_with_hole_and_island,
+    }
+    multipolygons = to_multipolygon_arrays(alpha_shapes.values())
+    assert multipolygons.geometry_offsets.tolist() == [0, 2, 2, 2, 4]
+    assert multipolygons.polygon_offsets.tolist() == [0, 2, 3, 5, 6]
+    assert multipolygons.ring_offsets.tolist() == [0, 5, 10, 15, 20, 25, 30]
+    assert np.array_equal(
+        multipolygons.coordinates[:15],
+        square_with_hole_and_island.coordinates,
+    )
+
+    file = io.BytesIO()
+    save_npz(file, alpha_shapes)
+    file.seek(0)
+    loaded, keys = load_npz(file)
+    assert keys.tolist() == ["a", "b", "c", "d"]
+    for array, expected_array in zip(loaded, multipolygons):
+        assert np.array_equal(array, expected_array)
+
+    file = io.BytesIO()
+    save_npz(file, [square_with_hole_and_island])
+    file.seek(0)
+    loaded, keys = load_npz(file)
+    assert keys is None
+    assert loaded.geometry_offsets.tolist() == [0, 2]
+
+    with pytest.raises(AssertionError):
+        save_npz(io.BytesIO(), {(1, 2): empty_alpha_shape})
+
+
+def test_encoders_of_negative_grid():
+    """Test the encodings of the shell of a grid in the negative quadrant, whose
+    nesting is found without any edge crossing a ray."""
+    points = np.array([(-x, -y) for x in range(5) for y in range(5)], float)
+    alpha_shape = alpha_shape_arrays(points, distance=euclidean_distance)
+    ring = alpha_shape.coordinates.tolist()
+
+    assert json.loads(to_geojson(alpha_shape))["coordinates"] == [[ring]]
+    assert _read_wkb_multipolygon(to_wkb(alpha_shape)) == [
+        [list(map(tuple, ring))]
+    ]
+    assert to_wkt(alpha_shape).startswith("MULTIPOLYGON (((0 -1, 0 0, -1 0,")
+    file = io.StringIO()
+    write_geojson(file, [alpha_shape])
+    assert len(json.loads(file.getvalue())["features"]) == 1
@@ -0,0 +1,105 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import alpha_shape_arrays
+from concave_uhull.fence import (
+    ExactQuantiles,
+    QuantileEstimator,
+    ReservoirQuantiles,
+    SketchQuantiles,
+    get_alpha_fence,
+    get_critical_alphas,
+    get_quantile_estimator,
+)
+from concave_uhull.geometry import euclidean_distance
+
+
+@pytest.fixture
+def lengths():
+    """Array of lognormal values, standing for edge lengths."""
+    return np.random.default_rng(0).lognormal(size=200_000)
+
+
+def _get_rank_errors(lengths, quantiles, q):
+    """Gets the distance between the relative ranks of the quantiles and q."""
+    ranks = np.searchsorted(np.sort(lengths), quantiles) / len(lengths)
+    return np.abs(ranks - np.asarray(q))
+
+
+def test_get_alpha_fence():
+    assert get_alpha_fence(1.0, 3.0, 1.5) == (-2.0, 6.0)
+    assert get_alpha_fence(1.0, 3.0, 0.0) == (1.0, 3.0)
+
+
+def test_get_critical_alphas():
+    lengths = np.array([-2.0, 0.0, 2.0, 4.0, 9.0])
+    assert np.allclose(
+        get_critical_alphas(lengths, 1.0, 3.0), [1.5, 0.5, -0.5, 0.5, 3.0]
+    )
+    assert np.all(np.isinf(get_critical_alphas(lengths, 1.0, 1.0)))
+
+
+@pytest.mark.parametrize(
+    "quantile_estimator, max_rank_error",
+    [
+        (ExactQuantiles(), 1e-4),
+        (SketchQuantiles(k=1024, seed=0), (np.log2(200) + 1) / 1024),
+        (ReservoirQuantiles(size=10_000, seed=0), 0.02),
+    ],
+)
+def test_quantile_estimators_in_batches(
+    lengths, quantile_estimator, max_rank_error
+):
+    for batch in np.array_split(lengths, 7):
+        quantile_estimator.update(batch)
+    q = [0.25, 0.5, 0.75]
+    quantiles = quantile_estimator.quantiles(q)
+    assert quantile_estimator.count == len(lengths)
+    assert np.all(_get_rank_errors(lengths, quantiles, q) < max_rank_error)
+
+
+def test_sketch_quantiles_memory_is_bounded(lengths):
+    sketch = SketchQuantiles(k=256, seed=0)
+    sketch.update(lengths)
+    assert sum(len(level) for level in sketch._levels) < 256 * np.log2(
+        len(lengths)
+    )
+
+
+def test_reservoir_quantiles_with_few_values():
+    reservoir = ReservoirQuantiles(size=100, seed=0)
+    reservoir.update(np.arange(5.0))
+    assert np.allclose(reservoir.quantiles([0.25, 0.75]), [1.0, 3.0])
+
+
+def test_get_quantile_estimator():
+    assert isinstance(get_quantile_estimator(), ExactQuantiles)
+    assert isinstance(get_quantile_estimator("sketch"), SketchQuantiles)
+    reservoir = get_quantile_estimator(partial(ReservoirQuantiles, size=10))
+    assert isinstance(reservoir, ReservoirQuantiles) and reservoir.size == 10
+    with pytest.raises(AssertionError, match="Unknown quantile estimator"):
+        get_quantile_estimator("median")
+
+
+def test_incomplete_quantile_estimator():
+    class CountOnly(QuantileEstimator):
+        def update(self, values):
+            self.count += len(values)
+
+    with pytest.raises(TypeError):
+        CountOnly()
+
+
+@pytest.mark.parametrize("fence", ["sketch", "reservoir"])
+def test_alpha_shape_with_approximate_fence(fence):
+    """On a uniform sample, approximate quartiles give about the same shell of the
+    exact ones."""
+    points = np.random.default_rng(1).random((5000, 2))
+    exact = alpha_shape_arrays(points, distance=euclidean_distance)
+    approximate = alpha_shape_arrays(
+        points, distance=euclidean_distance, fence=fence
+    )
+    assert not approximate.is_hole[0]
+    assert approximate.areas[0] == pytest.approx(exact.areas[0], rel=0.01)
@@ -3,9 +3,15 @@ import pytest
 
 from concave_uhull.geometry import (
     area_of_polygon,
+    areas_of_rings,
+    delaunay_simplices,
     delaunay_triangulation,
     euclidean_distance,
+    get_vectorized_distance,
     haversine_distance,
+    haversine_distance_radians,
+    local_projection,
+    ring_parents,
 )
 
 
@@ -44,6 +50,36 @@ def test_haversine_distance():
     assert np.isclose(result_in_km, expected_result_in_km, atol=1e-4)
 
 
+@pytest.mark.parametrize("distance", [euclidean_distance, haversine_distance])
+def test_distances_broadcast(distance):
+    """
+    Distances accept arrays of shape (..., 2) that broadcast, and agree with the
+    scalar computation, which returns a float.
+    """
+    np.random.seed(0)
+    coords1 = np.random.uniform(-60.0, 60.0, size=(4, 3, 2))
+    coords2 = np.random.uniform(-60.0, 60.0, size=(3, 2))
+    expected = [
+        [distance(tuple(c1), tuple(c2)) for c1, c2 in zip(row, coords2)]
+        for row in coords1.tolist()
+    ]
+    assert isinstance(expected[0][0], float)
+    assert np.allclose(distance(coords1, coords2), expected)
+
+    distances = distance(coords1, coords2, dtype=np.float32)
+    assert distances.dtype == np.float32
+    assert np.allclose(distances, expected, rtol=1e-4)
+
+
+def test_haversine_distance_radians():
+    coords1 = np.array([[-43.2, -22.9], [2.35, 48.86]])
+    coords2 = np.array([[-46.6, -23.5], [-0.13, 51.51]])
+    assert np.allclose(
+        haversine_distance_radians(np.radians(coords1), np.radians(coords2)),
+        haversine_distance(coords1, coords2),
+    )
+
+
 def test_delaunay_triangulation(coordinates_points):
     """
     Test obtaining triangulation of the coordinates of the points using Delaunay's algorithm.
@@ -55,6 +91,71 @@ def test_delaunay_triangulation(coordinates_points):
     assert len(triangulation) == 2
 
 
+@pytest.mark.parametrize("distance", [euclidean_distance, haversine_distance])
+def test_get_vectorized_distance(distance):
+    """
+    The array version of the package distance functions must agree with the
+    scalar version, row by row.
+    """
+    np.random.seed(0)
+    coords1 = np.random.uniform(-60.0, 60.0, size=(10, 2))
+    coords2 = np.random.uniform(-60.0, 60.0, size=(10, 2))
+    expected = [distance(c1, c2) for c1, c2 in zip(coords1, coords2)]
+
+    result = get_vectorized_distance(distance)(coords1, coords2)
+
+    assert result.shape == (10,)
+    assert np.allclose(result, expected)
+
+
+def test_get_vectorized_distance_of_custom_distance():
+    """
+    Custom distance functions are applied row by row, unless they provide their
+    own array version in the `vectorized` attribute.
+    """
+
+    def manhattan_distance(coord1, coord2):
+        return abs(coord1[0] - coord2[0]) + abs(coord1[1] - coord2[1])
+
+    coords1 = np.array([[0.0, 0.0], [1.0, 1.0]])
+    coords2 = np.array([[3.0, 4.0], [1.0, 2.0]])
+    result = get_vectorized_distance(manhattan_distance)(coords1, coords2)
+    assert np.array_equal(result, [7.0, 1.0])
+
+    def manhattan_distance_array(coords1, coords2):
+        return np.abs(coords1 - coords2).sum(axis=1)
+
+    manhattan_distance.vectorized = manhattan_distance_array  # type: ignore
+    assert (
+        get_vectorized_distance(manhattan_distance) is manhattan_distance_array
+    )
+
+    # custom distance functions that broadcast are detected and used as is
+    def chebyshev_distance(coord1, coord2):
+        return np.max(np.abs(np.subtract(coord1, coord2)), axis=-1)
+
+    assert get_vectorized_distance(chebyshev_distance) is chebyshev_distance
+
+
+def test_delaunay_simplices(coordinates_points):
+    """
+    Test that the triangles of the Delaunay triangulation are given by indices of
+    the vertices, in counterclockwise order.
+    """
+    points = np.array(coordinates_points)
+    simplices = delaunay_simplices(coordinates_points)
+
+    # with points of a square it is only possible to obtain two triangles
+    assert simplices.shape == (2, 3)
+
+    # signed areas of the triangles must be positive
+    p1, p2, p3 = (points[simplices[:, j]] for j in range(3))
+    signed_areas = (p2[:, 0] - p1[:, 0]) * (p3[:, 1] - p1[:, 1]) - (
+        p3[:, 0] - p1[:, 0]
+    ) * (p2[:, 1] - p1[:, 1])
+    assert np.all(signed_areas > 0)
+
+
 def test_area_of_polygon(coordinates_points):
     """
     Test area calculation of a simple polygon.
@@ -67,3 +168,109 @@ def test_area_of_polygon(coordinates_points):
 
     # area of a square of sides 1.0
     assert square_area == 1.0
+
+
+def test_area_of_polygon_geodesic():
+    """
+    Test area calculation of a polygon with (lng, lat) coordinates, on the surface
+    of Earth, which shrinks towards the poles.
+    """
+    # define a polygon of 1 degree of side at the equator and near the pole
+    equator_polygon = np.array(
+        [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    )
+    polar_polygon = equator_polygon + [0.0, 80.0]
+
+    # area of the spherical region between meridians and parallels
+    radius_earth = 6371.0
+    expected_equator_area = (
+        radius_earth**2 * np.radians(1.0) * np.sin(np.radians(1.0))
+    )
+
+    assert np.isclose(
+        area_of_polygon(equator_polygon, geodesic=True), expected_equator_area
+    )
+    assert area_of_polygon(polar_polygon, geodesic=True) < (
+        0.2 * expected_equator_area
+    )
+
+    # planar areas do not depend on the latitude
+    assert area_of_polygon(equator_polygon) == area_of_polygon(polar_polygon)
+
+
+def test_areas_of_rings(coordinates_points):
+    """
+    Test area calculation of many rings at once, with signed areas given by the
+    orientation of the rings.
+    """
+    # square of side 1.0, in clockwise order and closed, followed by a square of
+    # side 2.0 in counterclockwise order and open, and by an empty ring
+    square = np.array(coordinates_points + [(0.0, 0.0)])
+    coordinates = np.concatenate((square, 2.0 * square[-2::-1]))
+    offsets = [0, 5, 9, 9]
+
+    areas = areas_of_rings(coordinates, offsets)
+    signed_areas = areas_of_rings(coordinates, offsets, signed=True)
+
+    assert np.array_equal(areas, [1.0, 4.0, 0.0])
+    assert np.array_equal(signed_areas, [-1.0, 4.0, 0.0])
+
+
+@pytest.mark.parametrize("projection", ["local", "azimuthal_equidistant"])
+def test_local_projection(projection):
+    """
+    Euclidean distances between projected points near the center approximate the
+    Haversine distances.
+    """
+    np.random.seed(0)
+    coordinates = np.random.uniform(-0.5, 0.5, size=(100, 2)) + (2.35, 48.86)
+    projected = local_projection(coordinates, projection=projection)
+    assert np.allclose(
+        euclidean_distance(projected[:-1], projected[1:]),
+        haversine_distance(coordinates[:-1], coordinates[1:]),
+        rtol=1e-2,
+    )
+
+    # distances from the center are preserved by the azimuthal equidistant projection
+    center = (2.0, 48.0)
+    projected = local_projection(coordinates, projection, center=center)
+    if projection == "azimuthal_equidistant":
+        assert np.allclose(
+            np.hypot(projected[:, 0], projected[:, 1]),
+            haversine_distance(coordinates, np.array(center)),
+        )
+
+
+@pytest.mark.parametrize("chunk_size", [2**22, 3])
+def test_ring_parents(chunk_size):
+    """
+    Test the nesting tree of a shell with a hole, two islands inside the hole, a hole
+    in one of the islands, and a separate shell, which touches the first shell at a
+    vertex.
+    """
+
+    def square(x, y, side, clockwise=False):
+        ring = np.array([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)])
+        ring = ring[::-1] if clockwise else ring
+        return (x, y) + side * ring
+
+    rings = [
+        square(0, 0, 10),
+        square(1, 1, 8, clockwise=True),
+        square(2, 2, 2),
+        square(5, 5, 2),
+        square(10, 10, 1),
+        square(2.5, 2.5, 0.5, clockwise=True),
+    ]
+    coordinates = np.concatenate(rings)
+    offsets = np.cumsum([0] + [len(ring) for ring in rings])
+
+    parents = ring_parents(coordinates, offsets, chunk_size=chunk_size)
+    assert np.array_equal(parents, [-1, 0, 1, 1, -1, 2])
+
+
+def test_ring_parents_without_crossings():
+    """Test a ring whose test point is at the maximum x of all edges, so that no edge
+    is tested against it."""
+    parents = ring_parents([(1, 0), (1, 1), (0, 1), (0, 0), (1, 0)], [0, 5])
+    assert np.array_equal(parents, [-1])
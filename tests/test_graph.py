@@ -1,10 +1,13 @@
+import numpy as np
 import pytest
 
 from concave_uhull.geometry import euclidean_distance
 from concave_uhull.graph import (
+    CompactGraph,
     Graph,
     dijkstra_algorithm,
     shortest_path_algorithm,
+    trace_boundary_rings,
 )
 
 
@@ -43,6 +46,27 @@ def test_add_edge_method(square_edges):
     assert graph.weight[(0.0, 0.0)][(1.0, 0.0)] == 1.0
 
 
+def test_graph_with_given_edge_weights():
+    """
+    Tests a graph of vertex indices, whose edge weights are given along with the
+    edge list.
+    """
+    # define graph from edges and weights
+    graph = Graph(
+        edge_list=[(0, 1), (1, 2), (2, 0)], edge_weights=[1.0, 2.0, 3.0]
+    )
+
+    # graph must have 3 nodes
+    assert graph.nodes == {0, 1, 2}
+
+    # weight of edge 2 - 0 should be 3.0, in both directions
+    assert graph.weight[2][0] == graph.weight[0][2] == 3.0
+
+    # either the weight function or the edge weights must be given
+    with pytest.raises(AssertionError, match="Either weight_function"):
+        Graph(edge_list=[(0, 1)])
+
+
 @pytest.mark.parametrize(
     "edge_source,edge_target",
     [((0.0, 0.0), (0.0, 1.0)), ((0.0, 1.0), (0.0, 0.0))],
@@ -188,6 +212,50 @@ def test_shortest_path_to_graph_class(square_edges):
     assert path == [(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (1.0, 0.0)]
 
 
+def test_shortest_path_with_astar_algorithm(square_edges):
+    """
+    Tests to get the shortest path between nodes with the A* algorithm, using the
+    Euclidean distance as heuristic.
+    """
+    # create instance of graph class
+    # define graph from edges, with a diagonal shortcut
+    graph = Graph(edge_list=square_edges, weight_function=euclidean_distance)
+    graph.add_edge(
+        edge_source=(0.0, 0.0),
+        edge_target=(1.0, 1.0),
+        edge_weight=euclidean_distance((0.0, 0.0), (1.0, 1.0)),
+    )
+
+    # the diagonal is the shortest path between opposite corners
+    path = shortest_path_algorithm(
+        graph=graph,
+        edge_source=(0.0, 1.0),
+        edge_target=(1.0, 0.0),
+        algorithm="astar",
+        heuristic=euclidean_distance,
+    )
+    assert path[0] == (0.0, 1.0) and path[-1] == (1.0, 0.0)
+    assert len(path) == 3
+
+    # the astar algorithm requires a heuristic
+    with pytest.raises(AssertionError, match="requires a heuristic"):
+        shortest_path_algorithm(
+            graph=graph,
+            edge_source=(0.0, 1.0),
+            edge_target=(1.0, 0.0),
+            algorithm="astar",
+        )
+
+    # unknown algorithms are rejected
+    with pytest.raises(AssertionError, match="Unknown algorithm"):
+        shortest_path_algorithm(
+            graph=graph,
+            edge_source=(0.0, 1.0),
+            edge_target=(1.0, 0.0),
+            algorithm="unknown",
+        )
+
+
 def test_shortest_path_to_graph_class_assertion_error(square_edges):
     """
     Function throws assertion error in two cases: when there is no path in
@@ -223,3 +291,115 @@ def test_shortest_path_to_graph_class_assertion_error(square_edges):
             edge_source=(11.0, 11.0),
             edge_target=edge_target,
         )
+
+
+def test_trace_boundary_rings_with_pinch_vertex():
+    """
+    Tests tracing the boundary of two counterclockwise triangles touching at a
+    pinch vertex, which must give one ring per triangle.
+    """
+    coordinates = np.array(
+        [[0.0, 0.0], [-1.0, 1.0], [-1.0, -1.0], [1.0, -1.0], [1.0, 1.0]]
+    )
+    half_edges = np.array([[0, 1], [1, 2], [2, 0], [0, 3], [3, 4], [4, 0]])
+
+    rings = trace_boundary_rings(
+        half_edges=half_edges, coordinates=coordinates
+    )
+
+    assert rings == [[0, 1, 2, 0], [0, 3, 4, 0]]
+
+
+def test_trace_boundary_rings_with_pinched_hole():
+    """
+    Tests tracing the boundary of a square shell touching its clockwise triangular
+    hole at a pinch vertex, which must give the shell and the hole apart.
+    """
+    coordinates = np.array(
+        [
+            [0.0, 0.0],
+            [4.0, 0.0],
+            [4.0, 4.0],
+            [0.0, 4.0],
+            [1.0, 3.0],
+            [3.0, 3.0],
+        ]
+    )
+    half_edges = np.array(
+        [[0, 1], [1, 2], [2, 3], [3, 0], [2, 5], [5, 4], [4, 2]]
+    )
+
+    rings = trace_boundary_rings(
+        half_edges=half_edges, coordinates=coordinates
+    )
+
+    assert set(map(frozenset, rings)) == {
+        frozenset([0, 1, 2, 3]),
+        frozenset([2, 4, 5]),
+    }
+    assert all(len(ring) == len(set(ring)) + 1 for ring in rings)
+
+
+def test_trace_boundary_rings_assertion_error():
+    """
+    Function throws assertion error when the half-edges do not form closed rings.
+    """
+    coordinates = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0]])
+    with pytest.raises(AssertionError, match="do not form closed rings"):
+        trace_boundary_rings(
+            half_edges=np.array([[0, 1], [1, 2]]), coordinates=coordinates
+        )
+
+
+def test_compact_graph():
+    """
+    Tests the CompactGraph class, whose nodes are vertex indices, with the same
+    operations of the Graph class.
+    """
+    # define the graph of a square, whose vertices are indices
+    graph = CompactGraph(
+        edge_list=[(0, 1), (1, 2), (2, 3), (3, 0)],
+        edge_weights=[1.0, 1.0, 1.0, 1.0],
+    )
+    assert len(graph) == 4
+    assert graph.nodes == {0, 1, 2, 3}
+    assert graph[0] == {1, 3}
+    assert graph.weight[0] == {1: 1.0, 3: 1.0}
+
+    # removing an edge marks it in both directions
+    graph.remove_edge(edge_source=1, edge_target=0)
+    assert graph[0] == {3} and graph[1] == {2}
+    with pytest.raises(AssertionError, match="No edge"):
+        graph.remove_edge(edge_source=0, edge_target=1)
+
+    # shortest path goes around the square
+    path = shortest_path_algorithm(graph=graph, edge_source=0, edge_target=1)
+    assert path == [0, 3, 2, 1]
+
+    # adding edges, including to new nodes
+    graph.add_edge(edge_source=0, edge_target=2, edge_weight=0.5)
+    graph.add_edge(edge_source=2, edge_target=4, edge_weight=0.5)
+    assert graph.nodes == {0, 1, 2, 3, 4}
+    assert graph[2] == {0, 1, 3, 4}
+    assert graph.weight[4] == {2: 0.5}
+    with pytest.raises(AssertionError, match="already exists"):
+        graph.add_edge(edge_source=2, edge_target=0, edge_weight=0.5)
+    path = shortest_path_algorithm(graph=graph, edge_source=0, edge_target=1)
+    assert path == [0, 2, 1]
+
+    # nodes out of the graph have no neighbors
+    assert graph[10] == set()
+
+
+def test_compact_graph_with_weight_function():
+    """
+    Tests a CompactGraph whose edge weights are computed with a weight function.
+    """
+    graph = CompactGraph(
+        edge_list=[(0, 1), (1, 2)], weight_function=lambda u, v: u + v
+    )
+    assert graph.weight[1] == {0: 1.0, 2: 3.0}
+
+    # repeated edges are not allowed
+    with pytest.raises(AssertionError, match="repeated edges"):
+        CompactGraph(edge_list=[(0, 1), (1, 0)], edge_weights=[1.0, 1.0])
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import (
+    _get_boundary_edges,
+    _get_sorted_alpha_shape_arrays,
+    alpha_shape_arrays,
+)
+from concave_uhull.geometry import euclidean_distance
+from concave_uhull.graph import trace_boundary_rings
+from concave_uhull.incremental import IncrementalAlphaShape
+
+
+@pytest.fixture
+def circular_crown_points():
+    """Array of points of a circular crown, formed from the difference between
+    concentric circles in (2.0, 2.0) of radius 1.0 and 1.8."""
+    np.random.seed(0)
+    points = 4 * np.random.rand(10000, 2)
+    radius = np.hypot(points[:, 0] - 2.0, points[:, 1] - 2.0)
+    return points[(1.0 < radius) & (radius < 1.8)]
+
+
+def _get_ring_edges(alpha_shape):
+    """Gets the set of directed edges of each ring of the alpha shape arrays."""
+    vertex_ids, offsets = alpha_shape.vertex_ids, alpha_shape.offsets
+    return {
+        frozenset(zip(ring[:-1].tolist(), ring[1:].tolist()))
+        for ring in np.split(vertex_ids, offsets[1:-1])
+    }
+
+
+def test_incremental_alpha_shape_with_full_recomputations(
+    circular_crown_points,
+):
+    """With no tolerance, the fence is recomputed at every update, so the alpha shape
+    must be the same of all points at once."""
+    alpha_shape = IncrementalAlphaShape(
+        circular_crown_points[:2000],
+        distance=euclidean_distance,
+        tolerance=0.0,
+    )
+    for start in range(2000, len(circular_crown_points), 1000):
+        alpha_shape.update(circular_crown_points[start : start + 1000])
+
+    expected = alpha_shape_arrays(
+        circular_crown_points, distance=euclidean_distance
+    )
+    assert alpha_shape.full_recomputations > 1
+    assert _get_ring_edges(alpha_shape.arrays()) == _get_ring_edges(expected)
+    assert np.allclose(alpha_shape.arrays().areas, expected.areas)
+
+    # polygons are the coordinates of the rings
+    polygons = alpha_shape.polygons()
+    assert len(polygons) == len(expected.areas)
+    assert set(polygons[0]) == set(
+        map(tuple, expected.coordinates[: expected.offsets[1]].tolist())
+    )
+
+
+def test_incremental_alpha_shape_with_kept_fence(circular_crown_points):
+    """With infinite tolerance, the fence is kept and only the rings touching the
+    changed alpha triangles are traced again, which must give the same rings of
+    tracing all boundary edges of the current alpha triangles."""
+    alpha_shape = IncrementalAlphaShape(
+        circular_crown_points[:3000],
+        alpha=0.3,
+        distance=euclidean_distance,
+        tolerance=np.inf,
+    )
+    for start in range(3000, len(circular_crown_points), 500):
+        alpha_shape.update(circular_crown_points[start : start + 500])
+
+        # rings of all boundary edges of the current alpha triangles
+        boundary_edges = _get_boundary_edges(
+            alpha_shape._simplices[alpha_shape._is_alpha],
+            len(alpha_shape.points),
+        )
+        rings = trace_boundary_rings(boundary_edges, alpha_shape.points)
+        expected = _get_sorted_alpha_shape_arrays(
+            points=alpha_shape.points,
+            vertex_ids=np.array(
+                [vertice for ring in rings for vertice in ring], dtype=np.int64
+            ),
+            offsets=np.cumsum([0] + [len(ring) for ring in rings]),
+        )
+
+        assert _get_ring_edges(alpha_shape.arrays()) == _get_ring_edges(
+            expected
+        )
+
+    assert alpha_shape.full_recomputations == 1
+    assert len(alpha_shape.points) == len(circular_crown_points)
+
+
+def test_incremental_alpha_shape_running_state(circular_crown_points):
+    """Test that the edges and the sorted edge lengths updated from the created and
+    destroyed triangles are those of the current triangulation."""
+    alpha_shape = IncrementalAlphaShape(
+        circular_crown_points[:2000],
+        distance=euclidean_distance,
+        tolerance=np.inf,
+    )
+    for start in range(2000, len(circular_crown_points), 1000):
+        alpha_shape.update(circular_crown_points[start : start + 1000])
+
+    simplices, lengths = alpha_shape._simplices, alpha_shape._lengths
+    assert np.array_equal(
+        alpha_shape._triangle_keys, np.sort(alpha_shape._triangle_keys)
+    )
+    assert np.allclose(
+        lengths,
+        np.hypot(
+            *(
+                alpha_shape.points[simplices[:, [1, 2, 0]]]
+                - alpha_shape.points[simplices]
+            ).transpose(2, 0, 1)
+        ),
+    )
+    sides = simplices[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+    _, first_occurrence = np.unique(
+        np.sort(sides, axis=1), axis=0, return_index=True
+    )
+    assert np.array_equal(
+        alpha_shape._sorted_lengths,
+        np.sort(lengths.ravel()[first_occurrence]),
+    )
+
+    # boundary edges are those of nonzero orientation, in its direction
+    edges = alpha_shape._edge_keys.view(np.int64).reshape(-1, 2)
+    orientations = alpha_shape._edge_orientations
+    boundary_edges = np.where(
+        (orientations > 0)[:, None], edges, edges[:, ::-1]
+    )[orientations != 0]
+    expected_boundary_edges = _get_boundary_edges(
+        simplices[alpha_shape._is_alpha], len(alpha_shape.points)
+    )
+    assert set(map(tuple, boundary_edges.tolist())) == set(
+        map(tuple, expected_boundary_edges.tolist())
+    )
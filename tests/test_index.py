@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import AlphaTriangulation
+from concave_uhull.geometry import euclidean_distance
+from concave_uhull.index import HullIndex
+
+
+@pytest.fixture
+def crown_points():
+    """Array of random points of a circular crown of radii 1 and 2."""
+    points = np.random.default_rng(0).uniform(-2.0, 2.0, size=(5000, 2))
+    radii = np.hypot(points[:, 0], points[:, 1])
+    return points[(1.0 < radii) & (radii < 2.0)]
+
+
+def test_hull_index_contains(crown_points):
+    index = HullIndex.from_points(crown_points, distance=euclidean_distance)
+    queries = np.random.default_rng(1).uniform(-3.0, 3.0, size=(2000, 2))
+    contains = index.contains(queries)
+
+    # a point is inside if it is inside an alpha triangle
+    triangles = crown_points[index.triangulation.alpha_triangles()]
+    a, b, c = (triangles[:, j][None] for j in range(3))
+    q = queries[:, None]
+
+    def cross(u, v, w):
+        return (v[..., 0] - u[..., 0]) * (w[..., 1] - u[..., 1]) - (
+            w[..., 0] - u[..., 0]
+        ) * (v[..., 1] - u[..., 1])
+
+    expected = np.any(
+        (cross(a, b, q) > 0) & (cross(b, c, q) > 0) & (cross(c, a, q) > 0),
+        axis=1,
+    )
+    assert np.array_equal(contains, expected)
+
+    # the hole and the outside of the crown are not in the alpha shape
+    assert list(index.contains([(0.0, 0.0), (1.5, 0.0), (2.5, 2.5)])) == [
+        False,
+        True,
+        False,
+    ]
+
+
+def test_hull_index_reuses_triangulation(crown_points):
+    triangulation = AlphaTriangulation(
+        crown_points, distance=euclidean_distance
+    )
+    index = HullIndex(triangulation, alpha=3.0)
+    assert index.triangulation.delaunay is triangulation.delaunay
+    assert np.count_nonzero(index._is_alpha_triangle) == len(
+        triangulation.alpha_triangles(3.0)
+    )
+    assert index.contains(np.empty((0, 2))).shape == (0,)
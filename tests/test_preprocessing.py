@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import (
+    alpha_shape_arrays,
+    get_alpha_shape_polygons,
+)
+from concave_uhull.geometry import euclidean_distance
+from concave_uhull.preprocessing import thin_points
+
+
+@pytest.fixture
+def duplicate_points():
+    """Array of points of a 50 x 50 grid of spacing 0.1, each point repeated four
+    times, in random order."""
+    x, y = np.meshgrid(np.arange(50) * 0.1, np.arange(50) * 0.1)
+    points = np.repeat(np.column_stack((x.ravel(), y.ravel())), 4, axis=0)
+    return np.random.default_rng(0).permutation(points)
+
+
+def test_thin_points_deduplicates(duplicate_points):
+    points, indices = thin_points(duplicate_points)
+    assert len(points) == 2500
+    assert np.array_equal(points, duplicate_points[indices])
+    assert np.all(np.diff(indices) > 0)
+    assert len(np.unique(points, axis=0)) == 2500
+
+
+def test_thin_points_with_resolution(duplicate_points):
+    points, indices = thin_points(duplicate_points, resolution=0.25)
+    cells = np.floor(points / 0.25)
+    assert len(points) == len(np.unique(cells, axis=0)) == 400
+    assert np.array_equal(points, duplicate_points[indices])
+
+
+def test_thin_points_drop_interior(duplicate_points):
+    points, _ = thin_points(
+        duplicate_points, resolution=0.25, drop_interior=True
+    )
+    # the points of the outer ring of cells are all kept
+    cells = np.floor(points / 0.25)
+    is_outer_cell = np.any((cells == 0) | (cells == 19), axis=1)
+    assert np.count_nonzero(is_outer_cell) == 2500 - 45**2
+    assert np.count_nonzero(~is_outer_cell) == 18**2
+    with pytest.raises(AssertionError, match="requires a resolution"):
+        thin_points(duplicate_points, drop_interior=True)
+
+
+def test_alpha_shape_with_deduplication(duplicate_points):
+    alpha_shape = alpha_shape_arrays(
+        duplicate_points, distance=euclidean_distance, deduplicate=True
+    )
+    expected = alpha_shape_arrays(
+        np.unique(duplicate_points, axis=0), distance=euclidean_distance
+    )
+    assert np.allclose(alpha_shape.areas, expected.areas)
+    assert np.array_equal(
+        duplicate_points[alpha_shape.vertex_ids], alpha_shape.coordinates
+    )
+    coordinates_points = list(map(tuple, duplicate_points.tolist()))
+    polygons = get_alpha_shape_polygons(
+        coordinates_points, distance=euclidean_distance, resolution=0.25
+    )
+    assert polygons[0][0] in coordinates_points
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import alpha_shape_arrays
+from concave_uhull.geometry import euclidean_distance, ring_parents
+from concave_uhull.simplify import _get_crossing_rings, simplify_rings
+
+
+def square(x, y, side, clockwise=False):
+    """Closed square ring of the given lower left corner and side."""
+    ring = np.array(
+        [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0)]
+    )
+    ring = ring[::-1] if clockwise else ring
+    return (x, y) + side * ring
+
+
+@pytest.fixture
+def wavy_shell_with_hole():
+    """A wavy circle of 10k vertices, with a small square hole close to it."""
+    angles = np.linspace(0.0, 2.0 * np.pi, 10_001)
+    shell = np.column_stack(
+        (np.cos(angles), np.sin(angles) + 0.001 * np.sin(200 * angles))
+    )
+    shell[-1] = shell[0]
+    hole = square(0.9, -0.02, 0.05, clockwise=True)
+    return np.concatenate((shell, hole)), np.array([0, 10_001, 10_006])
+
+
+def test_get_crossing_rings():
+    bowtie = np.array([(0, 0), (1, 1), (1, 0), (0, 1), (0, 0)], dtype=float)
+    coordinates = np.concatenate(
+        (bowtie, square(5, 5, 1), square(5.5, 5.5, 1), square(7, 5, 1))
+    )
+    offsets = np.arange(0, 21, 5)
+    assert list(_get_crossing_rings(coordinates, offsets)) == [
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.parametrize("tolerance", [1e-3, 1e-2, 0.1, 1.0])
+def test_simplify_rings(wavy_shell_with_hole, tolerance):
+    coordinates, offsets = wavy_shell_with_hole
+    positions, simplified_offsets = simplify_rings(
+        coordinates, offsets, tolerance, distance=euclidean_distance
+    )
+    simplified = coordinates[positions]
+
+    # rings keep their first and last vertices and at least three vertices
+    assert np.array_equal(simplified_offsets[[0, -1]], [0, len(positions)])
+    assert np.array_equal(
+        simplified[simplified_offsets[:-1]],
+        simplified[simplified_offsets[1:] - 1],
+    )
+    assert np.all(np.diff(simplified_offsets) >= 4)
+    assert np.diff(simplified_offsets)[0] < 300
+
+    # rings are valid and the hole stays inside the shell
+    assert not np.any(_get_crossing_rings(simplified, simplified_offsets))
+    assert list(ring_parents(simplified, simplified_offsets)) == [-1, 0]
+
+    # removed vertices are within the tolerance, when nothing was invalid
+    if tolerance <= 1e-2:
+        kept = simplified[: simplified_offsets[1]]
+        shell = coordinates[: offsets[1]]
+        segments = (
+            np.searchsorted(
+                positions[: simplified_offsets[1]],
+                np.arange(offsets[1]),
+                side="right",
+            )
+            - 1
+        )
+        segments = np.minimum(segments, len(kept) - 2)
+        a, b = kept[segments], kept[segments + 1]
+        ab, ap = b - a, shell - a
+        heights = np.abs(ab[:, 0] * ap[:, 1] - ab[:, 1] * ap[:, 0]) / np.hypot(
+            ab[:, 0], ab[:, 1]
+        )
+        assert np.all(heights <= tolerance + 1e-12)
+
+
+def test_simplify_rings_of_negative_grid():
+    """Test the shell of a grid in the negative quadrant, whose nesting is found
+    without any edge crossing a ray, which is simplified to its corners and its
+    first vertex."""
+    points = np.array([(-x, -y) for x in range(5) for y in range(5)], float)
+    alpha_shape = alpha_shape_arrays(
+        points, distance=euclidean_distance, simplify=0.1
+    )
+    assert alpha_shape.offsets.tolist() == [0, 6]
+    assert alpha_shape.areas == pytest.approx([16.0])
@@ -0,0 +1,101 @@
+import json
+
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import (
+    alpha_shape_arrays,
+    get_alpha_shape_polygons,
+)
+from concave_uhull.geometry import euclidean_distance
+from concave_uhull.graph import Graph, shortest_path_algorithm
+from concave_uhull.stats import _NULL_STATS, PipelineStats
+
+
+@pytest.fixture
+def points():
+    """Array of 2k random points in the unit square."""
+    return np.random.default_rng(0).random((2000, 2))
+
+
+@pytest.mark.parametrize("method", ["boundary_tracing", "shortest_path"])
+def test_alpha_shape_stats(points, method):
+    stats = PipelineStats()
+    polygons = get_alpha_shape_polygons(
+        list(map(tuple, points)),
+        distance=euclidean_distance,
+        method=method,
+        stats=stats,
+    )
+
+    # statistics do not change the result
+    assert polygons == get_alpha_shape_polygons(
+        list(map(tuple, points)), distance=euclidean_distance, method=method
+    )
+
+    counters = stats.counters
+    assert counters["points"] == len(points)
+    assert counters["rings"] == len(polygons)
+    assert counters["simplices"] >= counters["alpha_triangles"] > 0
+    assert counters["boundary_edges"] == sum(map(len, polygons)) - len(
+        polygons
+    )
+    stages = ["triangulation", "edge_lengths", "fence", "alpha_triangles"]
+    if method == "shortest_path":
+        stages += ["boundary_edges", "graph", "shortest_paths", "areas"]
+        assert len(stats.search_pops) == len(polygons)
+        assert stats.max_heap_size > 0
+    else:
+        stages += ["boundary_edges", "boundary_tracing", "areas"]
+        assert not stats.search_pops
+    assert list(stats.timings) == stages
+    assert stats.total_time == pytest.approx(sum(stats.timings.values()))
+    assert json.loads(json.dumps(stats.as_dict()))["counters"] == counters
+
+
+def test_alpha_shape_stats_accumulate(points):
+    calls = []
+    stats = PipelineStats(callback=lambda name, elapsed: calls.append(name))
+    alpha_shape_arrays(points, alpha="auto", resolution=0.01, stats=stats)
+    alpha_shape_arrays(points, projection="local", stats=stats)
+
+    assert stats.counters["points"] == 2 * len(points) - (
+        stats.counters["thinned_points"]
+    )
+    assert {"thinning", "alpha_selection", "projection"} <= set(stats.timings)
+    assert calls.count("boundary_edges") == 2
+
+
+def test_null_stats_record_nothing():
+    graph = Graph(edge_list=[(0, 1), (1, 2), (2, 0)], edge_weights=[1, 1, 3])
+    shortest_path_algorithm(graph, 0, 2)
+    with _NULL_STATS.stage("stage"):
+        _NULL_STATS.count("counter", 1)
+    assert _NULL_STATS.as_dict() == PipelineStats().as_dict()
+
+
+def test_merge_stats(points):
+    worker_stats = PipelineStats()
+    alpha_shape_arrays(
+        points,
+        distance=euclidean_distance,
+        method="shortest_path",
+        stats=worker_stats,
+    )
+    calls = []
+    stats = PipelineStats(callback=lambda name, elapsed: calls.append(name))
+    stats.merge(worker_stats)
+    stats.merge(worker_stats)
+
+    assert stats.counters == {
+        name: 2 * value for name, value in worker_stats.counters.items()
+    }
+    assert stats.timings == pytest.approx(
+        {name: 2 * value for name, value in worker_stats.timings.items()}
+    )
+    assert stats.search_pops == 2 * worker_stats.search_pops
+    assert stats.max_heap_size == worker_stats.max_heap_size
+    assert calls == 2 * list(worker_stats.timings)
+
+    _NULL_STATS.merge(worker_stats)
+    assert _NULL_STATS.as_dict() == PipelineStats().as_dict()
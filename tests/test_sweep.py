@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import (
+    _get_alpha_triangulation,
+    alpha_shape_arrays,
+)
+from concave_uhull.geometry import euclidean_distance, haversine_distance
+from concave_uhull.sweep import AlphaFiltration, alpha_shape_sweep
+
+
+@pytest.fixture
+def circular_crown_points():
+    """Array of points of a circular crown, formed from the difference between
+    concentric circles in (2.0, 2.0) of radius 1.0 and 1.8."""
+    np.random.seed(0)
+    points = 4 * np.random.rand(5000, 2)
+    radius = np.hypot(points[:, 0] - 2.0, points[:, 1] - 2.0)
+    return points[(1.0 < radius) & (radius < 1.8)]
+
+
+@pytest.mark.parametrize("alpha", [0.0, 0.5, 1.5, 3.0])
+def test_alpha_filtration_triangles(circular_crown_points, alpha):
+    filtration = AlphaFiltration(
+        circular_crown_points, distance=euclidean_distance
+    )
+    assert np.all(np.diff(filtration.critical_alphas) >= 0)
+    triangles = filtration.alpha_triangles(alpha)
+    expected_triangles = _get_alpha_triangulation(
+        circular_crown_points, alpha=alpha, distance=euclidean_distance
+    )
+    assert {tuple(sorted(t)) for t in triangles.tolist()} == {
+        tuple(sorted(t)) for t in expected_triangles.tolist()
+    }
+
+
+@pytest.mark.parametrize("distance", [euclidean_distance, haversine_distance])
+def test_alpha_shape_sweep(circular_crown_points, distance):
+    alphas = [0.5, 1.0, 1.5]
+    sweep = alpha_shape_sweep(
+        circular_crown_points, alphas=alphas, distance=distance, as_arrays=True
+    )
+    assert list(sweep) == alphas
+    for alpha in alphas:
+        expected = alpha_shape_arrays(
+            circular_crown_points, alpha=alpha, distance=distance
+        )
+        assert np.allclose(sweep[alpha].areas, expected.areas)
+        assert np.array_equal(sweep[alpha].is_hole, expected.is_hole)
+
+
+def test_alpha_shape_sweep_polygons(circular_crown_points):
+    sweep = alpha_shape_sweep(
+        circular_crown_points, alphas=[1.5], distance=euclidean_distance
+    )
+    polygons = sweep[1.5]
+    assert all(polygon[0] == polygon[-1] for polygon in polygons)
+    assert isinstance(polygons[0][0], tuple)
+
+
+@pytest.mark.parametrize(
+    "criterion, target", [("single_shell", None), ("max_rings", 3)]
+)
+def test_select_alpha(circular_crown_points, criterion, target):
+    filtration = AlphaFiltration(
+        circular_crown_points, distance=euclidean_distance
+    )
+    alpha = filtration.select_alpha(criterion=criterion, target=target)
+    alpha_shape = filtration.arrays(alpha)
+    if criterion == "single_shell":
+        assert np.count_nonzero(~alpha_shape.is_hole) == 1
+        assert len(np.unique(filtration.alpha_triangles(alpha))) == len(
+            circular_crown_points
+        )
+    else:
+        assert len(alpha_shape.areas) <= target
+
+    # a slightly more concave hull does not meet the criterion
+    smaller_alpha = 0.99 * alpha
+    if criterion == "single_shell":
+        assert np.count_nonzero(
+            ~filtration.arrays(smaller_alpha).is_hole
+        ) > 1 or len(
+            np.unique(filtration.alpha_triangles(smaller_alpha))
+        ) < len(
+            circular_crown_points
+        )
+    else:
+        assert len(filtration.arrays(smaller_alpha).areas) > target
+
+
+def test_select_alpha_area_ratio(circular_crown_points):
+    filtration = AlphaFiltration(
+        circular_crown_points, distance=euclidean_distance
+    )
+    convex_hull_area = filtration.arrays(np.inf).areas[0]
+    alpha = filtration.select_alpha(criterion="area_ratio", target=0.6)
+    alpha_shape = filtration.arrays(alpha)
+    area = np.sum(np.where(alpha_shape.is_hole, -1, 1) * alpha_shape.areas)
+    assert area >= 0.6 * convex_hull_area
+    with pytest.raises(AssertionError, match="requires a target"):
+        filtration.select_alpha(criterion="area_ratio")
+    with pytest.raises(AssertionError, match="Unknown criterion"):
+        filtration.select_alpha(criterion="convex")
+
+
+def test_alpha_shape_arrays_with_auto_alpha(circular_crown_points):
+    alpha_shape = alpha_shape_arrays(
+        circular_crown_points, alpha="auto", distance=euclidean_distance
+    )
+    assert np.count_nonzero(~alpha_shape.is_hole) == 1
+    assert alpha_shape.is_hole[1]
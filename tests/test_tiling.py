@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from concave_uhull.alpha_shape import alpha_shape_arrays
+from concave_uhull.geometry import euclidean_distance
+from concave_uhull.tiling import tiled_alpha_shape_arrays
+
+
+@pytest.fixture
+def circular_crown_points():
+    """Array of points of a circular crown, formed from the difference between
+    concentric circles in (2.0, 2.0) of radius 1.0 and 1.8."""
+    np.random.seed(0)
+    points = 4 * np.random.rand(20000, 2)
+    radius = np.hypot(points[:, 0] - 2.0, points[:, 1] - 2.0)
+    return points[(1.0 < radius) & (radius < 1.8)]
+
+
+def _get_rings(alpha_shape):
+    """Gets the set of vertex indices of each ring of the alpha shape arrays."""
+    return {
+        frozenset(ring.tolist())
+        for ring in np.split(alpha_shape.vertex_ids, alpha_shape.offsets[1:-1])
+    }
+
+
+@pytest.mark.parametrize("fence", ["exact", "sketch"])
+def test_tiled_alpha_shape_arrays(circular_crown_points, tmp_path, fence):
+    path = str(tmp_path / "points.npy")
+    np.save(path, circular_crown_points)
+    alpha_shape = tiled_alpha_shape_arrays(
+        path,
+        tile_size=0.8,
+        margin=0.2,
+        distance=euclidean_distance,
+        fence=fence,
+        chunk_size=3000,
+        temp_dir=str(tmp_path),
+    )
+    expected = alpha_shape_arrays(
+        circular_crown_points, distance=euclidean_distance
+    )
+
+    # the shell and the inner hole are stitched across tiles
+    assert not alpha_shape.is_hole[0] and alpha_shape.is_hole[1]
+    assert alpha_shape.areas[:2] == pytest.approx(expected.areas[:2], rel=1e-3)
+    assert np.array_equal(
+        circular_crown_points[alpha_shape.vertex_ids], alpha_shape.coordinates
+    )
+    rings, expected_rings = _get_rings(alpha_shape), _get_rings(expected)
+    assert len(rings & expected_rings) > 0.9 * len(expected_rings)
+    assert list(tmp_path.iterdir()) == [tmp_path / "points.npy"]
+
+
+def test_tiled_alpha_shape_arrays_margin(circular_crown_points):
+    with pytest.raises(AssertionError, match="margin must be smaller"):
+        tiled_alpha_shape_arrays(
+            circular_crown_points, tile_size=0.5, margin=0.5
+        )
+
+
+def test_tiled_alpha_shape_arrays_of_quantized_points(tmp_path):
+    """Test that points in the same position, which the triangulation of each tile
+    may represent by a different one, are stitched across tiles."""
+    points = np.round(np.random.default_rng(0).uniform(0, 10, (20000, 2)), 1)
+    alpha_shape = tiled_alpha_shape_arrays(
+        points,
+        tile_size=2.5,
+        margin=0.6,
+        distance=euclidean_distance,
+        fence="exact",
+        temp_dir=str(tmp_path),
+    )
+    expected = alpha_shape_arrays(points, distance=euclidean_distance)
+
+    assert alpha_shape.areas[0] == pytest.approx(expected.areas[0])
+    assert np.array_equal(
+        points[alpha_shape.vertex_ids], alpha_shape.coordinates
+    )
+
+    # the vertices are identified by the smallest index of their position
+    _, first_indices = np.unique(points, axis=0, return_index=True)
+    assert np.isin(alpha_shape.vertex_ids, first_indices).all()